@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Benchmark SpreadsheetManager read paths on a Business-style sheet (A..Z, all rows).
+
+Usage:
+    python benchmark_sheet_readers.py                      # synthetic 20,000-row workbook
+    python benchmark_sheet_readers.py data/raw/Business.xlsm LD-Business
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from openpyxl import Workbook
+from src.tool_experiments.spreadsheet_manager import SpreadsheetManager
+
+
+def create_synthetic_workbook(file_path: Path, rows: int = 20000) -> Path:
+    """Write a workbook with one 26-column sheet of mixed strings, numbers and dates.
+
+    A regular (not write-only) workbook is used so strings land in the shared
+    strings table, as they do in workbooks saved by Excel.
+    """
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "LD-Business"
+    sheet.append([f"Header {index}" for index in range(26)])
+    start = datetime(2015, 1, 1)
+    for row in range(rows):
+        values = [f"Client {row % 500}", row, row * 1.5, f"Category {row % 12}"]
+        values += [f"Text {row % 97}" for _ in range(12)]
+        values += [start + timedelta(days=row % 3650)]
+        values += [row % 7 == 0, f"Product {row % 9}", f"Description {row}"]
+        values += [None] * 5
+        values += [row * 10.0]
+        sheet.append(values)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    workbook.save(file_path)
+    return file_path
+
+
+def time_read(file_path: Path, sheet_name: str, **manager_options) -> tuple[float, int]:
+    """Open the workbook and read A..Z with auto-detected rows, returning (seconds, rows)."""
+    start = time.perf_counter()
+    with SpreadsheetManager(file_path, **manager_options) as manager:
+        df = manager.readRangeAsDataFrame(sheet_name=sheet_name, start_row=1, end_row=None,
+                                          start_col="A", end_col="Z")
+    return time.perf_counter() - start, len(df)
+
+
+def main():
+    """Time each read path and report the speedup over the default edit-mode load."""
+    if len(sys.argv) >= 3:
+        file_path, sheet_name = Path(sys.argv[1]), sys.argv[2]
+    else:
+        file_path, sheet_name = create_synthetic_workbook(Path("data/output/benchmark_business.xlsx")), "LD-Business"
+    
+    print(f"Benchmarking {file_path} [{sheet_name}]")
+    baseline, rows = time_read(file_path, sheet_name)
+    print(f"  openpyxl edit mode : {baseline:7.2f}s ({rows} rows)")
+    for label, options in [("openpyxl read mode", {"mode": "read"}),
+                           ("fast engine       ", {"mode": "read", "engine": "fast"})]:
+        seconds, rows = time_read(file_path, sheet_name, **options)
+        print(f"  {label} : {seconds:7.2f}s ({rows} rows) - {baseline / seconds:4.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Benchmark Teams message extraction on synthetic 10,000-message threads.
+
+Compares the single-pass tokenizer with the original regex extraction on a
+thread of short messages and on one whose messages have long unpunctuated
+bodies, where the original lookahead rescans the rest of the body at every
+line break.
+
+Usage:
+    python benchmark_teams_tokenizer.py            # 10,000 messages
+    python benchmark_teams_tokenizer.py 50000
+"""
+
+import re
+import sys
+import timeit
+from src.tool_experiments.chat_thread_loader import EmailChatThreadLoader
+
+
+LEGACY_MESSAGE_PATTERN = r'([A-Za-z\s\-]+)\s+\d+\s+days?\s+ago\s*\n(.*?)(?=\n[A-Za-z\s\-]+\s+\d+\s+days?\s+ago|\nGo to Teams|$)'
+
+
+def create_synthetic_thread(messages: int = 10000, plain_lines: int = 0) -> str:
+    """Build the plain-text body of a forwarded Teams thread.
+
+    Bodies mix single lines, letter-only closing lines (which the name run
+    absorbs), blank lines and inline image references. plain_lines appends
+    that many unpunctuated lines to the start of every body.
+    """
+    participants = ["Jane Citizen", "John Smith-Jones", "Mary Ann Lee", "Bob"]
+    bodies = [
+        "Signed the renewal today, great work everyone! [cid:image001.png@01DB]",
+        "Congratulations\n\n\n\nteam",
+        "Pricing came in 3 days ago at $1.2m.\nWell done all",
+        "Thanks - see the deck [cid:image002.png@01DB]\n\nLet's catch up Friday.",
+    ]
+    plain = "please find the notes from the client meeting below\n" * plain_lines
+    lines = [f"{participants[index % 4]}    {index % 30 + 1} days ago\n{plain}{bodies[index % 4]}" for index in range(messages)]
+    return "Forwarded from Microsoft Teams:\n\n" + "\n".join(lines) + "\nGo to Teams\n"
+
+
+def legacy_extract_messages(loader: EmailChatThreadLoader, content: str) -> list:
+    """The original regex extraction, kept for comparison."""
+    messages = []
+    for participant, message_content in re.findall(LEGACY_MESSAGE_PATTERN, content, re.DOTALL):
+        timestamp_match = re.search(r'(\d+\s+days?\s+ago)', message_content)
+        messages.append({
+            'participant': participant.strip(),
+            'timestamp': timestamp_match.group(1) if timestamp_match else "unknown",
+            'content': loader._clean_message_content(message_content),
+            'attachments': re.findall(r'\[cid:([^\]]+)\]', message_content)
+        })
+    return messages
+
+
+def time_extract(extract, content: str, repeat: int = 3) -> tuple[float, list]:
+    """Return (best of repeat timings in seconds, messages) for one extraction."""
+    messages = []
+    seconds = min(timeit.repeat(lambda: messages.append(extract(content)), number=1, repeat=repeat))
+    return seconds, messages[-1]
+
+
+def main():
+    """Time both extractions on each thread shape and check they produce identical messages."""
+    messages = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    loader = EmailChatThreadLoader()
+    
+    for label, plain_lines in [("short messages", 0), ("12-line plain bodies", 12)]:
+        content = create_synthetic_thread(messages, plain_lines)
+        print(f"Benchmarking {messages} messages, {label} ({len(content):,} characters)")
+        baseline, expected = time_extract(lambda text: legacy_extract_messages(loader, text), content)
+        seconds, extracted = time_extract(loader._extract_messages, content)
+        print(f"  legacy regex      : {baseline:7.3f}s ({len(expected)} messages)")
+        print(f"  single-pass       : {seconds:7.3f}s ({len(extracted)} messages) - {baseline / seconds:5.1f}x")
+        print(f"  identical output  : {extracted == expected}")
+
+
+if __name__ == "__main__":
+    main()
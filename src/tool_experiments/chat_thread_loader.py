@@ -1,9 +1,27 @@
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-import email
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator
+from email import policy
+from email.parser import BytesParser, BytesHeaderParser
+import itertools
+import os
 import re
 from .chat_thread import ChatThread, Message
+from .thread_cache import ThreadCache
+
+
+# Relative timestamp that ends a Teams message header ("Jane Citizen    2 days ago")
+_DAYS_AGO_PATTERN = r'\d+\s+days?\s+ago'
+# Header timestamps follow whitespace; "tail" looks ahead to the line break that must follow a header
+_HEADER_ANCHOR_RE = re.compile(rf'\s(?P<timestamp>{_DAYS_AGO_PATTERN})(?:(?=(?P<tail>\s*\n))|)')
+# Characters allowed in a participant name, which may run back over several lines
+_NAME_RUN_RE = re.compile(r'[A-Za-z\s\-]*')
+_TIMESTAMP_RE = re.compile(rf'({_DAYS_AGO_PATTERN})')
+_ATTACHMENT_REF_RE = re.compile(r'\[cid:([^\]]+)\]')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+_TEAMS_FOOTER = '\nGo to Teams'
 
 
 class ChatThreadLoader(ABC):
@@ -33,9 +51,32 @@ class EmailChatThreadLoader(ChatThreadLoader):
     It does NOT handle any markdown generation or formatting. That is the responsibility of ChatThread.
     """
     
+    # Bump whenever parsing changes what a loaded ChatThread contains, so cached threads are re-parsed
+    PARSER_VERSION = 2
+    
+    # Headers returned by load_headers and stored as ChatThread metadata, by header name
+    HEADER_FIELDS = {
+        'subject': 'Subject',
+        'date': 'Date',
+        'thread_topic': 'Thread-Topic',
+        'message_id': 'Message-ID',
+    }
+    
+    def __init__(self, cache: Optional[ThreadCache] = None):
+        """Initialize the loader.
+        
+        Args:
+            cache: Optional on-disk cache of parsed threads, keyed by file contents and PARSER_VERSION
+        """
+        self.cache = cache
+    
     def load_thread(self, source_path: Path) -> ChatThread:
         """Load a ChatThread from an .eml file.
         
+        With a cache, a file whose contents were already parsed by this parser
+        version is served from the cache without parsing it again, and contents
+        it rejected raise the recorded ValueError without being parsed again.
+        
         Args:
             source_path: Path to the .eml file
             
@@ -48,7 +89,40 @@ class EmailChatThreadLoader(ChatThreadLoader):
         """
         if not source_path.exists():
             raise FileNotFoundError(f"Email file not found: {source_path}")
+        if self.cache is None:
+            return self._parse_thread(source_path)
+        
+        thread = self.cache.get(source_path, self.PARSER_VERSION)
+        if thread is None:
+            try:
+                thread = self._parse_thread(source_path)
+            except ValueError as error:
+                self.cache.put_failure(source_path, self.PARSER_VERSION, str(error))
+                raise
+            self.cache.put(source_path, self.PARSER_VERSION, thread)
+        return thread
+    
+    def load_headers(self, source_path: Path) -> Dict[str, str]:
+        """Read only the metadata headers of an .eml file, for fast listing and filtering.
+        
+        Reading stops at the end of the header block, so bodies and attachments are
+        neither read nor parsed. Values equal the metadata of the loaded thread.
         
+        Args:
+            source_path: Path to the .eml file
+            
+        Returns:
+            Dictionary with 'subject', 'date', 'thread_topic' and 'message_id' ('' when absent)
+            
+        Raises:
+            FileNotFoundError: If .eml file doesn't exist
+        """
+        if not source_path.exists():
+            raise FileNotFoundError(f"Email file not found: {source_path}")
+        return self._parse_email_file(source_path, headers_only=True)['headers']
+    
+    def _parse_thread(self, source_path: Path) -> ChatThread:
+        """Parse an .eml file into a ChatThread, raising ValueError if it has no Teams content."""
         # Parse the email
         email_data = self._parse_email_file(source_path)
         
@@ -84,11 +158,17 @@ class EmailChatThreadLoader(ChatThreadLoader):
         
         return thread
     
-    def load_threadList(self, file_pattern: str) -> List[ChatThread]:
+    def load_threadList(self, file_pattern: str, max_workers: Optional[int] = 1) -> List[ChatThread]:
         """Load multiple ChatThread objects from files matching the pattern.
         
+        Files are loaded in sorted path order. With more than one worker, the files
+        are parsed in a pool of worker processes, handed out in chunks; the result
+        and the warnings for unloadable files come out in the same order either way.
+        
         Args:
             file_pattern: Glob pattern for .eml files (e.g., 'data/raw/*.eml')
+            max_workers: Number of worker processes used to parse the files
+                (default: 1, parse in this process; None for one per CPU)
             
         Returns:
             List of ChatThread objects, one for each matching .eml file
@@ -96,45 +176,102 @@ class EmailChatThreadLoader(ChatThreadLoader):
         Raises:
             ValueError: If no files match the pattern or if files cannot be parsed
         """
-        pattern_path = Path(file_pattern)
-        eml_files = list(pattern_path.parent.glob(pattern_path.name))
+        eml_files = self._find_eml_files(file_pattern)
+        workers = min(len(eml_files), max_workers or os.cpu_count() or 1)
+        if workers <= 1:
+            results = [self._try_load_thread(eml_file) for eml_file in eml_files]
+        else:
+            chunk_size = max(1, len(eml_files) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_load_thread_in_worker, itertools.repeat(self), eml_files,
+                                            chunksize=chunk_size))
+        
+        return list(self._skip_failed_loads(eml_files, results))
+    
+    def iter_threads(self, file_pattern: str, prefetch: int = 0) -> Iterator[ChatThread]:
+        """Lazily load ChatThread objects from files matching the pattern, one at a time.
         
+        Threads come in the same order as load_threadList, with the same warnings for
+        unloadable files, but each file is only parsed when the iteration reaches it.
+        A thread pool may parse up to prefetch files ahead, so at most prefetch + 1
+        threads are held at once.
+        
+        Args:
+            file_pattern: Glob pattern for .eml files (e.g., 'data/raw/*.eml')
+            prefetch: Number of files parsed ahead in background threads (default: 0)
+            
+        Returns:
+            Iterator over ChatThread objects, one for each loadable .eml file
+            
+        Raises:
+            ValueError: If no files match the pattern (raised immediately, not when iterated)
+        """
+        eml_files = self._find_eml_files(file_pattern)
+        if prefetch <= 0:
+            results = map(self._try_load_thread, eml_files)
+        else:
+            results = self._prefetch_loads(eml_files, prefetch)
+        return self._skip_failed_loads(eml_files, results)
+    
+    def _find_eml_files(self, file_pattern: str) -> List[Path]:
+        """Return the files matching a glob pattern in sorted order, raising ValueError if there are none."""
+        pattern_path = Path(file_pattern)
+        eml_files = sorted(pattern_path.parent.glob(pattern_path.name))
         if not eml_files:
             raise ValueError(f"No .eml files found matching pattern: {file_pattern}")
-        
-        threads = []
-        for eml_file in sorted(eml_files):
-            try:
-                thread = self.load_thread(eml_file)
-                threads.append(thread)
-            except Exception as e:
-                print(f"Warning: Could not load {eml_file}: {e}")
+        return eml_files
+    
+    def _prefetch_loads(self, eml_files: List[Path], prefetch: int) -> Iterator[Tuple[Optional[ChatThread], Optional[str]]]:
+        """Yield each file's load result in order while a thread pool keeps up to prefetch later files loading."""
+        with ThreadPoolExecutor(max_workers=prefetch) as executor:
+            pending: deque = deque()
+            for eml_file in eml_files:
+                pending.append(executor.submit(self._try_load_thread, eml_file))
+                if len(pending) > prefetch:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+    
+    def _skip_failed_loads(self, eml_files: Iterable[Path],
+                           results: Iterable[Tuple[Optional[ChatThread], Optional[str]]]) -> Iterator[ChatThread]:
+        """Yield the loaded threads, printing a warning for each file that could not be loaded."""
+        for eml_file, (thread, error) in zip(eml_files, results):
+            if error is not None:
+                print(f"Warning: Could not load {eml_file}: {error}")
                 continue
-        
-        return threads
+            yield thread
     
-    def _parse_email_file(self, file_path: Path) -> Dict[str, Any]:
+    def _try_load_thread(self, source_path: Path) -> Tuple[Optional[ChatThread], Optional[str]]:
+        """Load one thread, returning (thread, None) or (None, error message) instead of raising."""
+        try:
+            return self.load_thread(source_path), None
+        except Exception as e:
+            return None, str(e)
+    
+    def _parse_email_file(self, file_path: Path, headers_only: bool = False) -> Dict[str, Any]:
         """Parse .eml file and extract basic structure.
         
+        The file is parsed from bytes, with line endings normalized to '\n' as
+        reading it in text mode would.
+        
         Args:
             file_path: Path to the .eml file
+            headers_only: Read and parse only the header block, returning just the headers
             
         Returns:
             Dictionary containing email headers and content
         """
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+        with open(file_path, 'rb') as f:
+            if headers_only:
+                msg = BytesHeaderParser(policy=policy.compat32).parsebytes(self._normalize_newlines(self._read_header_block(f)))
+                return {'headers': self._extract_headers(msg)}
             content = f.read()
         
         # Parse with email module
-        msg = email.message_from_string(content)
+        msg = BytesParser(policy=policy.compat32).parsebytes(self._normalize_newlines(content))
         
         # Extract headers
-        headers = {
-            'subject': msg.get('Subject', ''),
-            'date': msg.get('Date', ''),
-            'thread_topic': msg.get('Thread-Topic', ''),
-            'message_id': msg.get('Message-ID', ''),
-        }
+        headers = self._extract_headers(msg)
         
         # Extract text content
         plain_content = self._extract_text_content(msg)
@@ -148,6 +285,36 @@ class EmailChatThreadLoader(ChatThreadLoader):
             'attachments': attachments
         }
     
+    def _read_header_block(self, f) -> bytes:
+        """Read lines from a binary file up to and including the blank line that ends the headers."""
+        lines = []
+        for line in f:
+            lines.append(line)
+            if not line.strip(b'\r\n'):
+                break
+        return b''.join(lines)
+    
+    def _normalize_newlines(self, content: bytes) -> bytes:
+        """Convert '\r\n' and lone '\r' line endings to '\n'."""
+        return content.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    
+    def _extract_headers(self, msg) -> Dict[str, str]:
+        """Extract the metadata headers as text, decoding raw header bytes as UTF-8.
+        
+        Args:
+            msg: Parsed email message
+            
+        Returns:
+            Dictionary mapping metadata field to header value ('' when absent)
+        """
+        raw_values: Dict[str, str] = {}
+        for name, value in msg.raw_items():
+            raw_values.setdefault(name.lower(), value)
+        return {
+            field: raw_values.get(name.lower(), '').encode('utf-8', 'surrogateescape').decode('utf-8', 'ignore')
+            for field, name in self.HEADER_FIELDS.items()
+        }
+    
     def _extract_text_content(self, msg) -> str:
         """Extract plain text content from email message.
         
@@ -194,15 +361,38 @@ class EmailChatThreadLoader(ChatThreadLoader):
             if part.get_filename():
                 attachment_id = part.get('Content-ID', '').strip('<>')
                 if attachment_id:
-                    payload = part.get_payload(decode=True)
                     attachments[attachment_id] = {
                         'filename': part.get_filename(),
                         'content_type': part.get_content_type(),
-                        'size': len(payload) if payload else 0
+                        'size': self._estimate_decoded_size(part)
                     }
         
         return attachments
     
+    def _estimate_decoded_size(self, part) -> int:
+        """Estimate the decoded size of a part's payload from its encoded text, without decoding it.
+        
+        Base64 sizes are exact for well-formed payloads; quoted-printable sizes count
+        each '=XX' escape as one byte and soft line breaks as none.
+        
+        Args:
+            part: Non-multipart email message part
+            
+        Returns:
+            Payload size in bytes
+        """
+        if part.is_multipart():
+            return 0
+        payload = part.get_payload()
+        encoding = str(part.get('Content-Transfer-Encoding', '')).strip().lower()
+        if encoding == 'base64':
+            encoded_length = sum(len(line) for line in payload.split())
+            padding = len(payload.rstrip()) - len(payload.rstrip().rstrip('='))
+            return max(encoded_length * 3 // 4 - padding, 0)
+        if encoding == 'quoted-printable':
+            return len(payload) - 2 * payload.count('=')
+        return len(payload.encode('utf-8', 'surrogateescape'))
+    
     def _extract_teams_content(self, email_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Extract Teams-specific content from email data.
         
@@ -239,6 +429,10 @@ class EmailChatThreadLoader(ChatThreadLoader):
     def _extract_messages(self, content: str) -> List[Dict[str, Any]]:
         """Extract individual messages from Teams content.
         
+        Messages are "Name    X days ago" header lines followed by the message
+        text, which runs up to the next header, the "Go to Teams" footer or the
+        end of the content.
+        
         Args:
             content: Plain text content from email
             
@@ -246,37 +440,85 @@ class EmailChatThreadLoader(ChatThreadLoader):
             List of message dictionaries
         """
         messages = []
-        
-        # Pattern to match Teams message format
-        # Matches: "Name    X days ago\nMessage content"
-        # Updated to handle names with hyphens and other characters
-        message_pattern = r'([A-Za-z\s\-]+)\s+\d+\s+days?\s+ago\s*\n(.*?)(?=\n[A-Za-z\s\-]+\s+\d+\s+days?\s+ago|\nGo to Teams|$)'
-        
-        matches = re.findall(message_pattern, content, re.DOTALL)
-        
-        for participant, message_content in matches:
-            # Clean participant name
-            participant = participant.strip()
-            
-            # Clean message content
-            content_clean = self._clean_message_content(message_content)
-            
-            # Extract attachment references
-            attachments = self._extract_attachment_references(message_content)
-            
-            # Extract timestamp
-            timestamp_match = re.search(r'(\d+\s+days?\s+ago)', message_content)
-            timestamp = timestamp_match.group(1) if timestamp_match else "unknown"
-            
+        for participant, start, end in self._iter_message_spans(content):
+            message_content = content[start:end]
+            # Substring checks skip the regex scans for the many messages without timestamps or images
+            timestamp_match = _TIMESTAMP_RE.search(message_content) if 'ago' in message_content else None
             messages.append({
                 'participant': participant,
-                'timestamp': timestamp,
-                'content': content_clean,
-                'attachments': attachments
+                'timestamp': timestamp_match.group(1) if timestamp_match else "unknown",
+                'content': self._clean_message_content(message_content),
+                'attachments': _ATTACHMENT_REF_RE.findall(message_content) if '[cid:' in message_content else []
             })
-        
         return messages
     
+    def _iter_message_spans(self, content: str) -> Iterator[Tuple[str, int, int]]:
+        """Tokenize Teams content in one forward pass over its header timestamps.
+        
+        A header is a run of letters, spaces and hyphens (the participant name),
+        a relative timestamp and a line break. Because the name run may span
+        lines, letter-only lines directly above a header are read as part of
+        the name, and the previous message ends at the first line break of
+        that run.
+        
+        Args:
+            content: Plain text content from email
+            
+        Yields:
+            Tuples of (participant, start, end) with the message text at content[start:end]
+        """
+        anchors = self._header_anchors(content)
+        # Without re.MULTILINE, "$" also matches just before a final line break
+        text_end = len(content) - 1 if content.endswith('\n') else len(content)
+        footer = content.find(_TEAMS_FOOTER)
+        index, name_start = self._next_header(anchors, 0, 0)
+        while index is not None:
+            header_start, _, start = anchors[index]
+            if footer != -1 and footer < start:
+                footer = content.find(_TEAMS_FOOTER, start)
+            limit = max(text_end, start) if footer == -1 else min(footer, max(text_end, start))
+            end, next_index = self._message_end(content, anchors, index + 1, start, limit)
+            yield content[name_start:header_start].strip(), start, end
+            if next_index is not None and anchors[next_index][2] != -1:
+                # The line break ending this message starts the next header's name run
+                index, name_start = next_index, end
+            else:
+                index, name_start = self._next_header(anchors, index + 1 if next_index is None else next_index, end)
+    
+    def _header_anchors(self, content: str) -> List[Tuple[int, int, int]]:
+        """Locate header timestamps as (timestamp start, name run start, message start or -1 without a line break)."""
+        # Name runs are matched backwards from each timestamp through the reversed text
+        reversed_content = content[::-1]
+        length = len(content)
+        return [
+            (match.start('timestamp'),
+             length - _NAME_RUN_RE.match(reversed_content, length - match.start('timestamp')).end(),
+             match.end('tail'))
+            for match in _HEADER_ANCHOR_RE.finditer(content)
+        ]
+    
+    def _next_header(self, anchors: List[Tuple[int, int, int]], index: int,
+                     position: int) -> Tuple[Optional[int], Optional[int]]:
+        """Find the first complete header after position, returning (anchor index, name start)."""
+        for i in range(index, len(anchors)):
+            header_start, run_start, start = anchors[i]
+            name_start = max(run_start, position)
+            if start != -1 and header_start - name_start >= 2:
+                return i, name_start
+        return None, None
+    
+    def _message_end(self, content: str, anchors: List[Tuple[int, int, int]], index: int, start: int,
+                     limit: int) -> Tuple[int, Optional[int]]:
+        """Return (end, index of the anchor whose name run ends the message or None) for the text at start."""
+        for i in range(index, len(anchors)):
+            header_start, run_start, _ = anchors[i]
+            if run_start >= limit:
+                break
+            line_break = content.find('\n', max(run_start, start), header_start - 2)
+            if line_break != -1:
+                return (line_break, i) if line_break < limit else (limit, None)
+        return limit, None
+    
     def _clean_message_content(self, content: str) -> str:
         """Clean and normalize message content.
         
@@ -287,15 +529,14 @@ class EmailChatThreadLoader(ChatThreadLoader):
             Cleaned message content
         """
         # Remove attachment references
-        content = re.sub(r'\[cid:[^\]]+\]', '', content)
+        if '[cid:' in content:
+            content = _ATTACHMENT_REF_RE.sub('', content)
         
         # Remove extra whitespace
-        content = re.sub(r'\n\s*\n', '\n\n', content)
+        content = _BLANK_LINES_RE.sub('\n\n', content)
         
         # Strip leading/trailing whitespace
-        content = content.strip()
-        
-        return content
+        return content.strip()
     
     def _extract_attachment_references(self, content: str) -> List[str]:
         """Extract attachment references from content.
@@ -306,7 +547,8 @@ class EmailChatThreadLoader(ChatThreadLoader):
         Returns:
             List of attachment IDs
         """
-        # Pattern to match [cid:attachment_id] references
-        pattern = r'\[cid:([^\]]+)\]'
-        matches = re.findall(pattern, content)
-        return matches 
\ No newline at end of file
+        return _ATTACHMENT_REF_RE.findall(content)
+
+def _load_thread_in_worker(loader: EmailChatThreadLoader, source_path: Path) -> Tuple[Optional[ChatThread], Optional[str]]:
+    """Parse one .eml file in a worker process."""
+    return loader._try_load_thread(source_path)
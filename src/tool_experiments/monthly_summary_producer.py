@@ -1,10 +1,13 @@
 from pathlib import Path
 from datetime import date, datetime
 from calendar import monthrange
-from typing import Optional
+from typing import Optional, Iterable, Iterator
 from .sales_analyzer import SalesAnalyzer
 from .sales_lead_analyzer import SalesLeadAnalyzer
+from .chat_thread import ChatThread
 from .chat_thread_loader import EmailChatThreadLoader
+from .sheet_cache import SheetCache
+from .thread_cache import ThreadCache
 
 
 class MonthlySummaryProducer:
@@ -15,6 +18,10 @@ class MonthlySummaryProducer:
         self.processed_dir = Path("data/processed")
         self.raw_dir = Path("data/raw")
         
+        # Parsed sheets are cached on disk so repeated runs skip unchanged workbooks
+        self.sheet_cache = SheetCache(self.processed_dir / ".cache")
+        self.thread_cache = ThreadCache(self.processed_dir / ".cache" / "threads")
+        
         # Ensure processed directory exists
         self.processed_dir.mkdir(parents=True, exist_ok=True)
     
@@ -58,9 +65,8 @@ class MonthlySummaryProducer:
             
             # Generate chat threads summary
             print("Generating chat threads summary...")
-            chat_content = self._generate_chat_threads_summary(start_date, end_date)
             chat_filename = f"Chat Threads {self._get_month_name(month)} {year}.md"
-            self._write_file(chat_filename, chat_content)
+            self._write_file_parts(chat_filename, self._iter_chat_threads_summary(start_date, end_date))
             print(f"✓ Chat threads summary written to {chat_filename}")
             
             print(f"\n✓ All summaries generated successfully for {self._get_month_name(month)} {year}")
@@ -109,9 +115,12 @@ class MonthlySummaryProducer:
         Returns:
             Markdown formatted string with sales summary
         """
-        analyzer = SalesAnalyzer()
+        analyzer = SalesAnalyzer(cache=self.sheet_cache)
         
         try:
+            # Load both business sheets in a single pass before summarizing
+            analyzer.loadAllSalesData()
+            
             # Generate industry and government summaries
             industry_markdown = analyzer.getClientSummaryMarkdown("industry", start_date, end_date)
             government_markdown = analyzer.getClientSummaryMarkdown("government", start_date, end_date)
@@ -134,7 +143,7 @@ class MonthlySummaryProducer:
             leads_file = self.raw_dir / "Leads v2.xlsx"
         else:
             leads_file = self.raw_dir / "Leads.xlsx"
-        analyzer = SalesLeadAnalyzer(leads_file, sheet_name="All deals")
+        analyzer = SalesLeadAnalyzer(leads_file, sheet_name="All deals", cache=self.sheet_cache)
         try:
             analyzer.load_data()
             return analyzer.getSummaryMarkdown()
@@ -151,24 +160,42 @@ class MonthlySummaryProducer:
         Returns:
             Markdown formatted string with chat threads summary
         """
-        loader = EmailChatThreadLoader()
+        return "".join(self._iter_chat_threads_summary(start_date, end_date))
+    
+    def _iter_chat_threads_summary(self, start_date: date, end_date: date) -> Iterator[str]:
+        """Return the chat threads summary markdown as an iterator of parts, loading one thread at a time.
         
-        # Load all threads (no date filtering)
-        threads = loader.load_threadList(str(self.raw_dir / "*.eml"))
+        Args:
+            start_date: Start date for filtering (not used - included for compatibility)
+            end_date: End date for filtering (not used - included for compatibility)
+            
+        Returns:
+            Iterator over consecutive parts of the markdown formatted chat threads summary
+            
+        Raises:
+            ValueError: If there are no .eml files in the raw directory
+        """
+        loader = EmailChatThreadLoader(cache=self.thread_cache)
         
-        if not threads:
-            return f"# Chat Threads Summary\n\n**Period:** {start_date} to {end_date}\n\nNo chat threads found."
+        # Load all threads (no date filtering), parsing the next file while one is rendered
+        threads = loader.iter_threads(str(self.raw_dir / "*.eml"), prefetch=1)
+        return self._render_chat_threads_summary(threads, start_date, end_date)
+    
+    def _render_chat_threads_summary(self, threads: Iterator[ChatThread], start_date: date, end_date: date) -> Iterator[str]:
+        """Yield the chat threads summary markdown for threads as they are loaded."""
+        first_thread = next(threads, None)
         
-        # Generate markdown for all threads
-        markdown_lines = [f"# Chat Threads Summary\n\n**Period:** {start_date} to {end_date}\n\n"]
-        markdown_lines.append("**Note:** All available chat threads are included (date filtering disabled due to unreliable email dates)\n\n")
+        if first_thread is None:
+            yield f"# Chat Threads Summary\n\n**Period:** {start_date} to {end_date}\n\nNo chat threads found."
+            return
         
-        for i, thread in enumerate(threads):
-            if i > 0:
-                markdown_lines.append("\n\n---\n\n")
-            markdown_lines.append(thread.to_markdown())
+        yield f"# Chat Threads Summary\n\n**Period:** {start_date} to {end_date}\n\n"
+        yield "**Note:** All available chat threads are included (date filtering disabled due to unreliable email dates)\n\n"
+        yield first_thread.to_markdown()
         
-        return "".join(markdown_lines)
+        for thread in threads:
+            yield "\n\n---\n\n"
+            yield thread.to_markdown()
     
     def _parse_thread_date(self, date_str: str) -> Optional[date]:
         """Parse thread date string to date object.
@@ -195,6 +222,18 @@ class MonthlySummaryProducer:
             filename: Name of the file to write
             content: Content to write to the file
             
+        Raises:
+            RuntimeError: If file cannot be written
+        """
+        self._write_file_parts(filename, [content])
+    
+    def _write_file_parts(self, filename: str, parts: Iterable[str]) -> None:
+        """Write content to file in data/processed directory as it is produced, part by part.
+        
+        Args:
+            filename: Name of the file to write
+            parts: Consecutive parts of the content to write
+            
         Raises:
             RuntimeError: If file cannot be written
         """
@@ -202,6 +241,7 @@ class MonthlySummaryProducer:
         
         try:
             with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+                for part in parts:
+                    f.write(part)
         except Exception as e:
             raise RuntimeError(f"Failed to write file {filename}: {e}") 
\ No newline at end of file
@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from typing import Any
+
+
+@dataclass(frozen=True)
+class ColumnRange:
+    """Row filter keeping rows whose value in one column lies between inclusive bounds.
+
+    Passed as the row_filter of SpreadsheetManager reads, where it is checked as
+    rows are streamed so rows outside the window are dropped before the rest of
+    their cells are converted. Either bound may be None for an open interval.
+    Date bounds compare as midnight of that day. Empty cells never match, and
+    values that cannot be compared with the bounds (such as dates typed as text)
+    match only with keep_incomparable, for callers that check the kept rows again
+    after converting them.
+
+    Attributes:
+        position: 0-based position of the filtered column within the range read
+        lower: Smallest value kept (inclusive), or None
+        upper: Largest value kept (inclusive), or None
+        keep_incomparable: Keep rows whose value cannot be compared with the bounds
+    """
+
+    position: int
+    lower: Any = None
+    upper: Any = None
+    keep_incomparable: bool = False
+
+    def __post_init__(self):
+        """Promote plain date bounds to datetimes so they compare with datetime cells."""
+        object.__setattr__(self, 'lower', self._as_datetime(self.lower))
+        object.__setattr__(self, 'upper', self._as_datetime(self.upper))
+
+    def matches(self, value: Any) -> bool:
+        """Return True if the cell value lies within the bounds."""
+        if value is None:
+            return False
+        try:
+            return (self.lower is None or value >= self.lower) and (self.upper is None or value <= self.upper)
+        except TypeError:
+            return self.keep_incomparable
+
+    @staticmethod
+    def _as_datetime(bound: Any) -> Any:
+        """Return a date bound as a datetime at midnight, leaving other bounds unchanged."""
+        if isinstance(bound, date) and not isinstance(bound, datetime):
+            return datetime.combine(bound, time.min)
+        return bound
@@ -1,25 +1,68 @@
 from pathlib import Path
-from typing import Optional, Any
+from typing import Optional, Any, Union
 from datetime import date
+import numpy as np
 import pandas as pd
 from .spreadsheet_manager import SpreadsheetManager
+from .row_filter import ColumnRange
+from .sheet_cache import SheetCache
 
 
 class SalesAnalyzer:
     """Analyzes confirmed sales data from Excel spreadsheets."""
     
-    def __init__(self, file_path: Optional[Path] = None):
+    # Business sheets are read from column A to this column
+    _SHEET_END_COLUMN = "Z"
+    _SHEET_COLUMN_COUNT = 26
+    
+    # Low-cardinality text columns, read as categoricals
+    _CATEGORICAL_COLUMNS = ['Client', 'Category', 'Product', 'ClientStatus', 'Ongoing']
+    
+    # Raw status text the ExistingClient and New flags are derived from
+    _STATUS_COLUMNS = ['ClientStatus', 'Ongoing']
+    
+    # Name of the cached rows' index, which holds each row's position in its sheet
+    _SHEET_ROW = 'SheetRow'
+    
+    # Product codes reported under a friendlier name, unless the analyzer is given its own table
+    DEFAULT_PRODUCT_TRANSLATIONS = {
+        'expert.id': 'Consulting',
+        'views.id': 'Views',
+        'profile.id': 'Profile',
+        'atlas.id': 'Atlas',
+        'economy.id': 'Economy',
+        'forecast.id': 'Forecast',
+        'housing.id': 'Housing',
+        'Forecast (SAFi)': 'Forecast'
+    }
+    
+    def __init__(self, file_path: Optional[Path] = None, cache: Optional[SheetCache] = None,
+                 product_translations: Optional[dict[str, str]] = None, drop_status_columns: bool = False,
+                 watch: bool = False):
         """Initialize the SalesAnalyzer.
         
         Args:
             file_path: Path to the business spreadsheet. Defaults to data/raw/Business.xlsm
+            cache: Optional on-disk sheet cache reused across analyzer instances
+            product_translations: Mapping of raw product name to reported name.
+                Defaults to DEFAULT_PRODUCT_TRANSLATIONS
+            drop_status_columns: Drop the raw ClientStatus and Ongoing columns once the
+                ExistingClient and New flags are derived from them (default: False)
+            watch: Check the workbook for changes before every query and refresh the
+                cached data of the sheets that changed (default: False)
         """
         if file_path is None:
             self.file_path = Path("data/raw/Business.xlsm")
         else:
             self.file_path = Path(file_path)
         
-        self.spreadsheet_manager = SpreadsheetManager(self.file_path)
+        if product_translations is None:
+            product_translations = self.DEFAULT_PRODUCT_TRANSLATIONS
+        self.product_translations = dict(product_translations)
+        self.drop_status_columns = drop_status_columns
+        self.watch = watch
+        
+        self.spreadsheet_manager = SpreadsheetManager(self.file_path, mode="read", cache=cache)
         self._is_open = False
         
         # Configuration for different sheet types
@@ -36,19 +79,27 @@ class SalesAnalyzer:
             }
         }
         
-        # Cache for loaded data
+        # Cache for loaded data: the rows of every date interval loaded so far, sorted by Date and
+        # indexed by sheet row, and the row positions of each client within them (built on first use)
         self._cached_data: dict[str, dict[str, Any]] = {
             'industry': {
                 'data': None,
-                'date_from': None,
-                'date_to': None
+                'intervals': [],
+                'client_rows': None
             },
             'government': {
                 'data': None,
-                'date_from': None,
-                'date_to': None
+                'intervals': [],
+                'client_rows': None
             }
         }
+        
+        # Memory usage of the most recent sheet load of each config, before and after standardization
+        self._memory_usage: dict[str, pd.DataFrame] = {}
+        
+        # Workbook (mtime, size) and per-sheet signatures the cached data was loaded from
+        self._workbook_state: Optional[tuple[int, int]] = None
+        self._sheet_signatures: dict[str, tuple[int, int]] = {}
     
     def _validate_date_range(self, start_date: date, end_date: date):
         """Validate that the date range is valid.
@@ -83,43 +134,250 @@ class SalesAnalyzer:
     def _ensureUnderlyingDataLoaded(self, config_key: str, start_date: date, end_date: date) -> pd.DataFrame:
         """Ensure that the underlying data for the specified config is loaded and covers the requested date range.
         
+        The cache keeps a set of merged date intervals together with their rows. Only
+        the parts of the requested range not yet covered are read from the sheet, so
+        revisiting any earlier range is answered from the cache.
+        
         Args:
             config_key: Key to identify the sheet configuration ('industry' or 'government')
             start_date: Start date for the required range
             end_date: End date for the required range
             
         Returns:
-            pandas DataFrame with the cached data (or newly loaded if needed)
+            pandas DataFrame with the rows of the requested range in sheet order, indexed by
+            sheet row, which shares data with the cache and must be copied before it is modified
         """
         self._validate_date_range(start_date, end_date)
         if config_key not in self._cached_data:
             raise ValueError(f"Unknown config key: {config_key}. Available keys: {list(self._cached_data.keys())}")
+        if self.watch:
+            self.refresh()
         cache = self._cached_data[config_key]
-        if self._cache_covers_range(cache, start_date, end_date):
-            return self._filter_cached_data_by_date(cache['data'], start_date, end_date)
-        new_data = self._get_sales_data(config_key, start_date, end_date)
-        cache['data'] = new_data
-        cache['date_from'] = start_date
-        cache['date_to'] = end_date
-        return new_data
-    
-    def _cache_covers_range(self, cache: dict, start_date: date, end_date: date) -> bool:
-        """Check if the cache covers the requested date range."""
-        return (
-            cache['data'] is not None and 
-            cache['date_from'] is not None and 
-            cache['date_to'] is not None and
-            cache['date_from'] <= start_date and 
-            cache['date_to'] >= end_date
+        requested = (pd.Timestamp(start_date), pd.Timestamp(end_date))
+        gaps = self._uncovered_intervals(cache['intervals'], *requested)
+        if gaps:
+            self._load_intervals_into_cache(config_key, cache, gaps)
+            cache['intervals'] = self._merge_intervals(cache['intervals'] + [requested])
+        return self._in_sheet_order(self._filter_cached_data_by_date(cache['data'], start_date, end_date))
+    
+    def _uncovered_intervals(self, intervals: list, start: pd.Timestamp, end: pd.Timestamp) -> list:
+        """Return the closed intervals of [start, end] not covered by the sorted, disjoint intervals.
+        
+        Gap endpoints may touch a covered interval; rows on those endpoints are
+        already cached and are dropped when the gap is loaded.
+        """
+        gaps = []
+        cursor = start
+        cursor_covered = False
+        for interval_start, interval_end in intervals:
+            if interval_end < cursor or interval_start > end:
+                continue
+            if interval_start > cursor:
+                gaps.append((cursor, interval_start))
+            cursor = max(cursor, interval_end)
+            cursor_covered = True
+        if cursor < end or not cursor_covered:
+            gaps.append((cursor, end))
+        return gaps
+    
+    def _merge_intervals(self, intervals: list) -> list:
+        """Sort closed intervals and merge the ones that overlap or share an endpoint."""
+        merged: list = []
+        for interval_start, interval_end in sorted(intervals):
+            if merged and interval_start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], interval_end))
+            else:
+                merged.append((interval_start, interval_end))
+        return merged
+    
+    def _load_intervals_into_cache(self, config_key: str, cache: dict, gaps: list):
+        """Read the uncovered intervals in one pass over the span they cover and add the rows not yet cached.
+        
+        The cache is left untouched when the gaps hold no new rows.
+        """
+        loaded = self._get_sales_data(config_key, gaps[0][0], gaps[-1][1])
+        new_rows = loaded[~self._dates_in_intervals(loaded['Date'], cache['intervals'])]
+        if cache['data'] is None:
+            cache['data'] = self._sort_by_date(new_rows)
+        elif len(new_rows):
+            cache['data'] = self._sort_by_date(self._concat_sales_frames([cache['data'], new_rows]))
+        else:
+            return
+        cache['client_rows'] = None
+    
+    def _dates_in_intervals(self, dates: pd.Series, intervals: list) -> pd.Series:
+        """Boolean mask of the dates that fall inside any of the closed intervals."""
+        mask = pd.Series(False, index=dates.index)
+        for interval_start, interval_end in intervals:
+            mask |= (dates >= interval_start) & (dates <= interval_end)
+        return mask
+    
+    def _concat_sales_frames(self, frames: list) -> pd.DataFrame:
+        """Concatenate standardized frames, keeping their sheet row labels and categorical columns categorical.
+        
+        Empty frames are left out, and a column holding only missing values takes the dtype
+        the column has in the other frames, so neither changes the combined dtypes.
+        """
+        frames = [frame for frame in frames if len(frame)] or frames[:1]
+        if len(frames) == 1:
+            return frames[0]
+        frames = self._align_missing_column_dtypes(frames)
+        combined = pd.concat(frames)
+        for column in frames[0].columns:
+            if isinstance(frames[0][column].dtype, pd.CategoricalDtype):
+                combined[column] = pd.api.types.union_categoricals(
+                    [frame[column] for frame in frames], sort_categories=True
+                )
+        return combined
+    
+    def _align_missing_column_dtypes(self, frames: list) -> list:
+        """Cast columns holding only missing values to the dtype of the first frame with values in that column."""
+        dtypes = {}
+        for frame in frames:
+            for column in frame.columns:
+                if column not in dtypes and frame[column].notna().any():
+                    dtypes[column] = frame[column].dtype
+        aligned = []
+        for frame in frames:
+            missing = {
+                column: dtypes[column] for column in frame.columns
+                if column in dtypes and frame[column].dtype != dtypes[column] and frame[column].isna().all()
+            }
+            aligned.append(frame.astype(missing) if missing else frame)
+        return aligned
+    
+    def _sort_by_date(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Sort rows indexed by sheet row by Date, keeping sheet order among rows of the same date."""
+        indexed = df.rename_axis(self._SHEET_ROW)
+        return indexed.sort_values(['Date', self._SHEET_ROW], kind='stable')
+    
+    def _in_sheet_order(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Return cached rows in the order they appear in the sheet."""
+        if data.index.is_monotonic_increasing:
+            return data
+        return data.sort_index(kind='stable')
+    
+    def refresh(self) -> list[str]:
+        """Bring the cached data up to date with the workbook on disk.
+        
+        A change is detected from the file's modification time and size; only the
+        sheets whose stored contents changed are then re-read, over the date
+        intervals already cached. When the re-read rows are the cached rows plus
+        appended ones, the new rows are merged into the cache (keeping the client
+        row index when they sort after every cached row); otherwise the cached rows
+        are replaced. The first call only records the workbook's current state.
+        Called before every query when the analyzer is created with watch=True.
+        
+        Returns:
+            Config keys ('industry', 'government') whose sheets changed since the last check
+        """
+        changed_sheets = self._sync_workbook_state()
+        refreshed = []
+        for config_key, config in self._sheet_configs.items():
+            if config['sheet_name'] in changed_sheets:
+                self._refresh_cache(config_key, self._cached_data[config_key])
+                refreshed.append(config_key)
+        return refreshed
+    
+    def _sync_workbook_state(self) -> set[str]:
+        """Record the workbook's current state, reopening it if it changed, and return the names of changed sheets."""
+        stat = self.file_path.stat()
+        state = (stat.st_mtime_ns, stat.st_size)
+        if state == self._workbook_state:
+            return set()
+        signatures = self.spreadsheet_manager.get_sheet_signatures()
+        first_check = self._workbook_state is None
+        self._workbook_state = state
+        previous, self._sheet_signatures = self._sheet_signatures, signatures
+        if first_check:
+            return set()
+        if self._is_open:
+            self.spreadsheet_manager.close()
+            self._is_open = False
+        return {name for name in set(signatures) | set(previous) if signatures.get(name) != previous.get(name)}
+    
+    def _refresh_cache(self, config_key: str, cache: dict):
+        """Re-read the cached date intervals of a config and merge appended rows, or replace the rows if others changed."""
+        if cache['data'] is None:
+            return
+        reloaded = self._reload_cached_intervals(config_key, cache['intervals'])
+        appended = self._appended_rows(cache['data'], reloaded)
+        if appended is None:
+            cache['data'] = reloaded
+            cache['client_rows'] = None
+        elif len(appended):
+            self._append_to_cache(cache, appended)
+    
+    def _reload_cached_intervals(self, config_key: str, intervals: list) -> pd.DataFrame:
+        """Read the current rows of the cached date intervals in one pass over the sheet, sorted by Date."""
+        if intervals == [(pd.Timestamp.min, pd.Timestamp.max)]:
+            return self._sort_by_date(self._load_standardized_sheet(config_key))
+        loaded = self._get_sales_data(config_key, intervals[0][0], intervals[-1][1])
+        return self._sort_by_date(loaded[self._dates_in_intervals(loaded['Date'], intervals)])
+    
+    def _appended_rows(self, cached: pd.DataFrame, reloaded: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """Return the reloaded rows that are not in the cache, or None if any cached row is gone or changed.
+        
+        Rows are compared by a hash of all their values, counting repeated rows. Cached
+        rows that moved to another sheet row also count as changed.
+        """
+        cached_counts = pd.util.hash_pandas_object(cached, index=False).value_counts()
+        reloaded_hashes = pd.util.hash_pandas_object(reloaded, index=False)
+        if (cached_counts.sub(reloaded_hashes.value_counts(), fill_value=0) > 0).any():
+            return None
+        occurrence = reloaded_hashes.groupby(reloaded_hashes).cumcount()
+        known = (occurrence < reloaded_hashes.map(cached_counts).fillna(0)).to_numpy()
+        if not np.array_equal(np.sort(reloaded.index[known]), np.sort(cached.index)):
+            return None
+        return reloaded[~known]
+    
+    def _append_to_cache(self, cache: dict, appended: pd.DataFrame):
+        """Merge new rows into the cache, extending the client row index when they all sort after the cached rows."""
+        data = cache['data']
+        merged = self._concat_sales_frames([data, appended])
+        at_tail = appended['Date'].notna().all() and (
+            data.empty or (data['Date'].iloc[-1], data.index[-1]) <= (appended['Date'].iloc[0], appended.index[0])
         )
+        if not at_tail:
+            cache['data'] = self._sort_by_date(merged)
+            cache['client_rows'] = None
+            return
+        cache['data'] = merged
+        if cache['client_rows'] is not None:
+            client_rows = cache['client_rows']
+            for client, positions in appended.groupby('Client', observed=True, sort=False).indices.items():
+                positions = positions + len(data)
+                if client in client_rows:
+                    positions = np.concatenate([client_rows[client], positions])
+                client_rows[client] = positions
     
     def _filter_cached_data_by_date(self, cached_data: pd.DataFrame, start_date: date, end_date: date) -> pd.DataFrame:
-        """Return a copy of cached_data filtered to the given date range as a DataFrame."""
-        mask = (cached_data['Date'] >= pd.Timestamp(start_date)) & (cached_data['Date'] <= pd.Timestamp(end_date))
-        filtered = cached_data[mask]
-        if not isinstance(filtered, pd.DataFrame):
-            filtered = filtered.to_frame().T if hasattr(filtered, 'to_frame') else pd.DataFrame([filtered])
-        return filtered.copy().reset_index(drop=True)
+        """Return the rows of the Date-sorted cached_data within the date range, as a view.
+        
+        The range boundaries are found by binary search on the Date column, so the
+        cost is O(log n) plus the rows returned and nothing is copied.
+        """
+        first, last = self._date_bounds(cached_data, start_date, end_date)
+        return cached_data.iloc[first:last]
+    
+    def _date_bounds(self, cached_data: pd.DataFrame, start_date: date, end_date: date) -> tuple[int, int]:
+        """Return the [first, last) row positions of the date range in the Date-sorted cached_data."""
+        dates = cached_data['Date']
+        first = dates.searchsorted(pd.Timestamp(start_date), side='left')
+        last = dates.searchsorted(pd.Timestamp(end_date), side='right')
+        return int(first), int(last)
+    
+    def _client_row_index(self, cache: dict) -> dict[str, np.ndarray]:
+        """Return the cached data's row positions for each client, building the index on first use."""
+        if cache['client_rows'] is None:
+            cache['client_rows'] = cache['data'].groupby('Client', observed=True, sort=False).indices
+        return cache['client_rows']
+    
+    def _detached_copy(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Copy a cached slice for a caller that may modify it, with a fresh index and only the categories it uses."""
+        copied = data.copy()
+        copied.index = pd.RangeIndex(len(copied))
+        return self._remove_unused_categories(copied)
     
     def _get_sales_data(self, config_key: str, start_date: date, end_date: date) -> pd.DataFrame:
         """Get sales data from a specified sheet configuration.
@@ -130,46 +388,156 @@ class SalesAnalyzer:
             end_date: End date for filtering (inclusive)
             
         Returns:
-            pandas DataFrame with standardized columns
+            pandas DataFrame with standardized columns, in sheet order and indexed by sheet row
             
         Raises:
             ValueError: If date range is invalid
             RuntimeError: If sheet doesn't exist or data can't be loaded
         """
         self._validate_date_range(start_date, end_date)
+        selected_columns = self._load_standardized_sheet(config_key, start_date, end_date)
+        filtered_df = self._filter_result_by_date_range(selected_columns, start_date, end_date)
+        return filtered_df
+    
+    def loadAllSalesData(self, max_workers: int = 1) -> dict[str, pd.DataFrame]:
+        """Load every configured sheet in one pass over the open workbook and cache it in full.
+        
+        Only the required columns of each sheet are materialized. Afterwards any date
+        range for any client type is answered from the cache without re-reading.
+        
+        Args:
+            max_workers: Number of worker processes used to parse the sheets in parallel
+                (default: 1, parse in this process)
+        
+        Returns:
+            Dictionary mapping config key ('industry', 'government') to the standardized DataFrame,
+            in sheet order
+            
+        Raises:
+            RuntimeError: If a sheet doesn't exist or data can't be loaded
+        """
+        if self.watch:
+            self._sync_workbook_state()
+        for config in self._sheet_configs.values():
+            self._validate_sheet_exists(config['sheet_name'])
+            self._validate_required_columns(config['required_columns'], config['sheet_name'])
+        sheet_frames = self.spreadsheet_manager.read_sheets_parallel(
+            {
+                config['sheet_name']: self._sheet_read_options(config['required_columns'], self._categorical_positions(config))
+                for config in self._sheet_configs.values()
+            },
+            max_workers=max_workers
+        )
+        loaded = {}
+        for config_key, config in self._sheet_configs.items():
+            data = self._standardize_sheet_frame(config_key, sheet_frames[config['sheet_name']])
+            cache = self._cached_data[config_key]
+            cache['data'] = self._sort_by_date(data)
+            cache['client_rows'] = None
+            cache['intervals'] = [(pd.Timestamp.min, pd.Timestamp.max)]
+            loaded[config_key] = data
+        return loaded
+    
+    def _load_standardized_sheet(self, config_key: str, start_date: Optional[date] = None,
+                                 end_date: Optional[date] = None) -> pd.DataFrame:
+        """Read the required columns of a configured sheet and return them standardized.
+        
+        When a date range is given, rows whose Date cell falls outside it are dropped
+        by the spreadsheet reader as the sheet is streamed; otherwise every row is read.
+        """
         if config_key not in self._sheet_configs:
             raise ValueError(f"Unknown config key: {config_key}. Available keys: {list(self._sheet_configs.keys())}")
         config = self._sheet_configs[config_key]
         sheet_name = config['sheet_name']
         required_columns = config['required_columns']
-        column_names = config['column_names']
         self._validate_sheet_exists(sheet_name)
-        df = self._read_sheet_as_dataframe(sheet_name)
-        self._validate_required_columns(df, required_columns, sheet_name)
-        selected_columns = self._select_and_rename_required_columns(df, required_columns, column_names)
-        filtered_df = self._filter_result_by_date_range(selected_columns, start_date, end_date)
-        return filtered_df
+        self._validate_required_columns(required_columns, sheet_name)
+        row_filter = None
+        if start_date is not None and end_date is not None:
+            row_filter = self._date_row_filter(config, start_date, end_date)
+        df = self._read_sheet_as_dataframe(sheet_name, required_columns, self._categorical_positions(config),
+                                           row_filter)
+        return self._standardize_sheet_frame(config_key, df)
+    
+    def _standardize_sheet_frame(self, config_key: str, df: pd.DataFrame) -> pd.DataFrame:
+        """Standardize the required columns read from a sheet, recording memory usage before and after."""
+        column_names = self._sheet_configs[config_key]['column_names']
+        before = df.set_axis(column_names, axis=1).memory_usage(deep=True)
+        data = self._select_and_rename_required_columns(df, column_names)
+        after = data.memory_usage(deep=True)
+        self._memory_usage[config_key] = pd.DataFrame({'before': before, 'after': after}).reindex(
+            before.index.union(after.index, sort=False)
+        ).fillna(0).astype('int64')
+        return data
+    
+    def getMemoryReport(self, client_type: str) -> pd.DataFrame:
+        """Report the memory used by the most recently loaded rows of a client type.
+        
+        Args:
+            client_type: 'industry' or 'government'
+            
+        Returns:
+            DataFrame indexed by column name (plus 'Index') with the deep memory usage in
+            bytes of the rows as read from the sheet ('before') and after standardization
+            ('after'); columns absent on one side count as 0 bytes there
+            
+        Raises:
+            ValueError: If client_type is invalid or no rows of it have been loaded yet
+        """
+        if client_type not in self._sheet_configs:
+            raise ValueError(f"Invalid client_type: {client_type}. Must be 'industry' or 'government'")
+        if client_type not in self._memory_usage:
+            raise ValueError(f"No {client_type} sales data has been loaded yet")
+        return self._memory_usage[client_type].copy()
     
-    def _read_sheet_as_dataframe(self, sheet_name: str) -> pd.DataFrame:
-        """Read the specified sheet as a DataFrame, up to column Z."""
+    def _read_sheet_as_dataframe(self, sheet_name: str, columns: Optional[list] = None,
+                                 categorical_columns: Optional[list] = None,
+                                 row_filter: Optional[ColumnRange] = None) -> pd.DataFrame:
+        """Read the specified sheet as a DataFrame, up to column Z, materializing only the given columns."""
         return self.spreadsheet_manager.readRangeAsDataFrame(
-            sheet_name=sheet_name,
-            start_row=1,
-            end_row=None,
-            start_col="A",
-            end_col="Z"
+            sheet_name=sheet_name, **self._sheet_read_options(columns, categorical_columns, row_filter)
         )
     
-    def _validate_required_columns(self, df: pd.DataFrame, required_columns: list, sheet_name: str):
-        """Raise if the DataFrame does not have enough columns for the required indices."""
-        if len(df.columns) < max(required_columns) + 1:
+    def _sheet_read_options(self, columns: Optional[list] = None,
+                            categorical_columns: Optional[list] = None,
+                            row_filter: Optional[ColumnRange] = None) -> dict[str, Any]:
+        """Range options used to read a business sheet: all rows of columns A..Z."""
+        return {
+            'start_row': 1,
+            'end_row': None,
+            'start_col': "A",
+            'end_col': self._SHEET_END_COLUMN,
+            'columns': columns,
+            'categorical_columns': categorical_columns,
+            'row_filter': row_filter
+        }
+    
+    def _date_row_filter(self, config: dict, start_date: date, end_date: date) -> ColumnRange:
+        """Row filter keeping the rows whose Date cell lies in the inclusive date range.
+        
+        Date cells that are not datetimes, such as dates typed as text, are kept so the
+        date filter applied after they are coerced decides, as it does for unfiltered reads.
+        """
+        date_position = config['required_columns'][config['column_names'].index('Date')]
+        return ColumnRange(date_position, start_date, end_date, keep_incomparable=True)
+    
+    def _categorical_positions(self, config: dict) -> list[int]:
+        """Sheet column positions of the configured columns that are read as categoricals."""
+        return [
+            position for position, name in zip(config['required_columns'], config['column_names'])
+            if name in self._CATEGORICAL_COLUMNS
+        ]
+    
+    def _validate_required_columns(self, required_columns: list, sheet_name: str):
+        """Raise if the required column indices fall outside the columns read from the sheet (A..Z)."""
+        if self._SHEET_COLUMN_COUNT < max(required_columns) + 1:
             raise RuntimeError(
-                f"Sheet '{sheet_name}' doesn't have enough columns. Expected at least {max(required_columns) + 1} columns, got {len(df.columns)}"
+                f"Sheet '{sheet_name}' doesn't have enough columns. Expected at least {max(required_columns) + 1} columns, got {self._SHEET_COLUMN_COUNT}"
             )
     
-    def _select_and_rename_required_columns(self, df: pd.DataFrame, required_columns: list, column_names: list) -> pd.DataFrame:
-        """Select and rename required columns, convert Date column to datetime, and trim string fields."""
-        selected_columns = df.iloc[:, required_columns].copy()
+    def _select_and_rename_required_columns(self, df: pd.DataFrame, column_names: list) -> pd.DataFrame:
+        """Rename the required columns, convert Date column to datetime, and trim string fields."""
+        selected_columns = df.copy()
         selected_columns.columns = column_names
         selected_columns['Date'] = pd.to_datetime(selected_columns['Date'], errors='coerce')
         
@@ -177,34 +545,96 @@ class SalesAnalyzer:
         string_columns = ['Client', 'Category', 'Product', 'Description', 'ClientStatus', 'Ongoing']
         for col in string_columns:
             if col in selected_columns.columns:
-                selected_columns[col] = selected_columns[col].astype(str).str.strip()
+                selected_columns[col] = self._strip_text_column(selected_columns[col])
         
         # Add derived columns
         selected_columns = self._add_derived_columns(selected_columns)
+        selected_columns['ProductNormalized'] = self._normalize_products(selected_columns['Product'])
+        selected_columns['DescriptionNormalized'] = self._normalize_descriptions(selected_columns['Description'])
+        
+        return self._apply_schema(selected_columns)
+    
+    def _apply_schema(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Cast standardized columns to compact dtypes, dropping the raw status columns if configured.
         
-        return selected_columns
+        Total becomes float64 (unparseable amounts are missing), text dimensions
+        categoricals and the derived flags bool.
+        """
+        df['Total'] = pd.to_numeric(df['Total'], errors='coerce').astype('float64')
+        for column in self._CATEGORICAL_COLUMNS:
+            if not isinstance(df[column].dtype, pd.CategoricalDtype):
+                df[column] = df[column].astype('category')
+        df['ExistingClient'] = df['ExistingClient'].astype(bool)
+        df['New'] = df['New'].astype(bool)
+        if self.drop_status_columns:
+            df = df.drop(columns=self._STATUS_COLUMNS)
+        return df
+    
+    def _normalize_products(self, products: pd.Series) -> pd.Series:
+        """Translate a Product column into reported names as a categorical, with excluded products missing.
+        
+        Each distinct product is translated once and rows are recoded through their
+        categorical codes, so the cost does not depend on the Python work per row.
+        """
+        if not isinstance(products.dtype, pd.CategoricalDtype):
+            products = products.astype('category')
+        translated = pd.Categorical([self._translate_product(product) for product in products.cat.categories])
+        codes = products.cat.codes.to_numpy()
+        normalized_codes = np.where(codes >= 0, translated.codes[codes], -1)
+        normalized = pd.Categorical.from_codes(normalized_codes, categories=translated.categories)
+        return pd.Series(normalized, index=products.index).cat.remove_unused_categories()
+    
+    def _normalize_descriptions(self, descriptions: pd.Series) -> pd.Series:
+        """Collapse newlines and runs of whitespace in a Description column, with meaningless values missing."""
+        clean = descriptions.astype(str).str.replace(r'\s+', ' ', regex=True).str.strip()
+        return clean.where(~clean.str.lower().isin(['none', 'nan', '']), None)
+    
+    def _strip_text_column(self, column: pd.Series) -> pd.Series:
+        """Convert a column to trimmed strings, as astype(str).str.strip() does.
+        
+        Categorical columns are trimmed per category and stay categorical; missing
+        values become 'None' either way.
+        """
+        if not isinstance(column.dtype, pd.CategoricalDtype):
+            return column.astype(str).str.strip()
+        labels = np.array([str(category).strip() for category in column.cat.categories] + ['None'], dtype=object)
+        categories, label_codes = np.unique(labels, return_inverse=True)
+        codes = column.cat.codes.to_numpy()
+        stripped = pd.Categorical.from_codes(label_codes.reshape(-1)[codes], categories=categories)
+        return pd.Series(stripped, index=column.index).cat.remove_unused_categories()
     
     def _add_derived_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """Add derived boolean columns ExistingClient and New based on ClientStatus and Ongoing fields."""
         # Handle missing values: missing ClientStatus = 'not existing', missing Ongoing = 'not no'
-        client_status = df['ClientStatus'].fillna('').astype(str)
-        ongoing = df['Ongoing'].fillna('').astype(str)
-        
         # ExistingClient: True if ClientStatus is 'Existing' (case insensitive)
-        df['ExistingClient'] = client_status.str.lower() == 'existing'
+        df['ExistingClient'] = self._text_equals_ignoring_case(df['ClientStatus'], 'existing')
         
         # New: True if not existing client, OR if existing client with Ongoing = 'No'
-        df['New'] = (~df['ExistingClient']) | (ongoing.str.lower() == 'no')
+        df['New'] = (~df['ExistingClient']) | self._text_equals_ignoring_case(df['Ongoing'], 'no')
         
         return df
     
+    def _text_equals_ignoring_case(self, column: pd.Series, text: str) -> pd.Series:
+        """Compare a text column with lowercase text, treating missing values as ''.
+        
+        Categorical columns are compared once per category and matched on their codes.
+        """
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            matching = [code for code, category in enumerate(column.cat.categories) if str(category).lower() == text]
+            return pd.Series(np.isin(column.cat.codes.to_numpy(), matching), index=column.index)
+        return column.fillna('').astype(str).str.lower() == text
+    
     def _filter_result_by_date_range(self, df: pd.DataFrame, start_date: date, end_date: date) -> pd.DataFrame:
-        """Filter DataFrame by date range and reset index, always returning a DataFrame."""
+        """Return a copy of the rows of a freshly read DataFrame in the date range, keeping sheet order and row labels."""
         mask = (df['Date'] >= pd.Timestamp(start_date)) & (df['Date'] <= pd.Timestamp(end_date))
-        filtered = df[mask]
-        if not isinstance(filtered, pd.DataFrame):
-            filtered = filtered.to_frame().T if hasattr(filtered, 'to_frame') else pd.DataFrame([filtered])
-        return filtered.copy().reset_index(drop=True)
+        return self._remove_unused_categories(df[mask].rename_axis(self._SHEET_ROW).copy())
+    
+    def _remove_unused_categories(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Drop categories no row uses, so a date window has the same dtypes however it was read."""
+        for column in df.columns:
+            if isinstance(df[column].dtype, pd.CategoricalDtype):
+                df[column] = df[column].cat.remove_unused_categories()
+        return df
     
     def getIndustrySalesData(self, start_date: date, end_date: date) -> pd.DataFrame:
         """Get industry sales data from the LD-Business sheet.
@@ -214,14 +644,15 @@ class SalesAnalyzer:
             end_date: End date for filtering (inclusive)
             
         Returns:
-            pandas DataFrame with columns: Client, Category, Product, Date, Total, Description, 
-            ClientStatus, Ongoing, ExistingClient, New
+            pandas DataFrame with columns: Client, Category, Product, Date, Total, Description,
+            ClientStatus, Ongoing, ExistingClient, New, ProductNormalized, DescriptionNormalized
+            (ClientStatus and Ongoing are dropped when drop_status_columns is set)
             
         Raises:
             ValueError: If date range is invalid
             RuntimeError: If sheet doesn't exist or data can't be loaded
         """
-        return self._ensureUnderlyingDataLoaded('industry', start_date, end_date)
+        return self._detached_copy(self._ensureUnderlyingDataLoaded('industry', start_date, end_date))
     
     def getGovSalesData(self, start_date: date, end_date: date) -> pd.DataFrame:
         """Get government sales data from the LG-Business sheet.
@@ -232,13 +663,14 @@ class SalesAnalyzer:
             
         Returns:
             pandas DataFrame with columns: Client, Category, Product, Date, Total, Description,
-            ClientStatus, Ongoing, ExistingClient, New
+            ClientStatus, Ongoing, ExistingClient, New, ProductNormalized, DescriptionNormalized
+            (ClientStatus and Ongoing are dropped when drop_status_columns is set)
             
         Raises:
             ValueError: If date range is invalid
             RuntimeError: If sheet doesn't exist or data can't be loaded
         """
-        return self._ensureUnderlyingDataLoaded('government', start_date, end_date)
+        return self._detached_copy(self._ensureUnderlyingDataLoaded('government', start_date, end_date))
     
     def getNewIndustryClients(self, start_date: date, end_date: date) -> list[str]:
         """Get list of unique industry clients for the specified date range.
@@ -274,6 +706,53 @@ class SalesAnalyzer:
         data = self._ensureUnderlyingDataLoaded('government', start_date, end_date)
         return self._extract_unique_clients(data)
     
+    def getClientSummaries(self, client_names: Optional[list[str]], client_type: str, start_date: date,
+                           end_date: date, as_frame: bool = False) -> Union[list[dict], pd.DataFrame]:
+        """Get summaries of sales data for many clients (new business only) in one pass.
+        
+        Each summary equals getClientSummary's result for that client. Named clients
+        are located through an index of each client's cached rows, so only their
+        rows are visited.
+        
+        Args:
+            client_names: Clients to summarize, in output order, or None for every new
+                business client in the date range
+            client_type: Type of client ('industry' or 'government')
+            start_date: Start date for filtering (inclusive)
+            end_date: End date for filtering (inclusive)
+            as_frame: Return a DataFrame with one row per client instead of a list of dicts
+            
+        Returns:
+            List of dictionaries (or DataFrame columns) with keys: client, amount, products,
+            details, sale_type
+            
+        Raises:
+            ValueError: If date range is invalid or client_type is invalid
+            RuntimeError: If sheet doesn't exist or data can't be loaded
+        """
+        if client_type not in ['industry', 'government']:
+            raise ValueError(f"Invalid client_type: {client_type}. Must be 'industry' or 'government'")
+        
+        data = self._ensureUnderlyingDataLoaded(client_type, start_date, end_date)
+        if client_names is None:
+            client_names = self._extract_unique_clients(data)
+        else:
+            data = self._rows_for_clients(self._cached_data[client_type], client_names, start_date, end_date)
+        summaries = self._summarize_clients(data, client_names)
+        
+        if as_frame:
+            return pd.DataFrame(summaries, columns=['client', 'amount', 'products', 'details', 'sale_type'])
+        return summaries
+    
+    def _rows_for_clients(self, cache: dict, client_names: list[str], start_date: date, end_date: date) -> pd.DataFrame:
+        """Return the cached rows of the named clients within the date range, in sheet order."""
+        first, last = self._date_bounds(cache['data'], start_date, end_date)
+        client_rows = self._client_row_index(cache)
+        positions = [client_rows[name] for name in client_names if name in client_rows]
+        positions = np.unique(np.concatenate(positions)) if positions else np.array([], dtype=np.intp)
+        positions = positions[(positions >= first) & (positions < last)]
+        return self._in_sheet_order(cache['data'].iloc[positions])
+    
     def getClientSummary(self, client_name: str, client_type: str, start_date: date, end_date: date) -> dict:
         """Get a summary of sales data for a specific client (new business only).
         
@@ -321,44 +800,25 @@ class SalesAnalyzer:
         return float(data['Total'].sum())
     
     def _extract_unique_products(self, data: pd.DataFrame) -> list[str]:
-        """Extract unique, non-empty products, excluding 'Consulting' and applying product name translations."""
-        products = data['Product'].dropna().unique().tolist()
-        raw_products = [str(product).strip() for product in products 
-                       if str(product).strip() and str(product).strip() != 'Consulting' 
-                       and str(product).strip().lower() not in ['none', 'nan']]
-        
-        # Apply product name translations
-        product_mappings = {
-            'expert.id': 'Consulting',
-            'views.id': 'Views', 
-            'profile.id': 'Profile',
-            'atlas.id': 'Atlas',
-            'economy.id': 'Economy',
-            'forecast.id': 'Forecast',
-            'housing.id' : 'Housing',
-            'Forecast (SAFi)': 'Forecast'
-        }
-        
-        translated_products = []
-        for product in raw_products:
-            translated_product = product_mappings.get(product, product)
-            translated_products.append(translated_product)
+        """Extract unique, non-empty products, excluding 'Consulting' and applying product name translations.
         
-        return translated_products
+        Products are distinct by raw name, in order of first appearance, and reported by
+        their precomputed ProductNormalized value.
+        """
+        products = data[['Product', 'ProductNormalized']].dropna(subset=['Product']).drop_duplicates(subset='Product')
+        return products['ProductNormalized'].dropna().tolist()
+    
+    def _translate_product(self, product: Any) -> Optional[str]:
+        """Return the reported name of a raw product, or None if it is empty, missing or 'Consulting'."""
+        name = str(product).strip()
+        if not name or name == 'Consulting' or name.lower() in ['none', 'nan']:
+            return None
+        return self.product_translations.get(name, name)
     
     def _extract_unique_details(self, data: pd.DataFrame) -> list[str]:
-        """Extract unique, non-empty descriptions, cleansing newlines and extra spaces."""
-        details = data['Description'].dropna().unique().tolist()
-        cleansed = []
-        for detail in details:
-            if not isinstance(detail, str):
-                detail = str(detail)
-            # Remove newlines and extra spaces, then trim
-            clean = ' '.join(detail.replace('\n', ' ').replace('\r', ' ').split())
-            # Filter out empty strings and string representations of missing values
-            if clean and clean.lower() not in ['none', 'nan', '']:
-                cleansed.append(clean)
-        return cleansed
+        """Extract unique, non-empty descriptions, reported by their precomputed DescriptionNormalized value."""
+        details = data[['Description', 'DescriptionNormalized']].dropna(subset=['Description']).drop_duplicates(subset='Description')
+        return details['DescriptionNormalized'].dropna().tolist()
     
     def _determine_sale_type_from_data(self, data: pd.DataFrame) -> str:
         """Determine sale type based on ExistingClient column.
@@ -428,21 +888,132 @@ class SalesAnalyzer:
         if client_type not in ['industry', 'government']:
             raise ValueError(f"Invalid client_type: {client_type}. Must be 'industry' or 'government'")
         
-        clients = self._get_clients_by_type(client_type, start_date, end_date)
-        summaries = []
+        summaries = self.getClientSummaries(None, client_type, start_date, end_date)
+        return self._format_markdown_table(client_type, start_date, end_date, summaries)
+    
+    def _summarize_clients(self, data: pd.DataFrame, client_names: list[str]) -> list[dict]:
+        """Build getClientSummary's result for every client from one grouped pass over the data.
         
-        for client_name in clients:
-            summary = self.getClientSummary(client_name, client_type, start_date, end_date)
-            summaries.append(summary)
+        Args:
+            data: Sales rows for the date range
+            client_names: Clients to summarize, in output order
+            
+        Returns:
+            List of summary dictionaries with keys: client, amount, products, details, sale_type
+        """
+        parts = self._grouped_summary_parts(data, ['Client'])
+        return [self._client_summary(client_name, client_name, parts) for client_name in client_names]
+    
+    def _grouped_summary_parts(self, data: pd.DataFrame, keys: list[str]) -> dict[str, dict]:
+        """Compute amounts, products, details and existing-client flags for every group in one pass.
         
-        return self._format_markdown_table(client_type, start_date, end_date, summaries)
+        Args:
+            data: Sales rows to summarize
+            keys: Columns identifying a group, ending with 'Client'
+            
+        Returns:
+            Dictionary of 'amounts', 'products', 'details' and 'existing', each mapping a
+            group key (the value, or a tuple for several keys) to that group's result
+        """
+        new_business_data = self._filter_new_business_only(data)
+        return {
+            'amounts': new_business_data.groupby(keys, observed=True)['Total'].sum().to_dict(),
+            'products': self._group_unique_values(new_business_data, keys, 'Product', 'ProductNormalized'),
+            'details': self._group_unique_values(new_business_data, keys, 'Description', 'DescriptionNormalized'),
+            'existing': data.groupby(keys, observed=True)['ExistingClient'].any().to_dict()
+        }
     
-    def _get_clients_by_type(self, client_type: str, start_date: date, end_date: date) -> list[str]:
-        """Get list of clients for the specified type and date range."""
-        if client_type == 'industry':
-            return self.getNewIndustryClients(start_date, end_date)
-        else:
-            return self.getNewGovClients(start_date, end_date)
+    def _client_summary(self, client_name: str, group_key: Any, parts: dict[str, dict]) -> dict:
+        """Assemble one client's summary dictionary from grouped summary parts."""
+        return {
+            'client': client_name,
+            'amount': float(parts['amounts'].get(group_key, 0)),
+            'products': parts['products'].get(group_key, []),
+            'details': parts['details'].get(group_key, []),
+            'sale_type': 'Upsell' if parts['existing'].get(group_key, False) else 'New client'
+        }
+    
+    def _group_unique_values(self, data: pd.DataFrame, keys: list[str], column: str,
+                             normalized_column: str) -> dict[Any, list]:
+        """Map each group to the normalized distinct values of a column, in order of first appearance.
+        
+        Values are distinct by the raw column and reported from the precomputed
+        normalized_column; missing normalized values are dropped.
+        """
+        pairs = data[keys + [column, normalized_column]].drop_duplicates(subset=keys + [column])
+        pairs = pairs[pairs[column].notna()]
+        normalized = pairs[normalized_column]
+        kept = normalized.notna()
+        group_columns = [pairs[key][kept] for key in keys]
+        grouped = normalized[kept].groupby(group_columns, observed=True, sort=False).agg(list)
+        return grouped.to_dict()
+    
+    def summarize_periods(self, periods: list[tuple[date, date]], client_type: str) -> dict[tuple[date, date], list[dict]]:
+        """Summarize the new business clients of several date periods from a single load of the sheet.
+        
+        The span covering every period is loaded once, rows are assigned to periods
+        with pd.cut, and all (period, client) summaries come from one grouped pass.
+        Each period's summaries equal getClientSummaries(None, client_type, start, end).
+        
+        Args:
+            periods: Non-overlapping (start_date, end_date) pairs, both dates inclusive
+            client_type: Type of client ('industry' or 'government')
+            
+        Returns:
+            Dictionary mapping each (start_date, end_date) period, in the order given, to
+            its list of client summary dictionaries
+            
+        Raises:
+            ValueError: If client_type is invalid, or a period is invalid or overlaps another
+            RuntimeError: If sheet doesn't exist or data can't be loaded
+        """
+        if client_type not in ['industry', 'government']:
+            raise ValueError(f"Invalid client_type: {client_type}. Must be 'industry' or 'government'")
+        ordered_periods = self._validate_periods(periods)
+        if not ordered_periods:
+            return {}
+        
+        data = self._ensureUnderlyingDataLoaded(client_type, ordered_periods[0][0], ordered_periods[-1][1])
+        bins = pd.IntervalIndex.from_tuples(
+            [(pd.Timestamp(start_date), pd.Timestamp(end_date)) for start_date, end_date in ordered_periods],
+            closed='both'
+        )
+        period_codes = pd.cut(data['Date'], bins).cat.codes.astype('int64')
+        in_period = period_codes >= 0
+        binned = data[in_period].assign(Period=period_codes[in_period])
+        
+        parts = self._grouped_summary_parts(binned, ['Period', 'Client'])
+        clients_by_period = self._new_business_clients_by_period(binned)
+        positions = {period: position for position, period in enumerate(ordered_periods)}
+        summaries = {}
+        for period in map(tuple, periods):
+            position = positions[period]
+            summaries[period] = [
+                self._client_summary(client_name, (position, client_name), parts)
+                for client_name in clients_by_period.get(position, [])
+            ]
+        return summaries
+    
+    def _validate_periods(self, periods: list[tuple[date, date]]) -> list[tuple[date, date]]:
+        """Validate each period and return them sorted by start date, rejecting overlaps."""
+        ordered_periods = sorted(tuple(period) for period in periods)
+        for start_date, end_date in ordered_periods:
+            self._validate_date_range(start_date, end_date)
+        for (_, previous_end), (next_start, _) in zip(ordered_periods, ordered_periods[1:]):
+            if next_start <= previous_end:
+                raise ValueError(f"Periods must not overlap: a period starting {next_start} begins before {previous_end} ends")
+        return ordered_periods
+    
+    def _new_business_clients_by_period(self, binned: pd.DataFrame) -> dict[int, list[str]]:
+        """Map each period position to its new business clients, as _extract_unique_clients lists them."""
+        new_business_data = self._filter_new_business_only(binned)
+        pairs = new_business_data[['Period', 'Client']].dropna().drop_duplicates()
+        clients_by_period: dict[int, list[str]] = {}
+        for position, client in zip(pairs['Period'], pairs['Client']):
+            client_name = str(client).strip()
+            if client_name:
+                clients_by_period.setdefault(position, []).append(client_name)
+        return clients_by_period
     
     def _format_markdown_table(self, client_type: str, start_date: date, end_date: date, summaries: list[dict]) -> str:
         """Format client summaries as a markdown table."""
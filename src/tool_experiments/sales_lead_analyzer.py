@@ -2,24 +2,30 @@ from pathlib import Path
 from typing import Optional
 import pandas as pd
 from .spreadsheet_manager import SpreadsheetManager
+from .sheet_cache import SheetCache
 
 
 class SalesLeadAnalyzer:
     """Analyzes sales lead data from Excel spreadsheets."""
     
-    def __init__(self, file_path: Optional[Path] = None, sheet_name: str = "Sheet1"):
+    # Low-cardinality columns used by the sector and summary filters
+    _CATEGORICAL_COLUMNS = ['Deal owner', 'Engagement Type', 'Sale Conviction']
+    
+    def __init__(self, file_path: Optional[Path] = None, sheet_name: str = "Sheet1",
+                 cache: Optional[SheetCache] = None):
         """Initialize the SalesLeadAnalyzer.
         
         Args:
             file_path: Path to the leads spreadsheet. Defaults to data/raw/Leads.xlsx
             sheet_name: Name of the sheet to analyze. Defaults to "Sheet1"
+            cache: Optional on-disk sheet cache reused across analyzer instances
         """
         if file_path is None:
             self.file_path = Path("data/raw/Leads.xlsx")
         else:
             self.file_path = Path(file_path)
         
-        self.spreadsheet_manager = SpreadsheetManager(self.file_path)
+        self.spreadsheet_manager = SpreadsheetManager(self.file_path, mode="read", cache=cache)
         self._dataframe: Optional[pd.DataFrame] = None
         self._sheet_name = sheet_name
     
@@ -46,8 +52,15 @@ class SalesLeadAnalyzer:
             raise RuntimeError(f"Sheet '{self._sheet_name}' not found. Available sheets: {sheet_names}")
     
     def _read_sheet_as_dataframe(self) -> pd.DataFrame:
-        """Read the specified sheet as a DataFrame."""
-        return self.spreadsheet_manager.readRangeAsDataFrame(sheet_name=self._sheet_name)
+        """Read the specified sheet as a DataFrame, with the filter columns it has as categoricals."""
+        return self.spreadsheet_manager.readRangeAsDataFrame(
+            sheet_name=self._sheet_name, categorical_columns=self._categorical_columns_in_sheet()
+        )
+    
+    def _categorical_columns_in_sheet(self) -> list[str]:
+        """Return the categorical filter columns present in the sheet's header row."""
+        header = self.spreadsheet_manager.readRangeAsDataFrame(sheet_name=self._sheet_name, end_row=1).columns
+        return [column for column in self._CATEGORICAL_COLUMNS if column in header]
     
     def _add_sector_field(self):
         """Add a calculated Sector field based on Deal owner and engagement type."""
@@ -0,0 +1,140 @@
+from pathlib import Path
+from typing import Optional, Any
+import pandas as pd
+from .utils.disk_cache import file_sha256, file_size, text_sha256, touch, evict_least_recently_used, write_atomically
+
+
+class SheetCache:
+    """Persistent on-disk cache of DataFrames parsed from spreadsheet ranges.
+    
+    Entries are keyed on the workbook's path, size, modification time and content
+    hash together with the sheet name and requested range, so any change to the
+    workbook makes its old entries unreachable; the first entry a cache instance
+    stores for a workbook version removes the entries of its other versions.
+    Entries are stored as pickled DataFrames and evicted least-recently-used
+    once their total size exceeds max_bytes; the total is read from disk once
+    and then kept up to date as entries are stored.
+    """
+    
+    DEFAULT_CACHE_DIR = Path("data/processed/.cache")
+    DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+    ENTRY_SUFFIX = ".pkl"
+    
+    def __init__(self, cache_dir: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize the SheetCache.
+        
+        Args:
+            cache_dir: Directory holding cache entries. Defaults to data/processed/.cache
+            max_bytes: Maximum total size of all entries before LRU eviction
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else self.DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self._content_hashes: dict[tuple, str] = {}
+        # Entry name prefixes of the workbook versions whose stale entries were removed
+        self._swept_versions: set[str] = set()
+        # Total size of the entries, read from disk when the first entry is stored
+        self._total_bytes: Optional[int] = None
+    
+    def get(self, file_path: Path, sheet_name: str, range_key: tuple) -> Optional[pd.DataFrame]:
+        """Return the cached DataFrame for a sheet range, or None on a miss.
+        
+        Args:
+            file_path: Path to the workbook
+            sheet_name: Name of the sheet that was read
+            range_key: Tuple describing the requested range and read options
+            
+        Returns:
+            The cached DataFrame, or None if the workbook version or range is not cached
+        """
+        entry_path = self._entry_path(file_path, sheet_name, range_key)
+        if not entry_path.exists():
+            return None
+        try:
+            df = pd.read_pickle(entry_path)
+        except Exception:
+            # Unreadable entries (partial writes, pandas upgrades) count as misses
+            entry_path.unlink(missing_ok=True)
+            return None
+        touch(entry_path)
+        return df
+    
+    def put(self, file_path: Path, sheet_name: str, range_key: tuple, df: pd.DataFrame) -> None:
+        """Store the DataFrame for a sheet range and evict stale or excess entries.
+        
+        Args:
+            file_path: Path to the workbook
+            sheet_name: Name of the sheet that was read
+            range_key: Tuple describing the requested range and read options
+            df: DataFrame parsed from the range
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry_path = self._entry_path(file_path, sheet_name, range_key)
+        version_prefix = entry_path.name.rsplit("-", 1)[0]
+        if version_prefix not in self._swept_versions:
+            self._remove_other_versions(file_path, version_prefix)
+            self._swept_versions.add(version_prefix)
+            self._total_bytes = None
+        if self._total_bytes is None:
+            self._total_bytes = self.total_bytes()
+        replaced_size = file_size(entry_path)
+        write_atomically(entry_path, df.to_pickle)
+        self._total_bytes += file_size(entry_path) - replaced_size
+        if self._total_bytes > self.max_bytes:
+            evict_least_recently_used(self._entries(), self.max_bytes)
+            self._total_bytes = self.total_bytes()
+    
+    def invalidate(self, file_path: Optional[Path] = None) -> int:
+        """Remove cached entries for one workbook, or for all workbooks.
+        
+        Args:
+            file_path: Workbook whose entries should be removed (default: all entries)
+            
+        Returns:
+            Number of entries removed
+        """
+        pattern = "*" if file_path is None else f"{self._path_digest(file_path)}-*"
+        removed = 0
+        for entry in self._entries(pattern):
+            entry.unlink(missing_ok=True)
+            removed += 1
+        if file_path is None:
+            self._content_hashes.clear()
+        self._swept_versions.clear()
+        self._total_bytes = None
+        return removed
+    
+    def total_bytes(self) -> int:
+        """Return the total size in bytes of all cached entries."""
+        return sum(entry.stat().st_size for entry in self._entries())
+    
+    def _entries(self, pattern: str = "*") -> list[Path]:
+        """List cache entry files matching the glob pattern."""
+        if not self.cache_dir.exists():
+            return []
+        return list(self.cache_dir.glob(f"{pattern}{self.ENTRY_SUFFIX}"))
+    
+    def _remove_other_versions(self, file_path: Path, version_prefix: str):
+        """Delete the workbook's entries whose names do not start with its current version's prefix."""
+        for entry in self._entries(f"{self._path_digest(file_path)}-*"):
+            if not entry.name.startswith(version_prefix):
+                entry.unlink(missing_ok=True)
+    
+    def _entry_path(self, file_path: Path, sheet_name: str, range_key: tuple) -> Path:
+        """Build the entry file name as <path digest>-<version digest>-<range digest>."""
+        path_digest = self._path_digest(file_path)
+        version_digest = text_sha256(repr(self._workbook_version(file_path)))[:16]
+        range_digest = text_sha256(repr((sheet_name,) + tuple(range_key)))[:16]
+        return self.cache_dir / f"{path_digest}-{version_digest}-{range_digest}{self.ENTRY_SUFFIX}"
+    
+    def _path_digest(self, file_path: Path) -> str:
+        """Digest of the resolved workbook path."""
+        return text_sha256(str(Path(file_path).resolve()))[:16]
+    
+    def _workbook_version(self, file_path: Path) -> tuple[Any, ...]:
+        """Return (size, mtime, content hash) identifying the workbook's current contents."""
+        resolved = Path(file_path).resolve()
+        stat = resolved.stat()
+        stat_key = (str(resolved), stat.st_size, stat.st_mtime_ns)
+        if stat_key not in self._content_hashes:
+            self._content_hashes[stat_key] = file_sha256(resolved)
+        return stat.st_size, stat.st_mtime_ns, self._content_hashes[stat_key]
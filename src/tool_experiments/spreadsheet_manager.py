@@ -1,11 +1,38 @@
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from openpyxl import load_workbook, Workbook
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Union, Iterator, Iterable
+import itertools
+import os
+import numpy as np
 import pandas as pd
+from .row_filter import ColumnRange
+from .sheet_cache import SheetCache
+from .xlsx_reader import XlsxSheetReader
+
+
+@dataclass
+class _SheetExtents:
+    """Last populated (non-empty) row of each column and column of each row of a worksheet."""
+    
+    max_row: int = 1
+    last_row_by_column: dict[int, int] = field(default_factory=dict)
+    last_column_by_row: dict[int, int] = field(default_factory=dict)
+
 
 class SpreadsheetManager:
     """Manages reading and writing operations for Excel spreadsheets."""
 
+    # "edit" loads the whole workbook for reading and writing; "read" opens it
+    # read-only and streams rows from the sheet XML only when they are requested.
+    OPEN_MODES = ("edit", "read")
+    
+    # "openpyxl" reads through openpyxl worksheets; "fast" parses the sheet XML
+    # directly into column arrays and is only available in read mode.
+    READ_ENGINES = ("openpyxl", "fast")
+
     @classmethod
     def CreateNew(cls, file_path: Path, sheet_name: str = "Sheet1"):
         """Create a new Excel spreadsheet file.
@@ -36,6 +63,59 @@ class SpreadsheetManager:
         workbook.save(file_path)
         workbook.close()
 
+    @classmethod
+    def export_dataframe_chunks(cls, file_path: Path, chunks: Iterable[pd.DataFrame],
+                                sheet_name: str = "Sheet1", include_headers: bool = True) -> int:
+        """Stream DataFrame chunks into a new single-sheet workbook.
+        
+        Uses an openpyxl write-only workbook, so each chunk's rows are flushed as they
+        arrive and memory stays flat however many rows are exported. Missing values
+        (NaN/NaT/None) are written as empty cells.
+        
+        Args:
+            file_path: Path of the .xlsx file to create (overwritten if it exists)
+            chunks: Iterable of DataFrames sharing the same columns, or a single DataFrame
+            sheet_name: Name of the sheet to write (default: "Sheet1")
+            include_headers: Whether to write the column headers first (default: True)
+            
+        Returns:
+            Number of data rows written
+            
+        Raises:
+            ValueError: If a chunk's columns differ from the first chunk's
+        """
+        if isinstance(chunks, pd.DataFrame):
+            chunks = [chunks]
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet(title=sheet_name)
+        columns = None
+        rows_written = 0
+        try:
+            for chunk in chunks:
+                if columns is None:
+                    columns = list(chunk.columns)
+                    if include_headers:
+                        sheet.append(columns)
+                elif list(chunk.columns) != columns:
+                    raise ValueError(f"Chunk columns {list(chunk.columns)} do not match the first chunk's columns {columns}")
+                for row in cls._chunk_rows_for_export(chunk):
+                    sheet.append(row)
+                rows_written += len(chunk)
+        except BaseException:
+            # Finish the half-written sheet stream so its temporary file is released
+            sheet.close()
+            raise
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        cls._save_and_close_workbook(workbook, file_path)
+        return rows_written
+
+    @classmethod
+    def _chunk_rows_for_export(cls, chunk: pd.DataFrame) -> Iterator[tuple]:
+        """Yield a chunk's rows as tuples of Python values, with missing values as None."""
+        values = chunk.astype(object)
+        values = values.where(chunk.notna(), None)
+        return values.itertuples(index=False, name=None)
+
     @classmethod
     def _create_manager_instance(cls, file_path: Path):
         """Create and return a SpreadsheetManager instance with the new workbook."""
@@ -44,24 +124,56 @@ class SpreadsheetManager:
         manager.is_open = True
         return manager
 
-    def __init__(self, file_path: Path):
-        """Initialize with path to spreadsheet file."""
+    def __init__(self, file_path: Path, mode: str = "edit", cache: Optional[SheetCache] = None,
+                 engine: str = "openpyxl"):
+        """Initialize with path to spreadsheet file.
+        
+        Args:
+            file_path: Path to the spreadsheet file
+            mode: "edit" (default) to load the full workbook, or "read" to open it
+                read-only and stream rows on demand
+            cache: Optional on-disk cache consulted by readRangeAsDataFrame
+            engine: "openpyxl" (default), or "fast" to read ranges straight from the
+                sheet XML (read mode only)
+        """
+        if mode not in self.OPEN_MODES:
+            raise ValueError(f"Invalid mode: {mode}. Must be one of {list(self.OPEN_MODES)}")
+        if engine not in self.READ_ENGINES:
+            raise ValueError(f"Invalid engine: {engine}. Must be one of {list(self.READ_ENGINES)}")
+        if engine == "fast" and mode != "read":
+            raise ValueError("The fast engine is only available with mode='read'")
         self.file_path = Path(file_path)
+        self.mode = mode
+        self.cache = cache
+        self.engine = engine
         self.workbook = None
         self.is_open = False
+        self._fast_reader: Optional[XlsxSheetReader] = None
+        self._sheet_extents: dict[str, _SheetExtents] = {}
+        self._batch_depth = 0
+        self._save_pending = False
+
+    @property
+    def is_read_only(self) -> bool:
+        """Whether the spreadsheet is opened in streaming read-only mode."""
+        return self.mode == "read"
 
     def open(self):
         """Open the spreadsheet file."""
         if not self.file_path.exists():
             raise FileNotFoundError(f"Spreadsheet not found: {self.file_path}")
-        self.workbook = load_workbook(self.file_path)
+        self.workbook = load_workbook(self.file_path, read_only=self.is_read_only)
         self.is_open = True
 
     def close(self) -> None:
         """Close the spreadsheet."""
         if self.workbook:
             self.workbook.close()
+        if self._fast_reader:
+            self._fast_reader.close()
         self.workbook = None
+        self._fast_reader = None
+        self._sheet_extents = {}
         self.is_open = False
     
     def get_sheet_names(self) -> List[str]:
@@ -71,12 +183,31 @@ class SpreadsheetManager:
             raise RuntimeError("Workbook is not open")
         return self.workbook.sheetnames
     
+    def get_sheet_signatures(self) -> dict[str, tuple[int, int]]:
+        """Get a signature of each sheet's stored XML, read from the file currently on disk.
+        
+        Only the package directory is consulted, so this is cheap even for large
+        workbooks and works whether or not the spreadsheet is open. A sheet's
+        signature changes whenever its contents are saved differently.
+        
+        Returns:
+            Dictionary mapping sheet name to a (CRC-32, size) tuple
+        """
+        reader = XlsxSheetReader(self.file_path)
+        try:
+            return reader.sheet_signatures()
+        finally:
+            reader.close()
+    
     def read_cell(self, sheet_name: str, cell_address: str) -> Any:
         """Read value from a specific cell using A1 notation."""
         self._ensure_workbook_open()
         if self.workbook is None:
             raise RuntimeError("Workbook is not open")
         sheet = self.workbook[sheet_name]
+        if self.is_read_only:
+            row, col = self._parse_cell_address(cell_address)
+            return sheet.cell(row=row, column=col).value
         return sheet[cell_address].value
     
     def read_cell_coords(self, sheet_name: str, row: int, col: int) -> Any:
@@ -103,16 +234,35 @@ class SpreadsheetManager:
             raise RuntimeError("Workbook is not open")
         sheet = self.workbook[sheet_name]
         col_letter = column.upper()
-        max_row = sheet.max_row
-        return self._find_empty_cell_in_range(sheet, col_letter, start_row, max_row)
+        if self.is_read_only:
+            return self._find_empty_cell_in_stream(sheet, col_letter, start_row, sheet.max_row)
+        return self._find_empty_cell_in_index(sheet, col_letter, start_row)
+
+    def _find_empty_cell_in_index(self, sheet, col_letter: str, start_row: int) -> int:
+        """Find the next empty cell in the specified column using the sheet's extent index.
+        
+        Past the column's last populated row the answer comes from the index; before
+        it, only the rows up to that last populated row are streamed to find a gap.
+        """
+        extents = self._get_sheet_extents(sheet)
+        if start_row > extents.max_row:
+            return extents.max_row + 1
+        last_row = extents.last_row_by_column.get(self._column_letter_to_index(col_letter), 0)
+        if start_row > last_row:
+            return start_row
+        return self._find_empty_cell_in_stream(sheet, col_letter, start_row, last_row)
 
-    def _find_empty_cell_in_range(self, sheet, col_letter: str, start_row: int, max_row: int) -> int:
-        """Find the next empty cell in the specified column range."""
-        for row in range(start_row, max_row + 1):
-            cell_value = sheet[f"{col_letter}{row}"].value
+    def _find_empty_cell_in_stream(self, sheet, col_letter: str, start_row: int, max_row: Optional[int]) -> int:
+        """Find the next empty cell in the specified column by streaming the rows once."""
+        col_idx = self._column_letter_to_index(col_letter)
+        row = start_row - 1
+        for row, (cell_value,) in enumerate(
+            sheet.iter_rows(min_row=start_row, max_row=max_row, min_col=col_idx, max_col=col_idx, values_only=True),
+            start=start_row,
+        ):
             if self._is_cell_empty(cell_value):
                 return row
-        return max_row + 1
+        return (max_row if max_row is not None else row) + 1
 
     def _is_cell_empty(self, cell_value: Any) -> bool:
         """Check if a cell value is considered empty."""
@@ -120,7 +270,11 @@ class SpreadsheetManager:
     
     def readRangeAsDataFrame(self, sheet_name: Optional[str] = None, 
                            start_row: Optional[int] = None, end_row: Optional[int] = None,
-                           start_col: Optional[str] = None, end_col: Optional[str] = None) -> pd.DataFrame:
+                           start_col: Optional[str] = None, end_col: Optional[str] = None,
+                           columns: Optional[List[int]] = None,
+                           categorical_columns: Optional[List[Union[str, int]]] = None,
+                           dtype: Optional[dict] = None,
+                           row_filter: Optional[ColumnRange] = None) -> pd.DataFrame:
         """Read a range of cells as a pandas DataFrame.
         
         Args:
@@ -129,30 +283,394 @@ class SpreadsheetManager:
             end_row: Ending row number (default: auto-detect)
             start_col: Starting column letter (default: 'A')
             end_col: Ending column letter (default: auto-detect)
+            columns: 0-based positions within the range to materialize, in output
+                order (default: every column in the range)
+            categorical_columns: Columns to return as pandas categoricals, given as header
+                labels or 0-based positions within the range. The fast engine builds
+                them straight from the shared strings table.
+            dtype: Mapping of header label or 0-based range position to the dtype the
+                column is converted to ("category" behaves like categorical_columns)
+            row_filter: Keep only the rows after the first (header) row whose value in
+                the filter column lies in range. It is checked while rows are read, and
+                the fast engine converts the other cells of matching rows only.
+                Auto-detected end rows are found from all rows, filtered or not.
             
         Returns:
-            pandas DataFrame containing the range data
+            pandas DataFrame containing the range data. With a row_filter, each kept row
+            keeps the index label it has in an unfiltered read, so filtered reads can be
+            put back in sheet order
+            
+        Raises:
+            ValueError: If a categorical_columns or dtype column is not in the range read,
+                or the row_filter column is outside the range
         """
         self._ensure_workbook_open()
         if self.workbook is None:
             raise RuntimeError("Workbook is not open")
         sheet_name = self._get_sheet_name_or_default(sheet_name)
+        range_key = self._range_key(start_row, end_row, start_col, end_col, columns, categorical_columns, dtype,
+                                    row_filter)
+        cached = self._get_cached_range(sheet_name, range_key)
+        if cached is not None:
+            return cached
+        start_row, start_col = self._set_default_range_values(start_row, start_col)
+        column_dtypes = self._merge_column_dtypes(categorical_columns, dtype)
+        # Positions within the range of the rows kept after the first, when filtering
+        row_offsets: List[int] = []
+        if self.engine == "fast":
+            df = self._read_range_fast(sheet_name, start_row, end_row, start_col, end_col, columns, column_dtypes,
+                                       row_filter, row_offsets)
+            if row_filter is not None:
+                df = self._index_by_row_offsets(df, row_offsets)
+            self._put_cached_range(sheet_name, range_key, df)
+            return df
+        
         sheet = self.workbook[sheet_name]
+        end_col = self._determine_end_column(sheet, start_row, end_col)
+        
+        if self.is_read_only:
+            start_col_idx, end_col_idx = self._convert_columns_to_indices(start_col, end_col)
+            positions = self._resolve_column_positions(start_col_idx, end_col_idx, columns)
+            self._validate_row_filter(row_filter, start_col_idx, end_col_idx)
+            data = self._stream_cell_range(sheet, start_row, end_row, start_col_idx, end_col_idx, positions,
+                                           row_filter, row_offsets)
+        else:
+            end_row = self._determine_end_row(sheet, start_col, end_row)
+            start_col_idx, end_col_idx = self._convert_columns_to_indices(start_col, end_col)
+            positions = self._resolve_column_positions(start_col_idx, end_col_idx, columns)
+            self._validate_row_filter(row_filter, start_col_idx, end_col_idx)
+            data = self._read_cell_range(sheet, start_row, end_row, start_col_idx, positions, row_filter,
+                                         row_offsets)
+        
+        header_row = data[0] if data else []
+        slot_dtypes = self._resolve_dtype_slots(column_dtypes, positions, header_row)
+        df = self._apply_column_dtypes(self._create_dataframe_with_headers(data), slot_dtypes)
+        if row_filter is not None:
+            df = self._index_by_row_offsets(df, row_offsets)
+        self._put_cached_range(sheet_name, range_key, df)
+        return df
+    
+    def iter_range_chunks(self, sheet_name: Optional[str] = None, chunk_rows: int = 50_000,
+                          start_row: Optional[int] = None, end_row: Optional[int] = None,
+                          start_col: Optional[str] = None, end_col: Optional[str] = None,
+                          columns: Optional[List[int]] = None,
+                          categorical_columns: Optional[List[Union[str, int]]] = None,
+                          dtype: Optional[dict] = None,
+                          row_filter: Optional[ColumnRange] = None) -> Iterator[pd.DataFrame]:
+        """Read a range of cells as a sequence of DataFrames of at most chunk_rows rows.
         
+        Rows are streamed from the sheet and only one chunk is held at a time, so
+        callers can filter each chunk and drop what they do not need. The range is
+        resolved exactly as in readRangeAsDataFrame, and concatenating the chunks
+        gives the same rows. Every chunk carries the header row's labels. Columns
+        converted through categorical_columns or dtype have that dtype in every
+        chunk (pass a pd.CategoricalDtype with explicit categories for identical
+        categories); other columns are cast to the first chunk's dtypes where the
+        values allow it. The cache is not consulted.
+        
+        Args:
+            sheet_name: Name of the sheet to read (default: first sheet)
+            chunk_rows: Maximum number of data rows per chunk (default: 50,000)
+            start_row: Starting row number (default: 1)
+            end_row: Ending row number (default: auto-detect)
+            start_col: Starting column letter (default: 'A')
+            end_col: Ending column letter (default: auto-detect)
+            columns: 0-based positions within the range to materialize, in output order
+            categorical_columns: Columns to return as pandas categoricals, given as header
+                labels or 0-based positions within the range
+            dtype: Mapping of header label or 0-based range position to dtype
+            row_filter: Keep only the rows after the first (header) row whose value in
+                the filter column lies in range
+            
+        Yields:
+            pandas DataFrames of consecutive rows of the range
+            
+        Raises:
+            ValueError: If chunk_rows is not positive, a categorical_columns or dtype
+                column is not in the range read, or the row_filter column is outside the range
+        """
+        if chunk_rows < 1:
+            raise ValueError(f"chunk_rows must be a positive number of rows, got {chunk_rows}")
+        self._ensure_workbook_open()
+        if self.workbook is None:
+            raise RuntimeError("Workbook is not open")
+        sheet_name = self._get_sheet_name_or_default(sheet_name)
         start_row, start_col = self._set_default_range_values(start_row, start_col)
-        end_col = self._determine_end_column(sheet, start_row, end_col)
-        end_row = self._determine_end_row(sheet, start_col, end_row)
+        column_dtypes = self._merge_column_dtypes(categorical_columns, dtype)
+        positions, rows = self._open_range_rows(sheet_name, start_row, end_row, start_col, end_col, columns,
+                                                row_filter)
+        
+        first_row = next(rows, None)
+        if first_row is None:
+            return
+        header_row = first_row if self._should_use_first_row_as_headers(first_row) else None
+        if header_row is None:
+            rows = itertools.chain([first_row], rows)
+        slot_dtypes = self._resolve_dtype_slots(column_dtypes, positions, first_row)
+        
+        reference_dtypes = None
+        for chunk_data in self._iter_batches(rows, chunk_rows):
+            if header_row is not None:
+                chunk_data.insert(0, header_row)
+            df = self._apply_column_dtypes(self._create_dataframe_with_headers(chunk_data), slot_dtypes)
+            if reference_dtypes is None:
+                reference_dtypes = list(df.dtypes)
+            else:
+                df = self._conform_column_dtypes(df, reference_dtypes, slot_dtypes)
+            yield df
+    
+    def _open_range_rows(self, sheet_name: str, start_row: int, end_row: Optional[int], start_col: str,
+                         end_col: Optional[str], columns: Optional[List[int]],
+                         row_filter: Optional[ColumnRange] = None) -> tuple[List[int], Iterator[list]]:
+        """Resolve the range bounds and return the selected positions with a lazy row iterator.
+        
+        Each row comes back as a list holding the selected columns. Auto-detected
+        end rows follow readRangeAsDataFrame for the current mode and engine.
+        """
+        if self.engine == "fast":
+            reader = self._get_fast_reader()
+            if end_col is None:
+                end_col = self._last_non_empty_column_in_row(reader.read_row(sheet_name, start_row))
+            start_col_idx, end_col_idx = self._convert_columns_to_indices(start_col, end_col)
+            rows = reader.iter_rows(sheet_name, start_row, end_row, start_col_idx, end_col_idx)
+        else:
+            sheet = self.workbook[sheet_name]
+            end_col = self._determine_end_column(sheet, start_row, end_col)
+            if not self.is_read_only:
+                end_row = self._determine_end_row(sheet, start_col, end_row)
+            start_col_idx, end_col_idx = self._convert_columns_to_indices(start_col, end_col)
+            rows = sheet.iter_rows(min_row=start_row, max_row=end_row,
+                                   min_col=start_col_idx, max_col=end_col_idx, values_only=True)
+        positions = self._resolve_column_positions(start_col_idx, end_col_idx, columns)
+        self._validate_row_filter(row_filter, start_col_idx, end_col_idx)
+        if end_row is None:
+            rows = self._iter_rows_to_last_key(rows, start_row)
+        return positions, self._iter_selected_rows(rows, positions, row_filter)
+    
+    def _iter_batches(self, rows: Iterator[list], size: int) -> Iterator[list]:
+        """Group an iterator of rows into lists of at most size rows."""
+        while True:
+            batch = list(itertools.islice(rows, size))
+            if not batch:
+                return
+            yield batch
+    
+    def _conform_column_dtypes(self, df: pd.DataFrame, reference_dtypes: list, slot_dtypes: dict) -> pd.DataFrame:
+        """Cast a chunk's inferred columns to the first chunk's dtypes, leaving those that cannot be cast."""
+        for slot, reference_dtype in enumerate(reference_dtypes):
+            if slot in slot_dtypes or df.dtypes.iloc[slot] == reference_dtype:
+                continue
+            try:
+                df.isetitem(slot, df.iloc[:, slot].astype(reference_dtype))
+            except (TypeError, ValueError):
+                continue
+        return df
+    
+    def _read_range_fast(self, sheet_name: str, start_row: int, end_row: Optional[int], start_col: str,
+                         end_col: Optional[str], columns: Optional[List[int]], column_dtypes: dict,
+                         row_filter: Optional[ColumnRange] = None,
+                         row_offsets: Optional[List[int]] = None) -> pd.DataFrame:
+        """Read a range with the XML reader engine, building the DataFrame from column arrays.
         
+        With a row filter, the range positions of the rows kept after the first are
+        appended to row_offsets.
+        """
+        reader = self._get_fast_reader()
+        first_row = None
+        if end_col is None or any(isinstance(key, str) for key in column_dtypes):
+            first_row = reader.read_row(sheet_name, start_row)
+        if end_col is None:
+            end_col = self._last_non_empty_column_in_row(first_row)
         start_col_idx, end_col_idx = self._convert_columns_to_indices(start_col, end_col)
-        data = self._read_cell_range(sheet, start_row, end_row, start_col_idx, end_col_idx)
+        positions = self._resolve_column_positions(start_col_idx, end_col_idx, columns)
+        self._validate_row_filter(row_filter, start_col_idx, end_col_idx)
+        header_row = [self._value_at(first_row or [], start_col_idx + position - 1) for position in positions]
+        slot_dtypes = self._resolve_dtype_slots(column_dtypes, positions, header_row)
+        categorical_positions = [positions[slot] for slot, column_dtype in slot_dtypes.items() if column_dtype == "category"]
+        column_arrays = reader.read_columns(sheet_name, start_row, end_row, start_col_idx, end_col_idx, positions,
+                                            categorical_positions, row_filter, row_offsets)
+        if row_offsets is not None and column_arrays:
+            del row_offsets[max(len(column_arrays[0]) - 1, 0):]
+        return self._apply_column_dtypes(self._create_dataframe_from_columns(column_arrays), slot_dtypes)
+    
+    def _index_by_row_offsets(self, df: pd.DataFrame, row_offsets: List[int]) -> pd.DataFrame:
+        """Label filtered rows as an unfiltered read would, from the range positions of the rows kept after the first."""
+        header_rows = len(row_offsets) + 1 - len(df)
+        df.index = pd.Index(np.asarray([0] + row_offsets, dtype=np.int64)[header_rows:] - header_rows)
+        return df
+    
+    def _get_fast_reader(self) -> XlsxSheetReader:
+        """Return the XML reader for this file, creating it on first use."""
+        if self._fast_reader is None:
+            self._fast_reader = XlsxSheetReader(self.file_path)
+        return self._fast_reader
+    
+    def _merge_column_dtypes(self, categorical_columns: Optional[List[Union[str, int]]],
+                             dtype: Optional[dict]) -> dict:
+        """Combine categorical_columns and dtype into one {column key: dtype} mapping."""
+        column_dtypes = {key: "category" for key in categorical_columns or []}
+        column_dtypes.update(dtype or {})
+        return column_dtypes
+    
+    def _resolve_dtype_slots(self, column_dtypes: dict, positions: List[int], header_row: list) -> dict:
+        """Map dtype keys (header labels or range positions) to output column slots.
+        
+        Args:
+            column_dtypes: Mapping of header label or 0-based range position to dtype
+            positions: 0-based range positions being read, in output order
+            header_row: First row values of the range, in output order
+            
+        Returns:
+            Dictionary mapping output column slot to dtype
+        """
+        slot_dtypes = {}
+        for key, column_dtype in column_dtypes.items():
+            if isinstance(key, str):
+                if key not in header_row:
+                    raise ValueError(f"Column '{key}' is not in the header row of the range")
+                slot = header_row.index(key)
+            else:
+                if key not in positions:
+                    raise ValueError(f"Column position {key} is not among the columns read")
+                slot = positions.index(key)
+            slot_dtypes[slot] = column_dtype
+        return slot_dtypes
+    
+    def _apply_column_dtypes(self, df: pd.DataFrame, slot_dtypes: dict) -> pd.DataFrame:
+        """Convert the columns at the given slots to their requested dtypes.
+        
+        Columns that are already categorical (built by the fast engine) only drop the
+        header row's category when it is no longer used.
+        """
+        for slot, column_dtype in slot_dtypes.items():
+            column = df.iloc[:, slot]
+            if column_dtype == "category" and isinstance(column.dtype, pd.CategoricalDtype):
+                df.isetitem(slot, column.cat.remove_unused_categories())
+            else:
+                df.isetitem(slot, column.astype(column_dtype))
+        return df
+    
+    def _value_at(self, values: list, index: int) -> Any:
+        """Return values[index], or None when the list is shorter."""
+        return values[index] if index < len(values) else None
+    
+    def _validate_row_filter(self, row_filter: Optional[ColumnRange], start_col_idx: int, end_col_idx: int):
+        """Raise if the row filter's column is not within the range being read."""
+        width = end_col_idx - start_col_idx + 1
+        if row_filter is not None and not 0 <= row_filter.position < width:
+            raise ValueError(f"Row filter column position {row_filter.position} is outside the range of {width} columns")
+    
+    def _resolve_column_positions(self, start_col_idx: int, end_col_idx: int, columns: Optional[List[int]]) -> List[int]:
+        """Return the 0-based range positions to read, validating any explicit selection."""
+        width = end_col_idx - start_col_idx + 1
+        if columns is None:
+            return list(range(width))
+        for position in columns:
+            if not 0 <= position < width:
+                raise ValueError(f"Column position {position} is outside the range of {width} columns")
+        return list(columns)
+    
+    def read_sheets_parallel(self, sheet_names: Union[List[str], dict], max_workers: Optional[int] = None,
+                             **range_options) -> dict:
+        """Read several sheets as DataFrames, parsing each sheet in its own worker process.
         
-        return self._create_dataframe_with_headers(data)
+        Each worker opens the workbook read-only and parses one sheet, so wall time
+        scales with the number of cores rather than the number of sheets. Cached
+        ranges are served in this process and only misses are sent to workers.
+        
+        Args:
+            sheet_names: Sheet names to read, or a dict mapping each sheet name to its own
+                readRangeAsDataFrame keyword options
+            max_workers: Maximum number of worker processes (default: one per sheet, up to CPU count)
+            **range_options: readRangeAsDataFrame keyword options shared by every sheet
+            
+        Returns:
+            Dictionary mapping sheet name to DataFrame, in the order requested
+        """
+        self._ensure_workbook_open()
+        if self.workbook is None:
+            raise RuntimeError("Workbook is not open")
+        sheet_requests = self._build_sheet_requests(sheet_names, range_options)
+        
+        results = {}
+        pending = {}
+        for sheet_name, options in sheet_requests.items():
+            cached = self._get_cached_range(sheet_name, self._range_key(**options))
+            if cached is not None:
+                results[sheet_name] = cached
+            else:
+                pending[sheet_name] = options
+        
+        workers = min(len(pending), max_workers or os.cpu_count() or 1)
+        if workers <= 1:
+            for sheet_name, options in pending.items():
+                results[sheet_name] = self.readRangeAsDataFrame(sheet_name=sheet_name, **options)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    sheet_name: executor.submit(_read_sheet_in_worker, self.file_path, sheet_name, options, self.engine)
+                    for sheet_name, options in pending.items()
+                }
+                for sheet_name, future in futures.items():
+                    results[sheet_name] = future.result()
+                    self._put_cached_range(sheet_name, self._range_key(**pending[sheet_name]), results[sheet_name])
+        
+        return {sheet_name: results[sheet_name] for sheet_name in sheet_requests}
+    
+    def _build_sheet_requests(self, sheet_names: Union[List[str], dict], range_options: dict) -> dict:
+        """Combine shared and per-sheet read options, validating that every sheet exists."""
+        if isinstance(sheet_names, dict):
+            sheet_requests = {name: {**range_options, **(options or {})} for name, options in sheet_names.items()}
+        else:
+            sheet_requests = {name: dict(range_options) for name in sheet_names}
+        available = self.get_sheet_names()
+        for sheet_name in sheet_requests:
+            if sheet_name not in available:
+                raise KeyError(f"Worksheet {sheet_name} does not exist.")
+        return sheet_requests
+    
+    def _range_key(self, start_row: Optional[int] = None, end_row: Optional[int] = None,
+                   start_col: Optional[str] = None, end_col: Optional[str] = None,
+                   columns: Optional[List[int]] = None,
+                   categorical_columns: Optional[List[Union[str, int]]] = None,
+                   dtype: Optional[dict] = None, row_filter: Optional[ColumnRange] = None) -> tuple:
+        """Build the cache key for a requested range from readRangeAsDataFrame's arguments and the reader in use."""
+        key = (start_row, end_row, start_col, end_col, tuple(columns) if columns is not None else None)
+        if categorical_columns:
+            key += (("categorical", tuple(categorical_columns)),)
+        if dtype:
+            key += (("dtype", tuple((column, self._dtype_key(column_dtype)) for column, column_dtype in dtype.items())),)
+        if row_filter is not None:
+            key += (("row_filter", repr(row_filter)),)
+        return key + (("reader", self.mode, self.engine),)
+    
+    def _dtype_key(self, column_dtype: Any) -> tuple:
+        """Describe a requested dtype for the cache key, spelling out a categorical dtype's categories and ordering."""
+        if isinstance(column_dtype, pd.CategoricalDtype) and column_dtype.categories is not None:
+            return ("category", tuple(column_dtype.categories), column_dtype.ordered)
+        return (repr(column_dtype),)
+    
+    def _get_cached_range(self, sheet_name: str, range_key: tuple) -> Optional[pd.DataFrame]:
+        """Return the cached DataFrame for the range if a cache is configured and holds it."""
+        if self.cache is None:
+            return None
+        return self.cache.get(self.file_path, sheet_name, range_key)
+    
+    def _put_cached_range(self, sheet_name: str, range_key: tuple, df: pd.DataFrame):
+        """Store a freshly parsed range in the cache, if one is configured."""
+        if self.cache is not None:
+            self.cache.put(self.file_path, sheet_name, range_key, df)
     
     def _ensure_workbook_open(self):
         """Ensure the workbook is open before performing operations."""
         if not self.is_open:
             raise RuntimeError("Spreadsheet must be opened first")
 
+    def _ensure_workbook_writable(self):
+        """Ensure the workbook was not opened in read mode before writing."""
+        if self.is_read_only:
+            raise RuntimeError("Spreadsheet was opened in read mode; use mode='edit' to write")
+
     def _get_sheet_name_or_default(self, sheet_name: Optional[str]) -> str:
         """Get the sheet name or use the first sheet if not specified."""
         if sheet_name is None:
@@ -183,17 +701,72 @@ class SpreadsheetManager:
         end_col_idx = self._column_letter_to_index(end_col)
         return start_col_idx, end_col_idx
 
-    def _read_cell_range(self, sheet, start_row: int, end_row: int, start_col_idx: int, end_col_idx: int) -> list:
-        """Read the specified cell range and return as a list of lists."""
+    def _read_cell_range(self, sheet, start_row: int, end_row: int, start_col_idx: int, positions: List[int],
+                         row_filter: Optional[ColumnRange] = None, row_offsets: Optional[List[int]] = None) -> list:
+        """Read the selected columns of the cell range and return as a list of lists.
+        
+        With a row filter, each row after the first is kept only if its filter cell
+        matches, and the other cells of rejected rows are never read. The range
+        positions of the kept rows after the first are appended to row_offsets.
+        """
+        col_indices = [start_col_idx + position for position in positions]
         data = []
         for row in range(start_row, end_row + 1):
+            if row > start_row and row_filter is not None and not row_filter.matches(
+                    sheet.cell(row=row, column=start_col_idx + row_filter.position).value):
+                continue
+            if row > start_row and row_offsets is not None:
+                row_offsets.append(row - start_row)
             row_data = []
-            for col in range(start_col_idx, end_col_idx + 1):
+            for col in col_indices:
                 cell_value = sheet.cell(row=row, column=col).value
                 row_data.append(cell_value)
             data.append(row_data)
         return data
 
+    def _stream_cell_range(self, sheet, start_row: int, end_row: Optional[int], start_col_idx: int,
+                           end_col_idx: int, positions: List[int], row_filter: Optional[ColumnRange] = None,
+                           row_offsets: Optional[List[int]] = None) -> list:
+        """Stream the cell range with iter_rows and return the selected columns as a list of lists.
+        
+        When end_row is None the range ends at the last row whose first column is
+        non-empty, matching _find_last_non_empty_row without a backwards cell scan.
+        Trailing rows are only buffered until the next non-empty first cell is seen.
+        """
+        rows = sheet.iter_rows(min_row=start_row, max_row=end_row,
+                               min_col=start_col_idx, max_col=end_col_idx, values_only=True)
+        if end_row is None:
+            rows = self._iter_rows_to_last_key(rows, start_row)
+        return list(self._iter_selected_rows(rows, positions, row_filter, row_offsets))
+    
+    def _iter_selected_rows(self, rows: Iterable[tuple], positions: List[int],
+                            row_filter: Optional[ColumnRange] = None,
+                            row_offsets: Optional[List[int]] = None) -> Iterator[list]:
+        """Yield the selected columns of each row, dropping rows after the first that fail the row filter.
+        
+        The positions of the kept rows after the first are appended to row_offsets.
+        """
+        for index, row in enumerate(rows):
+            if index and row_filter is not None and not row_filter.matches(row[row_filter.position]):
+                continue
+            if index and row_offsets is not None:
+                row_offsets.append(index)
+            yield [row[position] for position in positions]
+    
+    def _iter_rows_to_last_key(self, rows: Iterable[tuple], start_row: int) -> Iterator[tuple]:
+        """Yield the rows up to the last row whose first column is non-empty."""
+        pending: list = []
+        found_key = False
+        for row in rows:
+            pending.append(row)
+            if not self._is_cell_empty(row[0]):
+                yield from pending
+                pending = []
+                found_key = True
+        if not found_key and start_row == 1:
+            # An empty key column auto-detects to row 1, as in _find_last_non_empty_row
+            yield from pending[:1]
+
     def _create_dataframe_with_headers(self, data: list) -> pd.DataFrame:
         """Create a DataFrame from data and set headers if appropriate."""
         df = pd.DataFrame(data)
@@ -201,6 +774,18 @@ class SpreadsheetManager:
             df.columns = df.iloc[0]
             df = df.iloc[1:].reset_index(drop=True)
         return df
+    
+    def _create_dataframe_from_columns(self, column_arrays: list) -> pd.DataFrame:
+        """Create a DataFrame from per-column object arrays, with the same dtypes and headers as row data."""
+        if not column_arrays or len(column_arrays[0]) == 0:
+            return self._create_dataframe_with_headers([])
+        df = pd.DataFrame(dict(enumerate(column_arrays))).infer_objects()
+        df.columns = pd.RangeIndex(len(column_arrays))
+        first_row = [None if pd.isna(value) else value for value in df.iloc[0]]
+        if self._should_use_first_row_as_headers(first_row):
+            df.columns = df.iloc[0]
+            df = df.iloc[1:].reset_index(drop=True)
+        return df
 
     def _should_use_first_row_as_headers(self, first_row: list) -> bool:
         """Determine if the first row should be used as column headers."""
@@ -217,32 +802,76 @@ class SpreadsheetManager:
             include_headers: Whether to include DataFrame column headers (default: True)
         """
         self._ensure_workbook_open()
+        self._ensure_workbook_writable()
         if self.workbook is None:
             raise RuntimeError("Workbook is not open")
         sheet = self.workbook[sheet_name]
+        self._sheet_extents.pop(sheet_name, None)
         start_row, start_col = self._parse_cell_address(start_cell)
         data_start_row = self._write_headers_if_requested(sheet, df, start_row, start_col, include_headers)
         self._write_data_rows(sheet, df, data_start_row, start_col)
         self._save_workbook()
     
+    @contextmanager
+    def batch(self) -> Iterator["SpreadsheetManager"]:
+        """Defer saving until the end of the block, so many writes cost one save.
+        
+        Writes inside the block update the in-memory workbook only; the file is
+        written once when the outermost batch exits normally. If the block raises,
+        nothing is saved. Batches can be nested.
+        
+        Yields:
+            This SpreadsheetManager
+        """
+        self._ensure_workbook_open()
+        self._ensure_workbook_writable()
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            if self._batch_depth == 1:
+                self._save_pending = False
+            raise
+        finally:
+            self._batch_depth -= 1
+        if self._batch_depth == 0 and self._save_pending:
+            self._save_pending = False
+            self._save_workbook()
+    
     def _write_headers_if_requested(self, sheet, df: pd.DataFrame, start_row: int, start_col: int, include_headers: bool) -> int:
         """Write headers if requested and return the starting row for data."""
         if include_headers:
-            for col_idx, header in enumerate(df.columns):
-                cell_address = self._get_cell_address(start_row, start_col + col_idx)
-                sheet[cell_address] = header
+            self._write_rows(sheet, [list(df.columns)], start_row, start_col)
             return start_row + 1
         return start_row
 
     def _write_data_rows(self, sheet, df: pd.DataFrame, data_start_row: int, start_col: int):
         """Write all data rows to the sheet."""
-        for row_idx, row_data in enumerate(df.values):
-            for col_idx, value in enumerate(row_data):
-                cell_address = self._get_cell_address(data_start_row + row_idx, start_col + col_idx)
-                sheet[cell_address] = value
+        self._write_rows(sheet, df.values, data_start_row, start_col)
+
+    def _write_rows(self, sheet, rows, start_row: int, start_col: int):
+        """Write rows of values with their first value at (start_row, start_col).
+        
+        The first row is written cell by cell with integer coordinates. When it is on
+        or below the sheet's last row, the rows after it are appended with ws.append;
+        otherwise every row is written cell by cell.
+        """
+        # ws.append writes to the row after the highest row openpyxl has created a cell in.
+        # Once the first row is written on or below max_row it is that highest row, so each
+        # appended row lands directly below the one before it.
+        append_rest = start_row >= sheet.max_row
+        for row_offset, row_data in enumerate(rows):
+            if row_offset and append_rest:
+                sheet.append({start_col + col_offset: value for col_offset, value in enumerate(row_data)})
+                continue
+            for col_offset, value in enumerate(row_data):
+                sheet.cell(row=start_row + row_offset, column=start_col + col_offset).value = value
 
     def _save_workbook(self):
-        """Save the workbook to persist changes."""
+        """Save the workbook to persist changes, or mark it for saving at the end of a batch."""
+        if self._batch_depth > 0:
+            self._save_pending = True
+            return
         if self.workbook:
             self.workbook.save(self.file_path)
     
@@ -264,30 +893,67 @@ class SpreadsheetManager:
             raise ValueError(f"Invalid cell address: {cell_address}")
         return match
     
-    def _get_cell_address(self, row: int, col: int) -> str:
-        """Convert row and column indices to cell address."""
-        col_letter = self._column_index_to_letter(col)
-        return f"{col_letter}{row}"
-    
     def _find_last_non_empty_column(self, sheet, row: int) -> str:
         """Find the last non-empty column in a given row."""
-        max_col = sheet.max_column
-        for col in range(max_col, 0, -1):
-            cell_value = sheet.cell(row=row, column=col).value
-            if not self._is_cell_empty(cell_value):
+        if self.is_read_only:
+            return self._find_last_non_empty_column_in_stream(sheet, row)
+        last_column = self._get_sheet_extents(sheet).last_column_by_row.get(row)
+        return self._column_index_to_letter(last_column) if last_column else 'A'
+    
+    def _find_last_non_empty_column_in_stream(self, sheet, row: int) -> str:
+        """Find the last non-empty column in a given row by streaming that single row."""
+        row_values = next(sheet.iter_rows(min_row=row, max_row=row, values_only=True), ())
+        return self._last_non_empty_column_in_row(row_values)
+    
+    def _last_non_empty_column_in_row(self, row_values) -> str:
+        """Return the letter of the last non-empty value in a row of values."""
+        for col in range(len(row_values), 0, -1):
+            if not self._is_cell_empty(row_values[col - 1]):
                 return self._column_index_to_letter(col)
         return 'A'
     
     def _find_last_non_empty_row(self, sheet, column: str) -> int:
         """Find the last non-empty row in a given column."""
-        max_row = sheet.max_row
         col_idx = self._column_letter_to_index(column)
+        return self._get_sheet_extents(sheet).last_row_by_column.get(col_idx, 1)
+    
+    def _get_sheet_extents(self, sheet) -> _SheetExtents:
+        """Return the populated-cell index of a sheet, building it on first use."""
+        extents = self._sheet_extents.get(sheet.title)
+        if extents is None:
+            extents = self._build_sheet_extents(sheet)
+            self._sheet_extents[sheet.title] = extents
+        return extents
+    
+    def _build_sheet_extents(self, sheet) -> _SheetExtents:
+        """Record the last non-empty row of each column and column of each row of a loaded sheet."""
+        extents = _SheetExtents(max_row=sheet.max_row)
+        for row, col, value in self._iter_stored_values(sheet):
+            if self._is_cell_empty(value):
+                continue
+            if row > extents.last_row_by_column.get(col, 0):
+                extents.last_row_by_column[col] = row
+            if col > extents.last_column_by_row.get(row, 0):
+                extents.last_column_by_row[row] = col
+        return extents
+    
+    def _iter_stored_values(self, sheet) -> Iterator[tuple]:
+        """Yield (row, column, value) for the cells of a loaded sheet.
         
-        for row in range(max_row, 0, -1):
-            cell_value = sheet.cell(row=row, column=col_idx).value
-            if not self._is_cell_empty(cell_value):
-                return row
-        return 1
+        Where openpyxl keeps its cells in the Worksheet._cells dict (every version
+        allowed by pyproject.toml), only the cells it holds are visited, so formatting
+        applied to a large empty range is not scanned; iter_rows would create a cell
+        for every coordinate of that range. Without that dict, the sheet is walked
+        with iter_rows up to max_row and max_column.
+        """
+        cells = getattr(sheet, "_cells", None)
+        if isinstance(cells, dict):
+            for (row, col), cell in cells.items():
+                yield row, col, cell.value
+            return
+        for row, values in enumerate(sheet.iter_rows(min_row=1, min_col=1, values_only=True), start=1):
+            for col, value in enumerate(values, start=1):
+                yield row, col, value
     
     def _column_letter_to_index(self, column: str) -> int:
         """Convert column letter to index (A=1, B=2, etc.)."""
@@ -312,4 +978,10 @@ class SpreadsheetManager:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        self.close()
\ No newline at end of file
+        self.close()
+
+
+def _read_sheet_in_worker(file_path: Path, sheet_name: str, range_options: dict, engine: str) -> pd.DataFrame:
+    """Parse one sheet in a worker process using a private read-only workbook."""
+    with SpreadsheetManager(file_path, mode="read", engine=engine) as manager:
+        return manager.readRangeAsDataFrame(sheet_name=sheet_name, **range_options)
@@ -0,0 +1,170 @@
+from dataclasses import asdict
+from pathlib import Path
+from typing import Optional, Any
+import json
+from .chat_thread import ChatThread, Message
+from .utils.disk_cache import file_sha256, file_size, text_sha256, touch, evict_least_recently_used, write_atomically
+
+
+class ThreadCache:
+    """Persistent on-disk cache of ChatThreads parsed from .eml files.
+
+    Entries are keyed on the hash of the file's contents together with the
+    version of the parser that produced them, so unchanged files are served
+    without parsing them again wherever they are stored. Files the parser
+    rejected are stored too, so they are not parsed again either. The first
+    entry a cache instance stores for a parser version removes every entry
+    written by other versions. Entries are stored as JSON records and evicted
+    least-recently-used once their total size exceeds max_bytes; the total is
+    read from disk once and then kept up to date as entries are stored.
+    """
+
+    DEFAULT_CACHE_DIR = Path("data/processed/.cache/threads")
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+    ENTRY_SUFFIX = ".json"
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize the ThreadCache.
+
+        Args:
+            cache_dir: Directory holding cache entries. Defaults to data/processed/.cache/threads
+            max_bytes: Maximum total size of all entries before LRU eviction
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else self.DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self._content_hashes: dict[tuple, str] = {}
+        # Entry name prefixes of the parser versions whose stale entries were removed
+        self._swept_versions: set[str] = set()
+        # Total size of the entries, read from disk when the first entry is stored
+        self._total_bytes: Optional[int] = None
+
+    def get(self, file_path: Path, parser_version: Any) -> Optional[ChatThread]:
+        """Return the cached thread parsed from a file, or None on a miss.
+
+        Args:
+            file_path: Path to the .eml file
+            parser_version: Version of the parser the entry must have been written by
+
+        Returns:
+            The cached ChatThread, or None if these file contents are not cached for this parser version
+            
+        Raises:
+            ValueError: If the parser rejected these file contents, with the error recorded by put_failure
+        """
+        entry_path = self._entry_path(file_path, parser_version)
+        if not entry_path.exists():
+            return None
+        try:
+            record = json.loads(entry_path.read_text(encoding='utf-8'))
+            thread = None if 'error' in record else self._thread_from_record(record)
+        except Exception:
+            # Unreadable entries (partial writes, changed record layout) count as misses
+            entry_path.unlink(missing_ok=True)
+            return None
+        touch(entry_path)
+        if thread is None:
+            raise ValueError(record['error'])
+        return thread
+
+    def put(self, file_path: Path, parser_version: Any, thread: ChatThread) -> None:
+        """Store the thread parsed from a file and evict stale or excess entries.
+
+        Args:
+            file_path: Path to the .eml file
+            parser_version: Version of the parser that produced the thread
+            thread: ChatThread parsed from the file
+        """
+        self._store(file_path, parser_version, self._thread_record(thread))
+
+    def put_failure(self, file_path: Path, parser_version: Any, error: str) -> None:
+        """Record that the parser rejected a file, so get raises the error instead of it being parsed again.
+
+        The error is returned as recorded, so for a copy of the file stored
+        elsewhere it names the path it was first rejected at.
+
+        Args:
+            file_path: Path to the .eml file
+            parser_version: Version of the parser that rejected the file
+            error: Message of the parser's ValueError
+        """
+        self._store(file_path, parser_version, {'error': error})
+
+    def _store(self, file_path: Path, parser_version: Any, record: dict) -> None:
+        """Write an entry's record, then evict entries if that took the total size past max_bytes."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry_path = self._entry_path(file_path, parser_version)
+        version_prefix = entry_path.name.split("-", 1)[0] + "-"
+        if version_prefix not in self._swept_versions:
+            self._remove_other_versions(version_prefix)
+            self._swept_versions.add(version_prefix)
+            self._total_bytes = None
+        if self._total_bytes is None:
+            self._total_bytes = self.total_bytes()
+        contents = json.dumps(record).encode('utf-8')
+        replaced_size = file_size(entry_path)
+        write_atomically(entry_path, lambda temp_path: temp_path.write_bytes(contents))
+        self._total_bytes += len(contents) - replaced_size
+        if self._total_bytes > self.max_bytes:
+            evict_least_recently_used(self._entries(), self.max_bytes)
+            self._total_bytes = self.total_bytes()
+
+    def invalidate(self) -> int:
+        """Remove all cached entries.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        for entry in self._entries():
+            entry.unlink(missing_ok=True)
+            removed += 1
+        self._content_hashes.clear()
+        self._total_bytes = None
+        return removed
+
+    def total_bytes(self) -> int:
+        """Return the total size in bytes of all cached entries."""
+        return sum(entry.stat().st_size for entry in self._entries())
+
+    def _entries(self, pattern: str = "*") -> list[Path]:
+        """List cache entry files matching the glob pattern."""
+        if not self.cache_dir.exists():
+            return []
+        return list(self.cache_dir.glob(f"{pattern}{self.ENTRY_SUFFIX}"))
+
+    def _remove_other_versions(self, version_prefix: str):
+        """Delete entries whose names do not start with the current parser version's prefix."""
+        for entry in self._entries():
+            if not entry.name.startswith(version_prefix):
+                entry.unlink(missing_ok=True)
+
+    def _entry_path(self, file_path: Path, parser_version: Any) -> Path:
+        """Build the entry file name as <parser version digest>-<content digest>."""
+        version_digest = text_sha256(repr(parser_version))[:16]
+        return self.cache_dir / f"{version_digest}-{self._content_hash(file_path)}{self.ENTRY_SUFFIX}"
+
+    def _content_hash(self, file_path: Path) -> str:
+        """Return the file's content hash, rehashing only when its size or mtime changes."""
+        resolved = Path(file_path).resolve()
+        stat = resolved.stat()
+        stat_key = (str(resolved), stat.st_size, stat.st_mtime_ns)
+        if stat_key not in self._content_hashes:
+            self._content_hashes[stat_key] = file_sha256(resolved)
+        return self._content_hashes[stat_key]
+
+    def _thread_record(self, thread: ChatThread) -> dict:
+        """Convert a thread into a JSON-serializable record."""
+        return {
+            'metadata': {key: str(value) for key, value in thread.get_metadata().items()},
+            'messages': [asdict(message) for message in thread.get_messages()],
+            'attachments': thread.get_attachments()
+        }
+
+    def _thread_from_record(self, record: dict) -> ChatThread:
+        """Rebuild a thread from its cached record."""
+        thread = ChatThread(**record['metadata'])
+        for message in record['messages']:
+            thread.add_message(Message(**message))
+        for attachment_id, attachment_data in record['attachments'].items():
+            thread.add_attachment(attachment_id, attachment_data)
+        return thread
@@ -0,0 +1,94 @@
+"""
+Helpers shared by the on-disk caches.
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Iterable
+
+
+def file_sha256(file_path: Path, block_size: int = 1024 * 1024) -> str:
+    """Return the hex SHA-256 digest of a file's contents, read in blocks."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def text_sha256(text: str) -> str:
+    """Return the hex SHA-256 digest of a string."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def file_size(path: Path) -> int:
+    """Return the size of a file in bytes, or 0 if it does not exist."""
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def touch(entry_path: Path) -> None:
+    """Mark a cache entry as recently used by bumping its modification time."""
+    try:
+        os.utime(entry_path)
+    except OSError:
+        pass
+
+
+def write_atomically(entry_path: Path, write: Callable[[Path], None]) -> None:
+    """Write a cache entry to a temporary file of its own, then move it into place.
+    
+    Every writer gets a uniquely named temporary file next to the entry, so writers
+    storing the same entry at once never share one. If moving it into place fails
+    while another writer's copy of the entry is already there, that copy is kept.
+    
+    Args:
+        entry_path: Final path of the cache entry
+        write: Function writing the entry's contents to the path it is given
+    """
+    fd, temp_name = tempfile.mkstemp(dir=entry_path.parent, prefix=f"{entry_path.stem}.", suffix=".tmp")
+    os.close(fd)
+    temp_path = Path(temp_name)
+    try:
+        write(temp_path)
+        try:
+            temp_path.replace(entry_path)
+        except OSError:
+            if not entry_path.exists():
+                raise
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def evict_least_recently_used(entries: Iterable[Path], max_bytes: int) -> int:
+    """Delete the least recently used entries until their total size fits in max_bytes.
+    
+    Args:
+        entries: Cache entry files to consider
+        max_bytes: Maximum total size to keep
+        
+    Returns:
+        Number of entries deleted
+    """
+    stats = []
+    for entry in entries:
+        try:
+            stats.append((entry.stat(), entry))
+        except OSError:
+            continue
+    total = sum(stat.st_size for stat, _ in stats)
+    removed = 0
+    for stat, entry in sorted(stats, key=lambda item: item[0].st_mtime_ns):
+        if total <= max_bytes:
+            break
+        try:
+            entry.unlink()
+        except OSError:
+            continue
+        total -= stat.st_size
+        removed += 1
+    return removed
@@ -0,0 +1,481 @@
+from functools import cached_property
+from pathlib import Path, PurePosixPath
+from typing import Optional, List, Any, Iterator, Tuple
+from xml.etree.ElementTree import iterparse, fromstring
+import zipfile
+import numpy as np
+import pandas as pd
+from openpyxl.cell.text import Text
+from openpyxl.formula.translate import Translator
+from openpyxl.reader.strings import read_string_table
+from openpyxl.styles.stylesheet import Stylesheet
+from openpyxl.utils.cell import column_index_from_string, coordinate_to_tuple, get_column_letter
+from openpyxl.utils.datetime import from_excel, from_ISO8601, CALENDAR_WINDOWS_1900, CALENDAR_MAC_1904
+from openpyxl.worksheet.formula import ArrayFormula, DataTableFormula
+from .row_filter import ColumnRange
+
+
+SHEET_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+OFFICE_REL_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+
+ROW_TAG = f"{SHEET_NS}row"
+CELL_TAG = f"{SHEET_NS}c"
+VALUE_TAG = f"{SHEET_NS}v"
+FORMULA_TAG = f"{SHEET_NS}f"
+INLINE_STRING_TAG = f"{SHEET_NS}is"
+TEXT_TAG = f"{SHEET_NS}t"
+DIMENSION_TAG = f"{SHEET_NS}dimension"
+SHEET_DATA_TAG = f"{SHEET_NS}sheetData"
+
+
+class XlsxSheetReader:
+    """Reads cell values straight from the sheet XML of an .xlsx/.xlsm package.
+
+    Rows are parsed incrementally with iterparse and values are written directly
+    into preallocated NumPy column arrays, without creating openpyxl Cell objects.
+    Values follow openpyxl's conventions: shared and inline strings are resolved,
+    date-styled numbers become datetimes, and formula cells come back as their
+    "=..." text (shared formulas are translated, as openpyxl does).
+    """
+
+    def __init__(self, file_path: Path):
+        """Open the package and read the workbook-level metadata.
+
+        Args:
+            file_path: Path to the .xlsx/.xlsm file
+        """
+        self.file_path = Path(file_path)
+        self._archive = zipfile.ZipFile(self.file_path)
+        workbook_path = self._find_workbook_path()
+        workbook_rels = self._read_relationships(workbook_path)
+        workbook_xml = fromstring(self._archive.read(workbook_path))
+
+        self._sheet_paths = {}
+        for sheet in workbook_xml.iter(f"{SHEET_NS}sheet"):
+            self._sheet_paths[sheet.get("name")] = workbook_rels[sheet.get(OFFICE_REL_ID)][1]
+
+        workbook_properties = workbook_xml.find(f"{SHEET_NS}workbookPr")
+        is_1904 = workbook_properties is not None and workbook_properties.get("date1904") in ("1", "true")
+        self._epoch = CALENDAR_MAC_1904 if is_1904 else CALENDAR_WINDOWS_1900
+
+        self._workbook_rels = workbook_rels
+        date_styles, self._timedelta_styles = self._read_date_styles(workbook_rels)
+        self._date_style_ids = {str(style_id) for style_id in date_styles}
+        self._column_indices: dict[str, int] = {}
+
+    @property
+    def sheet_names(self) -> List[str]:
+        """Names of the worksheets in workbook order."""
+        return list(self._sheet_paths)
+
+    def close(self) -> None:
+        """Close the underlying zip archive."""
+        self._archive.close()
+
+    def sheet_signatures(self) -> dict:
+        """Return each worksheet's (CRC-32, size) of its stored XML, taken from the zip directory.
+
+        Signatures compare equal exactly when a sheet's XML is unchanged, so changed
+        sheets can be found without parsing any of them.
+        """
+        signatures = {}
+        for sheet_name, part_path in self._sheet_paths.items():
+            info = self._archive.getinfo(part_path)
+            signatures[sheet_name] = (info.CRC, info.file_size)
+        return signatures
+
+    @cached_property
+    def _shared_strings(self) -> list:
+        """The shared strings table, read on first use."""
+        return self._read_shared_strings(self._workbook_rels)
+
+    def read_row(self, sheet_name: str, row: int) -> list:
+        """Return the values of a single row, up to its last stored cell."""
+        for row_idx, cells in self._iter_row_elements(sheet_name, max_row=row):
+            if row_idx == row:
+                values: list = []
+                for column, cell in self._iter_cells(cells):
+                    values.extend([None] * (column - len(values) - 1))
+                    values.append(self._cell_value(cell, row_idx, column))
+                return values
+        return []
+
+    def iter_rows(self, sheet_name: str, start_row: int, end_row: Optional[int],
+                  start_col_idx: int, end_col_idx: int) -> Iterator[tuple]:
+        """Yield the values of each row of a rectangular range as a tuple.
+
+        Rows missing from the sheet XML come back as empty rows, as with openpyxl's
+        iter_rows. With an end_row, rows past the last stored row are filled in too;
+        without one, iteration stops at the last stored row.
+
+        Args:
+            sheet_name: Name of the sheet to read
+            start_row: First row of the range (1-based)
+            end_row: Last row of the range, or None for the last stored row
+            start_col_idx: First column of the range (1-based)
+            end_col_idx: Last column of the range (1-based)
+        """
+        width = end_col_idx - start_col_idx + 1
+        empty_row = (None,) * width
+        next_row = start_row
+        for row_idx, cells in self._iter_row_elements(sheet_name, min_row=start_row, max_row=end_row):
+            for _ in range(next_row, row_idx):
+                yield empty_row
+            values = [None] * width
+            for column, cell in self._iter_cells(cells):
+                if column > end_col_idx:
+                    break
+                if column >= start_col_idx:
+                    values[column - start_col_idx] = self._cell_value(cell, row_idx, column)
+            next_row = row_idx + 1
+            yield tuple(values)
+        if end_row is not None:
+            for _ in range(next_row, end_row + 1):
+                yield empty_row
+
+    def read_columns(self, sheet_name: str, start_row: int, end_row: Optional[int],
+                     start_col_idx: int, end_col_idx: int, positions: List[int],
+                     categorical_positions: Optional[List[int]] = None,
+                     row_filter: Optional[ColumnRange] = None,
+                     row_offsets: Optional[List[int]] = None) -> List[Any]:
+        """Read the selected columns of a rectangular range into object arrays.
+
+        When end_row is None the range ends at the last row whose first column is
+        non-empty, with the same rules as SpreadsheetManager's auto-detection.
+        With a row_filter, rows after the first are stored only when their filter
+        cell matches; the other cells of rejected rows are never converted.
+
+        Args:
+            sheet_name: Name of the sheet to read
+            start_row: First row of the range (1-based)
+            end_row: Last row of the range, or None to auto-detect
+            start_col_idx: First column of the range (1-based)
+            end_col_idx: Last column of the range (1-based)
+            positions: 0-based positions within the range to return, in output order
+            categorical_positions: Positions to return as pd.Categorical, built from
+                the shared strings table indices rather than from the string values,
+                whenever every value in the column is a shared string
+            row_filter: Range check on one column position applied to every row
+                after the first
+            row_offsets: With a row_filter, receives the position within the range
+                (row - start_row) of each stored row after the first, in order
+
+        Returns:
+            One object array (or Categorical) per selected position, each holding one
+            value per row
+        """
+        slots = {start_col_idx + position: slot for slot, position in enumerate(positions)}
+        coded_slots = {slots[start_col_idx + position] for position in categorical_positions or []
+                       if start_col_idx + position in slots}
+        capacity = self._initial_capacity(sheet_name, start_row, end_row)
+        columns = [np.full(capacity, None, dtype=object) for _ in positions]
+        codes = {slot: np.full(capacity, -1, dtype=np.int32) for slot in coded_slots}
+        rows_seen = 0
+        last_key_row = -1
+        # With a filter, matching rows are packed after the first row's slot
+        next_offset = 1
+        filter_column = start_col_idx + row_filter.position if row_filter is not None else None
+
+        for row_idx, cells in self._iter_row_elements(sheet_name, min_row=start_row, max_row=end_row):
+            if row_filter is None or row_idx == start_row:
+                offset = row_idx - start_row
+            else:
+                probed = self._probe_cells(cells, row_idx, (filter_column, start_col_idx))
+                if not row_filter.matches(probed.get(filter_column)):
+                    self._record_shared_formulae(cells, row_idx)
+                    rows_seen = max(rows_seen, 1)
+                    if end_row is None and not self._is_empty(probed.get(start_col_idx)):
+                        last_key_row = next_offset - 1
+                    continue
+                offset = next_offset
+                next_offset += 1
+                if row_offsets is not None:
+                    row_offsets.append(row_idx - start_row)
+            if offset >= capacity:
+                capacity = max(capacity * 2, offset + 1)
+                columns = [self._grow(column, capacity) for column in columns]
+                codes = {slot: self._grow(slot_codes, capacity, -1) for slot, slot_codes in codes.items()}
+            rows_seen = max(rows_seen, offset + 1)
+            for column, cell in self._iter_cells(cells):
+                if column > end_col_idx:
+                    break
+                is_key = column == start_col_idx
+                if column not in slots and not is_key:
+                    continue
+                value = self._cell_value(cell, row_idx, column)
+                if column in slots:
+                    slot = slots[column]
+                    columns[slot][offset] = value
+                    if slot in codes:
+                        codes[slot][offset] = self._shared_string_index(cell)
+                if is_key and end_row is None and not self._is_empty(value):
+                    last_key_row = offset
+
+        if end_row is not None and row_filter is not None:
+            length = next_offset
+        elif end_row is not None:
+            length = end_row - start_row + 1
+            if length > capacity:
+                columns = [self._grow(column, length) for column in columns]
+                codes = {slot: self._grow(slot_codes, length, -1) for slot, slot_codes in codes.items()}
+        elif last_key_row >= 0:
+            length = last_key_row + 1
+        else:
+            # An empty key column auto-detects to row 1, as in _find_last_non_empty_row
+            length = 1 if start_row == 1 and rows_seen > 0 else 0
+        length = max(length, 0)
+        return [
+            self._categorical_from_codes(column[:length], codes[slot][:length]) if slot in codes else column[:length]
+            for slot, column in enumerate(columns)
+        ]
+
+    def _probe_cells(self, row_element, row: int, columns: Tuple[int, ...]) -> dict:
+        """Convert only the cells of a row in the given columns, as {column: value}."""
+        last_column = max(columns)
+        values = {}
+        for column, cell in self._iter_cells(row_element):
+            if column > last_column:
+                break
+            if column in columns:
+                values[column] = self._cell_value(cell, row, column)
+        return values
+
+    def _shared_string_index(self, cell) -> int:
+        """Return the shared strings table index of a plain shared-string cell, or -1."""
+        if cell.get("t") != "s":
+            return -1
+        value = None
+        for child in cell:
+            if child.tag == FORMULA_TAG:
+                return -1
+            if child.tag == VALUE_TAG:
+                value = child.text
+        return int(value) if value else -1
+
+    def _categorical_from_codes(self, values: np.ndarray, codes: np.ndarray) -> Any:
+        """Build a Categorical from shared string indices, matching pd.Categorical(values).
+
+        Categories are the distinct shared strings used, in sorted order. Columns that
+        also hold values outside the shared strings table are returned as plain object
+        arrays, leaving the conversion to the caller.
+        """
+        coded = codes >= 0
+        present = pd.notna(values)
+        if not np.array_equal(coded, present):
+            return values
+        used, inverse = np.unique(codes[coded], return_inverse=True)
+        labels = np.array([self._shared_strings[index] for index in used], dtype=object)
+        categories, label_codes = np.unique(labels, return_inverse=True)
+        category_codes = np.full(len(codes), -1, dtype=np.int32)
+        category_codes[coded] = label_codes.reshape(-1)[inverse.reshape(-1)]
+        return pd.Categorical.from_codes(category_codes, categories=categories)
+
+    def _iter_row_elements(self, sheet_name: str, min_row: int = 1,
+                           max_row: Optional[int] = None) -> Iterator[Tuple[int, Any]]:
+        """Yield (row number, row element) pairs between min_row and max_row.
+
+        Rows before min_row are skipped without converting their cells, but shared
+        formula definitions in them are still recorded so later cells translate.
+        """
+        if sheet_name not in self._sheet_paths:
+            raise KeyError(f"Worksheet {sheet_name} does not exist.")
+        self._shared_formulae: dict[str, Translator] = {}
+        row_counter = 0
+        with self._archive.open(self._sheet_paths[sheet_name]) as source:
+            # Only end events are requested: start events double the parser callbacks.
+            # Each row is cleared once handled, leaving just an empty shell behind.
+            for _, element in iterparse(source, events=("end",)):
+                if element.tag != ROW_TAG:
+                    continue
+                row_attribute = element.get("r")
+                row_counter = int(float(row_attribute)) if row_attribute else row_counter + 1
+                if max_row is not None and row_counter > max_row:
+                    break
+                if row_counter >= min_row:
+                    yield row_counter, element
+                else:
+                    self._record_shared_formulae(element, row_counter)
+                element.clear()
+
+    def _iter_cells(self, row_element) -> Iterator[Tuple[int, Any]]:
+        """Yield (column index, cell element) pairs for a row element."""
+        column = 0
+        for cell in row_element:
+            if cell.tag != CELL_TAG:
+                continue
+            reference = cell.get("r")
+            column = self._column_from_reference(reference) if reference else column + 1
+            yield column, cell
+
+    def _cell_value(self, cell, row: int, column: int) -> Any:
+        """Convert a cell element to a Python value using openpyxl's rules."""
+        value = formula = inline = None
+        for child in cell:
+            tag = child.tag
+            if tag == VALUE_TAG:
+                value = child.text
+            elif tag == FORMULA_TAG:
+                formula = child
+            elif tag == INLINE_STRING_TAG:
+                inline = child
+        if formula is not None:
+            return self._formula_value(formula, cell.get("r") or self._reference(row, column))
+
+        data_type = cell.get("t", "n")
+        if data_type == "inlineStr":
+            return None if inline is None else self._inline_string(inline)
+        if not value:
+            return None
+        if data_type == "n":
+            number = self._cast_number(value)
+            style_id = cell.get("s")
+            if style_id is not None and style_id in self._date_style_ids:
+                try:
+                    return from_excel(number, self._epoch, timedelta=int(style_id) in self._timedelta_styles)
+                except (OverflowError, ValueError):
+                    return "#VALUE!"
+            return number
+        if data_type == "s":
+            return self._shared_strings[int(value)]
+        if data_type == "b":
+            return bool(int(value))
+        if data_type == "d":
+            return from_ISO8601(value)
+        return value
+
+    def _inline_string(self, inline) -> str:
+        """Return the text of an <is> element, parsing rich text runs only when present."""
+        if len(inline) == 1 and inline[0].tag == TEXT_TAG:
+            return inline[0].text or ""
+        return Text.from_tree(inline).content
+
+    def _formula_value(self, formula, reference: str) -> Any:
+        """Return the formula text for a cell, translating shared formulas."""
+        formula_type = formula.get("t")
+        value = "=" + (formula.text or "")
+        if formula_type == "array":
+            return ArrayFormula(ref=formula.get("ref"), text=value)
+        if formula_type == "shared":
+            shared_index = formula.get("si")
+            if shared_index in self._shared_formulae:
+                return self._shared_formulae[shared_index].translate_formula(reference)
+            if value != "=":
+                self._shared_formulae[shared_index] = Translator(value, reference)
+        elif formula_type == "dataTable":
+            return DataTableFormula(**formula.attrib)
+        return value
+
+    def _record_shared_formulae(self, row_element, row: int):
+        """Remember shared formula definitions from a row that is otherwise skipped."""
+        for column, cell in self._iter_cells(row_element):
+            formula = cell.find(FORMULA_TAG)
+            if formula is not None and formula.get("t") == "shared":
+                self._formula_value(formula, cell.get("r") or self._reference(row, column))
+
+    def _column_from_reference(self, reference: str) -> int:
+        """Return the column index of an A1 reference, caching the letter lookups."""
+        letters = reference.rstrip("0123456789")
+        if letters not in self._column_indices:
+            self._column_indices[letters] = column_index_from_string(letters)
+        return self._column_indices[letters]
+
+    def _reference(self, row: int, column: int) -> str:
+        """Build an A1 reference for a cell without an explicit r attribute."""
+        return f"{get_column_letter(column)}{row}"
+
+    def _initial_capacity(self, sheet_name: str, start_row: int, end_row: Optional[int]) -> int:
+        """Size the column arrays from end_row or the sheet's <dimension> element."""
+        if end_row is not None:
+            return max(end_row - start_row + 1, 0)
+        dimension_rows = self._dimension_max_row(sheet_name)
+        if dimension_rows is not None:
+            return max(dimension_rows - start_row + 1, 1)
+        return 1024
+
+    def _dimension_max_row(self, sheet_name: str) -> Optional[int]:
+        """Read the last row of the sheet's <dimension ref>, without parsing sheet data."""
+        with self._archive.open(self._sheet_paths[sheet_name]) as source:
+            for _, element in iterparse(source, events=("start",)):
+                if element.tag == DIMENSION_TAG:
+                    reference = element.get("ref", "").split(":")[-1]
+                    try:
+                        return coordinate_to_tuple(reference)[0]
+                    except (ValueError, TypeError):
+                        return None
+                if element.tag == SHEET_DATA_TAG:
+                    return None
+        return None
+
+    def _grow(self, column: np.ndarray, capacity: int, fill: Any = None) -> np.ndarray:
+        """Return a copy of the column array extended to capacity with the fill value."""
+        grown = np.full(capacity, fill, dtype=column.dtype)
+        grown[:len(column)] = column
+        return grown
+
+    def _cast_number(self, value: str):
+        """Convert a numeric string to int or float, as openpyxl does."""
+        if "." in value or "E" in value or "e" in value:
+            return float(value)
+        return int(value)
+
+    def _is_empty(self, value: Any) -> bool:
+        """Check if a cell value is considered empty."""
+        return value is None or str(value).strip() == ""
+
+    def _find_workbook_path(self) -> str:
+        """Locate the workbook part from the package relationships."""
+        for relationship_type, target in self._read_relationships("").values():
+            if relationship_type.endswith("/officeDocument"):
+                return target
+        return "xl/workbook.xml"
+
+    def _read_relationships(self, part_path: str) -> dict:
+        """Read a part's relationships as {id: (type, resolved target path)}."""
+        part = PurePosixPath(part_path)
+        rels_path = str(part.parent / "_rels" / f"{part.name}.rels") if part_path else "_rels/.rels"
+        if rels_path not in self._archive.namelist():
+            return {}
+        relationships = {}
+        for relationship in fromstring(self._archive.read(rels_path)).iter(f"{REL_NS}Relationship"):
+            target = relationship.get("Target", "")
+            if target.startswith("/"):
+                resolved = target.lstrip("/")
+            else:
+                resolved = str(PurePosixPath(part.parent / target)) if part_path else target
+            relationships[relationship.get("Id")] = (relationship.get("Type", ""), self._normalise_path(resolved))
+        return relationships
+
+    def _normalise_path(self, path: str) -> str:
+        """Collapse '..' segments in an archive path."""
+        parts: list = []
+        for segment in path.split("/"):
+            if segment == "..":
+                if parts:
+                    parts.pop()
+            elif segment not in ("", "."):
+                parts.append(segment)
+        return "/".join(parts)
+
+    def _find_related_part(self, workbook_rels: dict, suffix: str, default: str) -> Optional[str]:
+        """Find the archive path of a workbook part by relationship type suffix."""
+        for relationship_type, target in workbook_rels.values():
+            if relationship_type.endswith(suffix):
+                return target
+        return default if default in self._archive.namelist() else None
+
+    def _read_shared_strings(self, workbook_rels: dict) -> list:
+        """Read the shared strings table, if the workbook has one."""
+        path = self._find_related_part(workbook_rels, "/sharedStrings", "xl/sharedStrings.xml")
+        if path is None:
+            return []
+        with self._archive.open(path) as source:
+            return list(read_string_table(source))
+
+    def _read_date_styles(self, workbook_rels: dict) -> Tuple[set, set]:
+        """Return the style indices that format numbers as dates and as timedeltas."""
+        path = self._find_related_part(workbook_rels, "/styles", "xl/styles.xml")
+        if path is None:
+            return set(), set()
+        stylesheet = Stylesheet.from_tree(fromstring(self._archive.read(path)))
+        return stylesheet.date_formats, stylesheet.timedelta_formats
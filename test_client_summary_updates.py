@@ -23,16 +23,19 @@ def check_client_summaries():
     ]
     
     try:
-        for client_name, client_type in test_clients:
-            print(f"\n=== {client_name} ({client_type}) ===")
+        for client_type in ("industry", "government"):
+            client_names = [client_name for client_name, name_type in test_clients if name_type == client_type]
             try:
-                summary = analyzer.getClientSummary(client_name, client_type, start_date, end_date)
+                summaries = analyzer.getClientSummaries(client_names, client_type, start_date, end_date)
+            except Exception as e:
+                print(f"Error loading {client_type} summaries: {e}")
+                continue
+            for summary in summaries:
+                print(f"\n=== {summary['client']} ({client_type}) ===")
                 print(f"Amount: ${summary['amount']:,.0f}")
                 print(f"Products: {summary['products']}")
                 print(f"Details: {summary['details']}")
                 print(f"Summary dict: {summary}")
-            except Exception as e:
-                print(f"Error or client not found: {e}")
         
     except Exception as e:
         print(f"Error: {e}")
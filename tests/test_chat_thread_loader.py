@@ -321,4 +321,164 @@ class TestEmailChatThreadLoader:
                 assert len(message.attachments) > 1
                 # All attachment IDs should be valid
                 for attachment_id in message.attachments:
-                    assert attachment_id in thread.get_attachments() 
\ No newline at end of file
+                    assert attachment_id in thread.get_attachments() 
+
+# ============================================================================
+# SYNTHETIC EMAIL TESTS - Run without data/raw/*.eml
+# ============================================================================
+
+def _write_teams_eml(path: Path, subject: str, messages: list, attachment_id: str = "image001.png@01DB") -> Path:
+    """Write a forwarded Teams thread email with one inline image attachment."""
+    from email.mime.image import MIMEImage
+    from email.mime.multipart import MIMEMultipart
+    from email.mime.text import MIMEText
+    
+    body = "Forwarded from Microsoft Teams:\n\n" + "\n".join(
+        f"{participant}    {days} days ago\n{content}" for participant, days, content in messages
+    ) + "\nGo to Teams\n"
+    message = MIMEMultipart("related")
+    message["Subject"] = subject
+    message["Date"] = "Wed, 9 Jul 2025 10:00:00 +0800"
+    message["Thread-Topic"] = subject
+    message["Message-ID"] = f"<{path.stem}@example.com>"
+    message.attach(MIMEText(body, "plain", "utf-8"))
+    image = MIMEImage(b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 4, "png")
+    image.add_header("Content-ID", f"<{attachment_id}>")
+    image.add_header("Content-Disposition", "inline", filename="image001.png")
+    message.attach(image)
+    path.write_bytes(message.as_bytes())
+    return path
+
+
+def _legacy_extract_messages(content: str) -> list:
+    """Reference copy of the original regex-based message extraction."""
+    import re
+    messages = []
+    pattern = r'([A-Za-z\s\-]+)\s+\d+\s+days?\s+ago\s*\n(.*?)(?=\n[A-Za-z\s\-]+\s+\d+\s+days?\s+ago|\nGo to Teams|$)'
+    for participant, message_content in re.findall(pattern, content, re.DOTALL):
+        timestamp_match = re.search(r'(\d+\s+days?\s+ago)', message_content)
+        cleaned = re.sub(r'\n\s*\n', '\n\n', re.sub(r'\[cid:[^\]]+\]', '', message_content)).strip()
+        messages.append({
+            'participant': participant.strip(),
+            'timestamp': timestamp_match.group(1) if timestamp_match else "unknown",
+            'content': cleaned,
+            'attachments': re.findall(r'\[cid:([^\]]+)\]', message_content)
+        })
+    return messages
+
+
+def _thread_snapshot(thread: ChatThread) -> tuple:
+    """Everything a loaded thread exposes, for comparing loads."""
+    return thread.get_metadata(), thread.get_messages(), thread.get_attachments()
+
+
+class TestEmailChatThreadLoaderSynthetic:
+    """Test cases for EmailChatThreadLoader against generated .eml files."""
+    
+    @pytest.fixture
+    def eml_dir(self, tmp_path):
+        """Create a directory of Teams thread emails plus one email without Teams content."""
+        for index in range(6):
+            _write_teams_eml(tmp_path / f"thread {index}.eml", f"Win number {index}", [
+                ("Jane Citizen", index + 1, f"Signed client {index} [cid:image001.png@01DB]"),
+                ("John Smith-Jones", index + 2, "Congratulations\n\n\n\nteam"),
+            ])
+        (tmp_path / "thread 3b.eml").write_text("Subject: Not Teams\n\nPlain email.")
+        return tmp_path
+    
+    @pytest.mark.primary
+    def test_parallel_load_matches_sequential_order_and_warnings(self, eml_dir, capsys):
+        """Primary test: Worker-process loading returns the same threads and warnings in the same order."""
+        loader = EmailChatThreadLoader()
+        sequential = loader.load_threadList(str(eml_dir / "*.eml"))
+        sequential_output = capsys.readouterr().out
+        
+        parallel = loader.load_threadList(str(eml_dir / "*.eml"), max_workers=3)
+        
+        assert capsys.readouterr().out == sequential_output
+        assert sequential_output == f"Warning: Could not load {eml_dir / 'thread 3b.eml'}: No Teams content found in email: {eml_dir / 'thread 3b.eml'}\n"
+        assert [thread.get_metadata()['subject'] for thread in parallel] == [f"Win number {index}" for index in range(6)]
+        assert [_thread_snapshot(thread) for thread in parallel] == [_thread_snapshot(thread) for thread in sequential]
+        assert parallel[0].get_participants() == ["Jane Citizen", "John Smith-Jones"]
+        assert parallel[0].get_messages()[0].attachments == ["image001.png@01DB"]
+    
+    def test_iter_threads_loads_lazily_with_same_results(self, eml_dir, monkeypatch, capsys):
+        """Coverage test: iter_threads parses files only as they are consumed and matches load_threadList."""
+        loader = EmailChatThreadLoader()
+        expected = [_thread_snapshot(thread) for thread in loader.load_threadList(str(eml_dir / "*.eml"))]
+        expected_output = capsys.readouterr().out
+        parsed = []
+        load_thread = loader.load_thread
+        
+        def recording_load_thread(source_path):
+            parsed.append(source_path.name)
+            return load_thread(source_path)
+        
+        monkeypatch.setattr(loader, "load_thread", recording_load_thread)
+        threads = loader.iter_threads(str(eml_dir / "*.eml"))
+        assert parsed == []
+        assert _thread_snapshot(next(threads)) == expected[0]
+        assert parsed == ["thread 0.eml"]
+        assert [_thread_snapshot(thread) for thread in threads] == expected[1:]
+        
+        prefetched = loader.iter_threads(str(eml_dir / "*.eml"), prefetch=2)
+        assert [_thread_snapshot(thread) for thread in prefetched] == expected
+        assert capsys.readouterr().out == expected_output * 2
+        
+        with pytest.raises(ValueError, match="No .eml files found"):
+            loader.iter_threads(str(eml_dir / "*.msg"))
+    
+    def test_crlf_and_raw_utf8_headers_parse_like_text_mode(self, tmp_path):
+        """Coverage test: Bytes parsing normalizes CRLF line endings and decodes raw UTF-8 headers."""
+        eml_path = tmp_path / "crlf.eml"
+        eml_path.write_bytes(
+            "Subject: Café win\r\n for Perth\r\nThread-Topic: Café\r\nMessage-ID: <1@example.com>\r\n\r\n"
+            "Forwarded from Microsoft Teams:\r\n\r\nJane Citizen    2 days ago\r\nSigned\r\n\r\n\r\nToday\r\n".encode("utf-8")
+        )
+        
+        thread = EmailChatThreadLoader().load_thread(eml_path)
+        
+        assert thread.get_metadata() == {'subject': "Café win\n for Perth", 'date': "", 'thread_topic': "Café",
+                                         'message_id': "<1@example.com>"}
+        assert [message.content for message in thread.get_messages()] == ["Signed\n\nToday"]
+    
+    def test_attachment_size_is_estimated_without_decoding(self, eml_dir, monkeypatch):
+        """Coverage test: Attachment sizes come from the encoded payload and equal the decoded length."""
+        from email.message import Message as EmailMessage
+        
+        def fail_decode(self, i=None, decode=False):
+            assert not decode, "attachment payloads should not be decoded"
+            return original_get_payload(self, i, decode)
+        
+        original_get_payload = EmailMessage.get_payload
+        loader = EmailChatThreadLoader()
+        monkeypatch.setattr(loader, "_extract_text_content", lambda msg: "")
+        monkeypatch.setattr(EmailMessage, "get_payload", fail_decode)
+        
+        attachments = loader._parse_email_file(eml_dir / "thread 0.eml")['attachments']
+        
+        assert attachments == {"image001.png@01DB": {'filename': "image001.png", 'content_type': "image/png",
+                                                     'size': 8 + 256 * 4}}
+    
+    def test_load_headers_reads_only_the_header_block(self, eml_dir, monkeypatch):
+        """Coverage test: load_headers returns the thread metadata without parsing message bodies."""
+        loader = EmailChatThreadLoader()
+        expected = loader.load_thread(eml_dir / "thread 2.eml").get_metadata()
+        monkeypatch.setattr(loader, "_extract_text_content", lambda msg: pytest.fail("body should not be parsed"))
+        
+        assert loader.load_headers(eml_dir / "thread 2.eml") == expected
+        assert loader.load_headers(eml_dir / "thread 3b.eml")['subject'] == "Not Teams"
+        with pytest.raises(FileNotFoundError):
+            loader.load_headers(eml_dir / "missing.eml")
+    
+    @pytest.mark.parametrize("content", [
+        "Forwarded from Microsoft Teams:\n\nJane Citizen    2 days ago\nSigned [cid:a]\n\n\nToday\nGo to Teams\n",
+        "Microsoft Teams\n\nJane Citizen    2 days ago\nThanks all\nJohn Smith-Jones    1 day ago\nSee you 3 days ago!\n",
+        "Teams:\nJane    2 days ago\n\n\nBob    3 days ago\nHi\nGo to Teams",
+        "Teams:\nJane    2 days ago.\nSean O'Brien    4 days ago\nDone, 5 days ago\nMary Ann\n\n6\ndays ago\n[cid:x][cid:y]\n",
+        "Teams:\nJane    2 days ago  \n  \n  Indented\nA 7 days ago\nend",
+        "",
+    ])
+    def test_extract_messages_matches_legacy_regex(self, content):
+        """Coverage test: The single-pass tokenizer reproduces the original regex extraction exactly."""
+        assert EmailChatThreadLoader()._extract_messages(content) == _legacy_extract_messages(content)
@@ -190,6 +190,29 @@ class TestMonthlySummaryProducer:
         assert "**Period:** 2030-01-01 to 2030-01-31" in content
         assert "date filtering disabled due to unreliable email dates" in content
     
+    def test_chat_threads_summary_is_written_incrementally(self, tmp_path):
+        """Coverage test: The streamed chat threads file matches the summary rendered from a loaded thread list."""
+        from src.tool_experiments.chat_thread_loader import EmailChatThreadLoader
+        from src.tool_experiments.thread_cache import ThreadCache
+        from tests.test_chat_thread_loader import _write_teams_eml
+        
+        raw_dir = tmp_path / "raw"
+        raw_dir.mkdir()
+        for index in range(3):
+            _write_teams_eml(raw_dir / f"thread {index}.eml", f"Win number {index}", [("Jane Citizen", 1, f"Deal {index}")])
+        self.producer.raw_dir = raw_dir
+        self.producer.processed_dir = tmp_path
+        self.producer.thread_cache = ThreadCache(tmp_path / ".cache")
+        
+        self.producer._write_file_parts("Chat.md", self.producer._iter_chat_threads_summary(date(2025, 7, 1), date(2025, 7, 31)))
+        
+        threads = EmailChatThreadLoader().load_threadList(str(raw_dir / "*.eml"))
+        content = (tmp_path / "Chat.md").read_text(encoding='utf-8')
+        assert content == self.producer._generate_chat_threads_summary(date(2025, 7, 1), date(2025, 7, 31))
+        assert content.endswith("\n\n---\n\n".join(thread.to_markdown() for thread in threads))
+        assert content.startswith("# Chat Threads Summary\n\n**Period:** 2025-07-01 to 2025-07-31")
+        assert len(threads) == 3
+    
     def test_sales_lead_analyzer_integration(self):
         """Coverage test: SalesLeadAnalyzer integration with new markdown method."""
         from src.tool_experiments.sales_lead_analyzer import SalesLeadAnalyzer
@@ -2,6 +2,7 @@
 import pytest
 import time
 import logging
+import warnings
 from pathlib import Path
 from datetime import date, datetime
 from src.tool_experiments.sales_analyzer import SalesAnalyzer
@@ -184,7 +185,7 @@ class TestSalesAnalyzer:
         assert len(df) >= 0  # May be empty depending on data
         
         # Verify we have the expected columns (including new derived columns)
-        expected_columns = ['Client', 'Category', 'Product', 'Date', 'Total', 'Description', 'ClientStatus', 'Ongoing', 'ExistingClient', 'New']
+        expected_columns = ['Client', 'Category', 'Product', 'Date', 'Total', 'Description', 'ClientStatus', 'Ongoing', 'ExistingClient', 'New', 'ProductNormalized', 'DescriptionNormalized']
         assert list(df.columns) == expected_columns, f"Expected columns {expected_columns}, got {list(df.columns)}"
         
         # Verify Date column is datetime
@@ -218,7 +219,7 @@ class TestSalesAnalyzer:
         assert len(df) >= 0  # May be empty depending on data
         
         # Verify we have the expected columns (including new derived columns)
-        expected_columns = ['Client', 'Category', 'Product', 'Date', 'Total', 'Description', 'ClientStatus', 'Ongoing', 'ExistingClient', 'New']
+        expected_columns = ['Client', 'Category', 'Product', 'Date', 'Total', 'Description', 'ClientStatus', 'Ongoing', 'ExistingClient', 'New', 'ProductNormalized', 'DescriptionNormalized']
         assert list(df.columns) == expected_columns, f"Expected columns {expected_columns}, got {list(df.columns)}"
         
         # Verify Date column is datetime
@@ -690,3 +691,412 @@ class TestSalesAnalyzer:
         assert client_data['ExistingClient'].dtype == bool, "ExistingClient should be boolean"
         assert client_data['New'].dtype == bool, "New should be boolean"
  
+
+
+# ============================================================================
+# SYNTHETIC WORKBOOK TESTS - Run without data/raw/Business.xlsm
+# ============================================================================
+
+SYNTHETIC_SALES_ROWS = {
+    # (Client, Category, ClientStatus, Ongoing, Product, Date, Description, Total)
+    'industry': [
+        ("Alpha Co", "Retail", "New", "No", "profile.id", datetime(2025, 5, 2), "Profile\nsubscription", 1000),
+        ("Beta Pty", "Property", "Existing", "Yes", "atlas.id", datetime(2025, 5, 10), "Renewal", 500),
+        ("Alpha Co", "Retail", "New", "No", "Consulting", datetime(2025, 5, 12), "Workshop  day", 250),
+        ("Gamma Ltd", "Finance", "Existing", "No", "expert.id", datetime(2025, 6, 3), "Advisory", 2000),
+        ("Beta Pty", "Property", "Existing", "No", "Forecast (SAFi)", datetime(2025, 6, 20), "nan", 750),
+        ("  Delta Inc ", "Retail", None, None, "views.id", datetime(2025, 7, 1), "Views rollout", 300),
+    ],
+    'government': [
+        ("City of Epsilon", "Council", "New", "No", "economy.id", datetime(2025, 5, 5), "Economy profile", 4000),
+        ("Zeta Shire", "Council", "Existing", "Yes", "housing.id", datetime(2025, 6, 6), "Housing monitor", 1500),
+        ("City of Epsilon", "Council", "New", "No", "atlas.id", datetime(2025, 6, 18), "Atlas add-on", 800),
+    ],
+}
+
+
+# The same kind of rows with dates out of order, as when sales are entered late
+UNSORTED_SALES_ROWS = {
+    'industry': [
+        ("Gamma Ltd", "Finance", "Existing", "No", "expert.id", datetime(2025, 6, 20), "Advisory", 2000),
+        ("Alpha Co", "Retail", "New", "No", "views.id", datetime(2025, 6, 3), "Views rollout", 300),
+        ("Beta Pty", "Property", "Existing", "Yes", "atlas.id", datetime(2025, 5, 2), "Renewal", 500),
+        ("Alpha Co", "Retail", "New", "No", "profile.id", datetime(2025, 5, 10), "Profile subscription", 1000),
+        ("Gamma Ltd", "Finance", "Existing", "No", "Forecast (SAFi)", datetime(2025, 5, 12), "Forecast", 750),
+        ("Delta Inc", "Retail", "New", "No", "Consulting", datetime(2025, 5, 2), "Workshop", 250),
+    ],
+    'government': [
+        ("City of Epsilon", "Council", "New", "No", "atlas.id", datetime(2025, 6, 18), "Atlas add-on", 800),
+        ("Zeta Shire", "Council", "Existing", "Yes", "housing.id", datetime(2025, 5, 5), "Housing monitor", 1500),
+        ("City of Epsilon", "Council", "New", "No", "economy.id", datetime(2025, 5, 5), "Economy profile", 4000),
+    ],
+}
+
+
+def _write_synthetic_business_workbook(path: Path, rows: dict = SYNTHETIC_SALES_ROWS) -> Path:
+    """Write a workbook with LD-Business and LG-Business sheets laid out like Business.xlsm."""
+    from openpyxl import Workbook
+    
+    layouts = {
+        'industry': ('LD-Business', {'date': 16, 'description': 18, 'total': 25}),
+        'government': ('LG-Business', {'date': 15, 'description': 17, 'total': 24}),
+    }
+    workbook = Workbook()
+    workbook.remove(workbook.active)
+    for config_key, (sheet_name, layout) in layouts.items():
+        sheet = workbook.create_sheet(sheet_name)
+        sheet.append([f"Header {index}" for index in range(26)])
+        for client, category, status, ongoing, product, when, description, total in rows[config_key]:
+            values = [None] * 26
+            values[0], values[3], values[6], values[7], values[8] = client, category, status, ongoing, product
+            values[layout['date']] = when
+            values[layout['description']] = description
+            values[layout['total']] = total
+            sheet.append(values)
+    workbook.save(path)
+    return path
+
+
+class TestSalesAnalyzerSyntheticWorkbook:
+    """Test cases for SalesAnalyzer against a generated Business-style workbook."""
+    
+    @pytest.fixture
+    def business_path(self, tmp_path):
+        """Create the synthetic business workbook."""
+        return _write_synthetic_business_workbook(tmp_path / "Business.xlsx")
+    
+    @pytest.fixture
+    def analyzer(self, business_path):
+        """Create a SalesAnalyzer over the synthetic workbook."""
+        analyzer = SalesAnalyzer(business_path)
+        yield analyzer
+        analyzer.close()
+    
+    @pytest.mark.primary
+    def test_load_all_sales_data_reads_each_sheet_once(self, analyzer, monkeypatch):
+        """Primary test: The bulk loader fills both caches so later queries don't re-read."""
+        loaded = analyzer.loadAllSalesData()
+        
+        assert set(loaded) == {'industry', 'government'}
+        assert len(loaded['industry']) == 6
+        assert len(loaded['government']) == 3
+        assert list(loaded['industry'].columns) == ['Client', 'Category', 'Product', 'Date', 'Total', 'Description',
+                                                    'ClientStatus', 'Ongoing', 'ExistingClient', 'New', 'ProductNormalized', 'DescriptionNormalized']
+        
+        def fail_read(*args, **kwargs):
+            raise AssertionError("sheet should not be re-read after loadAllSalesData")
+        
+        monkeypatch.setattr(analyzer, "_read_sheet_as_dataframe", fail_read)
+        industry = analyzer.getIndustrySalesData(date(2025, 5, 1), date(2025, 5, 31))
+        government = analyzer.getGovSalesData(date(2025, 6, 1), date(2025, 6, 30))
+        
+        assert list(industry['Client']) == ['Alpha Co', 'Beta Pty', 'Alpha Co']
+        assert list(government['Client']) == ['Zeta Shire', 'City of Epsilon']
+    
+    def test_text_columns_are_trimmed_categoricals(self, analyzer):
+        """Coverage test: Low-cardinality columns are categorical, trimmed, with missing values as 'None'."""
+        industry = analyzer.loadAllSalesData()['industry']
+        
+        for column in ['Client', 'Category', 'Product', 'ClientStatus', 'Ongoing']:
+            assert isinstance(industry[column].dtype, pd.CategoricalDtype), column
+        assert industry['Description'].dtype == object
+        assert industry.iloc[5]['Client'] == "Delta Inc"
+        assert industry.iloc[5]['ClientStatus'] == "None"
+        assert list(industry['ExistingClient']) == [False, True, False, True, True, False]
+        assert list(industry['New']) == [True, False, True, True, True, True]
+    
+    def test_compact_schema_and_memory_report(self, analyzer, business_path):
+        """Coverage test: Standardized frames use compact dtypes and report memory before and after."""
+        with pytest.raises(ValueError, match="No industry sales data"):
+            analyzer.getMemoryReport('industry')
+        
+        industry = analyzer.loadAllSalesData()['industry']
+        
+        assert industry['Total'].dtype == 'float64'
+        assert industry['ExistingClient'].dtype == bool
+        report = analyzer.getMemoryReport('industry')
+        assert list(report.columns) == ['before', 'after']
+        assert report.loc['ProductNormalized', 'before'] == 0
+        assert report.loc['Total', 'after'] == industry['Total'].memory_usage(deep=True, index=False)
+        
+        with SalesAnalyzer(business_path, drop_status_columns=True) as compact_analyzer:
+            compact = compact_analyzer.loadAllSalesData()['industry']
+            compact_report = compact_analyzer.getMemoryReport('industry')
+            summary = compact_analyzer.getClientSummary('Beta Pty', 'industry', date(2025, 5, 1), date(2025, 6, 30))
+        assert 'ClientStatus' not in compact.columns and 'Ongoing' not in compact.columns
+        assert compact_report.loc['Ongoing', 'after'] == 0
+        assert summary == analyzer.getClientSummary('Beta Pty', 'industry', date(2025, 5, 1), date(2025, 6, 30))
+    
+    def test_bulk_loader_matches_windowed_load(self, analyzer, business_path):
+        """Coverage test: Bulk-loaded data filtered by date equals a direct windowed read."""
+        analyzer.loadAllSalesData()
+        bulk = analyzer.getIndustrySalesData(date(2025, 5, 1), date(2025, 6, 30))
+        
+        with SalesAnalyzer(business_path) as fresh:
+            direct = fresh._get_sales_data('industry', date(2025, 5, 1), date(2025, 6, 30)).reset_index(drop=True)
+        
+        pd.testing.assert_frame_equal(bulk, direct)
+    
+    def test_windowed_read_pushes_date_filter_to_reader(self, analyzer, monkeypatch):
+        """Coverage test: A one-month read only materializes that month's rows from the sheet."""
+        read_range = analyzer.spreadsheet_manager.readRangeAsDataFrame
+        read_lengths = []
+        
+        def recording_read(*args, **kwargs):
+            df = read_range(*args, **kwargs)
+            read_lengths.append(len(df))
+            return df
+        
+        monkeypatch.setattr(analyzer.spreadsheet_manager, "readRangeAsDataFrame", recording_read)
+        june = analyzer.getIndustrySalesData(date(2025, 6, 1), date(2025, 6, 30))
+        
+        assert read_lengths == [2]
+        assert list(june['Client']) == ['Gamma Ltd', 'Beta Pty']
+    
+    def test_cache_merges_loaded_date_intervals(self, analyzer, business_path, monkeypatch):
+        """Coverage test: Only uncovered date ranges are read, and revisited ranges come from the cache."""
+        get_sales_data = analyzer._get_sales_data
+        loaded_ranges = []
+        
+        def recording_get_sales_data(config_key, start_date, end_date):
+            loaded_ranges.append((start_date, end_date))
+            return get_sales_data(config_key, start_date, end_date)
+        
+        monkeypatch.setattr(analyzer, "_get_sales_data", recording_get_sales_data)
+        may = analyzer.getIndustrySalesData(date(2025, 5, 1), date(2025, 5, 31))
+        analyzer.getIndustrySalesData(date(2025, 6, 1), date(2025, 6, 30))
+        may_again = analyzer.getIndustrySalesData(date(2025, 5, 1), date(2025, 5, 31))
+        assert len(loaded_ranges) == 2
+        pd.testing.assert_frame_equal(may_again, may)
+        
+        may_to_july = analyzer.getIndustrySalesData(date(2025, 5, 1), date(2025, 7, 31))
+        assert [(start.date(), end.date()) for start, end in loaded_ranges[2:]] == [(date(2025, 5, 31), date(2025, 7, 31))]
+        assert analyzer._cached_data['industry']['intervals'] == [(pd.Timestamp(2025, 5, 1), pd.Timestamp(2025, 7, 31))]
+        with SalesAnalyzer(business_path) as fresh:
+            direct = fresh._get_sales_data('industry', date(2025, 5, 1), date(2025, 7, 31)).reset_index(drop=True)
+        pd.testing.assert_frame_equal(may_to_july, direct)
+    
+    def test_uncovered_gaps_are_read_in_one_pass(self, analyzer, business_path, monkeypatch):
+        """Coverage test: Several uncovered gaps cost one sheet read, and gaps without new rows leave the cache as it is."""
+        for start_date, end_date in [(date(2025, 5, 1), date(2025, 5, 31)), (date(2025, 7, 1), date(2025, 7, 31)),
+                                     (date(2025, 9, 1), date(2025, 9, 30))]:
+            analyzer.getIndustrySalesData(start_date, end_date)
+        read_range = analyzer.spreadsheet_manager.readRangeAsDataFrame
+        reads = []
+        
+        def counting_read(*args, **kwargs):
+            reads.append(kwargs.get('row_filter'))
+            return read_range(*args, **kwargs)
+        
+        monkeypatch.setattr(analyzer.spreadsheet_manager, "readRangeAsDataFrame", counting_read)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            april_to_october = analyzer.getIndustrySalesData(date(2025, 4, 1), date(2025, 10, 31))
+            cached = analyzer._cached_data['industry']['data']
+            analyzer.getIndustrySalesData(date(2025, 3, 1), date(2025, 4, 30))
+        
+        assert len(reads) == 2
+        assert analyzer._cached_data['industry']['data'] is cached
+        with SalesAnalyzer(business_path) as fresh:
+            direct = fresh._get_sales_data('industry', date(2025, 4, 1), date(2025, 10, 31)).reset_index(drop=True)
+        pd.testing.assert_frame_equal(april_to_october, direct)
+    
+    def test_sorted_cache_slices_match_date_masks(self, analyzer):
+        """Coverage test: Binary-search slices equal boolean date masks, and returned frames are detached copies."""
+        analyzer.loadAllSalesData()
+        cached = analyzer._cached_data['industry']['data']
+        assert cached['Date'].is_monotonic_increasing
+        
+        for start_date, end_date in [(date(2025, 5, 10), date(2025, 6, 3)), (date(2025, 7, 2), date(2025, 8, 1)),
+                                     (date(2025, 5, 12), date(2025, 5, 12))]:
+            mask = (cached['Date'] >= pd.Timestamp(start_date)) & (cached['Date'] <= pd.Timestamp(end_date))
+            sliced = analyzer._filter_cached_data_by_date(cached, start_date, end_date)
+            pd.testing.assert_frame_equal(sliced, cached[mask])
+        
+        june = analyzer.getIndustrySalesData(date(2025, 6, 1), date(2025, 6, 30))
+        june.loc[0, 'Total'] = -1
+        assert analyzer.getIndustrySalesData(date(2025, 6, 1), date(2025, 6, 30)).loc[0, 'Total'] == 2000
+    
+    @pytest.mark.parametrize("client_type", ['industry', 'government'])
+    def test_grouped_markdown_matches_per_client_summaries(self, analyzer, client_type):
+        """Coverage test: The grouped summary pass renders the same table as one getClientSummary per client."""
+        start_date, end_date = date(2025, 5, 1), date(2025, 7, 31)
+        clients = analyzer._extract_unique_clients(analyzer._ensureUnderlyingDataLoaded(client_type, start_date, end_date))
+        per_client = [analyzer.getClientSummary(client, client_type, start_date, end_date) for client in clients]
+        
+        markdown = analyzer.getClientSummaryMarkdown(client_type, start_date, end_date)
+        
+        assert markdown == analyzer._format_markdown_table(client_type, start_date, end_date, per_client)
+        assert markdown.count("\n| ") == len(clients) + 1
+    
+    def test_client_summaries_match_single_client_summaries(self, analyzer):
+        """Coverage test: Batch summaries equal getClientSummary for named, unknown and all clients."""
+        start_date, end_date = date(2025, 5, 1), date(2025, 6, 30)
+        names = ['Beta Pty', 'Nobody', 'Alpha Co']
+        
+        summaries = analyzer.getClientSummaries(names, 'industry', start_date, end_date)
+        
+        assert summaries == [analyzer.getClientSummary(name, 'industry', start_date, end_date) for name in names]
+        assert summaries[1] == {'client': 'Nobody', 'amount': 0.0, 'products': [], 'details': [], 'sale_type': 'New client'}
+        
+        frame = analyzer.getClientSummaries(None, 'industry', start_date, end_date, as_frame=True)
+        assert list(frame['client']) == ['Alpha Co', 'Gamma Ltd', 'Beta Pty']
+        assert list(frame.columns) == ['client', 'amount', 'products', 'details', 'sale_type']
+        
+        with pytest.raises(ValueError, match="Invalid client_type"):
+            analyzer.getClientSummaries(None, 'retail', start_date, end_date)
+    
+    def test_summarize_periods_matches_per_period_summaries(self, analyzer, monkeypatch):
+        """Coverage test: Several periods are summarized from one load, each equal to its own batch summary."""
+        periods = [(date(2025, 6, 1), date(2025, 6, 30)), (date(2025, 5, 1), date(2025, 5, 31)),
+                   (date(2025, 8, 1), date(2025, 8, 31))]
+        get_sales_data = analyzer._get_sales_data
+        load_count = []
+        
+        def counting_get_sales_data(*args):
+            load_count.append(args)
+            return get_sales_data(*args)
+        
+        monkeypatch.setattr(analyzer, "_get_sales_data", counting_get_sales_data)
+        summaries = analyzer.summarize_periods(periods, 'industry')
+        
+        assert len(load_count) == 1
+        assert list(summaries) == periods
+        assert summaries[periods[2]] == []
+        for start_date, end_date in periods:
+            assert summaries[(start_date, end_date)] == analyzer.getClientSummaries(None, 'industry', start_date, end_date)
+        
+        with pytest.raises(ValueError, match="overlap"):
+            analyzer.summarize_periods([(date(2025, 5, 1), date(2025, 5, 31)), (date(2025, 5, 31), date(2025, 6, 30))],
+                                       'industry')
+    
+    def test_product_translations_are_precomputed_and_configurable(self, business_path):
+        """Coverage test: ProductNormalized holds the translated names and follows a custom mapping table."""
+        with SalesAnalyzer(business_path) as default_analyzer:
+            industry = default_analyzer.loadAllSalesData()['industry']
+        assert industry['ProductNormalized'].iloc[:2].tolist() == ['Profile', 'Atlas']
+        assert pd.isna(industry['ProductNormalized'].iloc[2])
+        
+        translations = {**SalesAnalyzer.DEFAULT_PRODUCT_TRANSLATIONS, 'profile.id': 'Profile Plus'}
+        with SalesAnalyzer(business_path, product_translations=translations) as custom_analyzer:
+            summary = custom_analyzer.getClientSummary('Alpha Co', 'industry', date(2025, 5, 1), date(2025, 6, 30))
+            assert custom_analyzer.product_translations is not translations
+        assert summary['products'] == ['Profile Plus']
+    
+    def test_descriptions_are_normalized_at_load_time(self, analyzer):
+        """Coverage test: DescriptionNormalized collapses whitespace and drops meaningless values once per load."""
+        industry = analyzer.loadAllSalesData()['industry']
+        
+        normalized = dict(zip(industry['Description'], industry['DescriptionNormalized']))
+        assert normalized['Profile\nsubscription'] == 'Profile subscription'
+        assert normalized['Workshop  day'] == 'Workshop day'
+        assert normalized['nan'] is None
+        
+        summary = analyzer.getClientSummary('Alpha Co', 'industry', date(2025, 5, 1), date(2025, 5, 31))
+        assert summary['details'] == ['Profile subscription', 'Workshop day']
+    
+    def test_watch_mode_merges_rows_appended_to_changed_sheet(self, business_path, monkeypatch):
+        """Coverage test: Watch mode re-reads only the edited sheet and appends its new rows to the cache."""
+        start_date, end_date = date(2025, 5, 1), date(2025, 7, 31)
+        with SalesAnalyzer(business_path, watch=True) as watcher:
+            assert watcher.getNewIndustryClients(start_date, end_date) == ['Alpha Co', 'Gamma Ltd', 'Beta Pty', 'Delta Inc']
+            watcher.getNewGovClients(start_date, end_date)
+            watcher.getClientSummaries(None, 'industry', start_date, end_date)
+            client_rows = watcher._cached_data['industry']['client_rows']
+            
+            rows = {**SYNTHETIC_SALES_ROWS, 'industry': SYNTHETIC_SALES_ROWS['industry'] + [
+                ("Gamma Ltd", "Finance", "Existing", "No", "expert.id", datetime(2025, 7, 20), "Advisory", 900),
+            ]}
+            _write_synthetic_business_workbook(business_path, rows)
+            loaded_sheets = []
+            load_standardized_sheet = watcher._load_standardized_sheet
+            
+            def recording_load(config_key, *args):
+                loaded_sheets.append(config_key)
+                return load_standardized_sheet(config_key, *args)
+            
+            monkeypatch.setattr(watcher, "_load_standardized_sheet", recording_load)
+            summary = watcher.getClientSummary('Gamma Ltd', 'industry', start_date, end_date)
+            
+            assert loaded_sheets == ['industry']
+            assert watcher._cached_data['industry']['client_rows'] is client_rows
+            assert summary['amount'] == 2900.0
+            assert watcher.refresh() == []
+            
+            _write_synthetic_business_workbook(business_path, {**rows, 'industry': rows['industry'][1:]})
+            assert watcher.getClientSummary('Alpha Co', 'industry', start_date, end_date)['amount'] == 250.0
+            assert watcher._cached_data['industry']['client_rows'] is None
+    
+    def test_load_all_sales_data_in_worker_processes(self, analyzer, business_path):
+        """Coverage test: Parallel sheet parsing produces the same standardized frames."""
+        parallel = analyzer.loadAllSalesData(max_workers=2)
+        
+        with SalesAnalyzer(business_path) as sequential_analyzer:
+            sequential = sequential_analyzer.loadAllSalesData()
+        
+        for config_key in ('industry', 'government'):
+            pd.testing.assert_frame_equal(parallel[config_key], sequential[config_key])
+    
+    @pytest.mark.parametrize("warm_up", [None, 'june_first', 'load_all'])
+    def test_results_keep_sheet_order_when_dates_are_unsorted(self, tmp_path, warm_up):
+        """Coverage test: Clients, products, details and rows come back in sheet order, however the cache was filled."""
+        business_path = _write_synthetic_business_workbook(tmp_path / "Business.xlsx", UNSORTED_SALES_ROWS)
+        start_date, end_date = date(2025, 5, 1), date(2025, 6, 30)
+        with SalesAnalyzer(business_path) as analyzer:
+            if warm_up == 'june_first':
+                analyzer.getIndustrySalesData(date(2025, 6, 1), date(2025, 6, 30))
+                analyzer.getGovSalesData(date(2025, 6, 1), date(2025, 6, 30))
+            elif warm_up == 'load_all':
+                loaded = analyzer.loadAllSalesData()
+                assert list(loaded['industry']['Client']) == [row[0] for row in UNSORTED_SALES_ROWS['industry']]
+            
+            industry = analyzer.getIndustrySalesData(start_date, end_date)
+            assert list(industry['Client']) == [row[0] for row in UNSORTED_SALES_ROWS['industry']]
+            assert analyzer.getNewIndustryClients(start_date, end_date) == ['Gamma Ltd', 'Alpha Co', 'Delta Inc']
+            assert analyzer.getNewGovClients(start_date, end_date) == ['City of Epsilon']
+            
+            summary = analyzer.getClientSummary('Alpha Co', 'industry', start_date, end_date)
+            assert summary['products'] == ['Views', 'Profile']
+            assert summary['details'] == ['Views rollout', 'Profile subscription']
+            
+            may = analyzer.getIndustrySalesData(date(2025, 5, 1), date(2025, 5, 31))
+            assert list(may['Client']) == ['Beta Pty', 'Alpha Co', 'Gamma Ltd', 'Delta Inc']
+    
+    def test_client_summary_markdown_golden_output_for_unsorted_dates(self, tmp_path):
+        """Coverage test: The markdown summary of a sheet with out-of-order dates is exactly the sheet-order table."""
+        business_path = _write_synthetic_business_workbook(tmp_path / "Business.xlsx", UNSORTED_SALES_ROWS)
+        with SalesAnalyzer(business_path) as analyzer:
+            industry = analyzer.getClientSummaryMarkdown('industry', date(2025, 5, 1), date(2025, 6, 30))
+            government = analyzer.getClientSummaryMarkdown('government', date(2025, 5, 1), date(2025, 6, 30))
+        
+        assert industry == (
+            "# New Industry Clients (2025-05-01 to 2025-06-30)\n"
+            "\n"
+            "| Client | Amount | Products | Details | Sale Type |\n"
+            "|--------|--------|----------|---------|-----------|\n"
+            "| Gamma Ltd | $2,750 | Consulting, Forecast | Advisory Forecast | Upsell |\n"
+            "| Alpha Co | $1,300 | Views, Profile | Views rollout Profile subscription | New client |\n"
+            "| Delta Inc | $250 |  | Workshop | New client |"
+        )
+        assert government == (
+            "# New Government Clients (2025-05-01 to 2025-06-30)\n"
+            "\n"
+            "| Client | Amount | Products | Details | Sale Type |\n"
+            "|--------|--------|----------|---------|-----------|\n"
+            "| City of Epsilon | $4,800 | Atlas, Economy | Atlas add-on Economy profile | New client |"
+        )
+    
+    def test_text_dated_rows_survive_the_date_pushdown(self, business_path):
+        """Coverage test: Dates typed as text are coerced as before the read-time filter, not dropped by it."""
+        rows = {**SYNTHETIC_SALES_ROWS, 'industry': SYNTHETIC_SALES_ROWS['industry'] + [
+            ("Eta Co", "Retail", "New", "No", "profile.id", "15/07/2025", "Typed date", 600),
+            ("Theta Co", "Retail", "New", "No", "profile.id", "not a date", "Bad date", 700),
+        ]}
+        _write_synthetic_business_workbook(business_path, rows)
+        with SalesAnalyzer(business_path) as analyzer:
+            assert analyzer.getNewIndustryClients(date(2025, 7, 1), date(2025, 7, 31)) == ['Delta Inc', 'Eta Co']
+            mid_july = analyzer.getIndustrySalesData(date(2025, 7, 10), date(2025, 7, 20))
+            assert analyzer.getClientSummary('Eta Co', 'industry', date(2025, 5, 1), date(2025, 7, 31))['amount'] == 600.0
+        
+        assert list(mid_july['Client']) == ['Eta Co']
+        assert list(mid_july['Date']) == [pd.Timestamp(2025, 7, 15)]
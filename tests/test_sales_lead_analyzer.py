@@ -337,3 +337,23 @@ class TestSalesLeadAnalyzer:
         finally:
             analyzer_v2.close()
     
+    
+    def test_loads_sheet_missing_a_categorical_column(self, tmp_path):
+        """Coverage test: A sheet without one of the categorical filter columns still loads."""
+        from openpyxl import Workbook
+        
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = "All deals"
+        sheet.append(["Deal Name", "Deal owner", "Engagement Type", "Amount"])
+        sheet.append(["Profile refresh", "Paul Tardio", "Subscription", 1000])
+        sheet.append(["Council review", None, "Consulting Government", 500])
+        leads_path = tmp_path / "Leads.xlsx"
+        workbook.save(leads_path)
+        
+        with SalesLeadAnalyzer(leads_path, sheet_name="All deals") as analyzer:
+            df = analyzer.load_data()
+        
+        assert list(df['Sector']) == ["Industry", "Government"]
+        assert isinstance(df['Deal owner'].dtype, pd.CategoricalDtype)
+        assert 'Sale Conviction' not in df.columns
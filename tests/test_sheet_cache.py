@@ -0,0 +1,158 @@
+# tests/test_sheet_cache.py
+import pytest
+import time
+from pathlib import Path
+from openpyxl import Workbook
+from src.tool_experiments.sheet_cache import SheetCache
+from src.tool_experiments.spreadsheet_manager import SpreadsheetManager
+import pandas as pd
+
+
+class TestSheetCache:
+    """Test cases for SheetCache class."""
+    
+    @pytest.fixture
+    def workbook_path(self, tmp_path):
+        """Create a small workbook to cache."""
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = "Data"
+        sheet.append(["Client", "Total"])
+        sheet.append(["Alpha", 100])
+        sheet.append(["Beta", 200])
+        path = tmp_path / "cached.xlsx"
+        workbook.save(path)
+        return path
+    
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create a SheetCache in a temporary directory."""
+        return SheetCache(tmp_path / ".cache")
+    
+    # ============================================================================
+    # PRIMARY TESTS - Core Functional Behavior
+    # ============================================================================
+    
+    @pytest.mark.primary
+    def test_read_range_is_served_from_cache(self, workbook_path, cache, monkeypatch):
+        """Primary test: A second manager reads the range from cache without parsing the sheet."""
+        with SpreadsheetManager(workbook_path, mode="read", cache=cache) as manager:
+            expected = manager.readRangeAsDataFrame("Data")
+        
+        def fail_parse(*args, **kwargs):
+            raise AssertionError("sheet should not be parsed on a cache hit")
+        
+        with SpreadsheetManager(workbook_path, mode="read", cache=cache) as manager:
+            monkeypatch.setattr(manager, "_stream_cell_range", fail_parse)
+            actual = manager.readRangeAsDataFrame("Data")
+        
+        pd.testing.assert_frame_equal(actual, expected)
+    
+    @pytest.mark.primary
+    def test_changed_workbook_is_a_miss(self, workbook_path, cache):
+        """Primary test: Editing the workbook invalidates its cached ranges."""
+        key = (1, None, "A", None)
+        cache.put(workbook_path, "Data", key, pd.DataFrame({"Client": ["Alpha"]}))
+        assert cache.get(workbook_path, "Data", key) is not None
+        
+        with SpreadsheetManager(workbook_path) as manager:
+            manager.write_dataframe(pd.DataFrame({"Client": ["Gamma"]}), "Data", start_cell="A4",
+                                    include_headers=False)
+        
+        assert cache.get(workbook_path, "Data", key) is None
+    
+    # ============================================================================
+    # COVERAGE TESTS - Invalidation & Eviction
+    # ============================================================================
+    
+    def test_range_and_sheet_are_part_of_key(self, workbook_path, cache):
+        """Coverage test: Different ranges and sheets are cached separately."""
+        cache.put(workbook_path, "Data", (1, None, "A", None), pd.DataFrame({"A": [1]}))
+        assert cache.get(workbook_path, "Data", (1, 2, "A", None)) is None
+        assert cache.get(workbook_path, "Other", (1, None, "A", None)) is None
+    
+    def test_reader_and_categories_are_part_of_key(self, workbook_path, cache):
+        """Coverage test: Each engine and mode caches its own entries, and categorical dtypes are keyed by their categories."""
+        managers = [SpreadsheetManager(workbook_path, cache=cache), SpreadsheetManager(workbook_path, mode="read", cache=cache),
+                    SpreadsheetManager(workbook_path, mode="read", engine="fast", cache=cache)]
+        for manager in managers:
+            with manager:
+                manager.readRangeAsDataFrame("Data")
+        assert len(list(cache.cache_dir.iterdir())) == 3
+        
+        clients = pd.CategoricalDtype(["Alpha", "Beta"])
+        ordered_clients = pd.CategoricalDtype(["Beta", "Alpha", "Gamma"], ordered=True)
+        with SpreadsheetManager(workbook_path, mode="read", cache=cache) as manager:
+            first = manager.readRangeAsDataFrame("Data", dtype={"Client": clients})
+        with SpreadsheetManager(workbook_path, mode="read", cache=cache) as manager:
+            second = manager.readRangeAsDataFrame("Data", dtype={"Client": ordered_clients})
+        
+        assert first["Client"].dtype == clients
+        assert second["Client"].dtype == ordered_clients
+    
+    def test_lost_replace_keeps_the_other_writers_entry(self, workbook_path, cache, monkeypatch):
+        """Coverage test: A write whose move loses to another writer's entry succeeds, and a failed first write raises."""
+        key = (1, None, "A", None)
+        
+        def lose_replace(self, target):
+            raise PermissionError(f"{target} is in use")
+        
+        monkeypatch.setattr(Path, "replace", lose_replace)
+        with pytest.raises(PermissionError):
+            cache.put(workbook_path, "Data", key, pd.DataFrame({"A": [1]}))
+        assert list(cache.cache_dir.iterdir()) == []
+        
+        monkeypatch.undo()
+        cache.put(workbook_path, "Data", key, pd.DataFrame({"A": [1]}))
+        monkeypatch.setattr(Path, "replace", lose_replace)
+        cache.put(workbook_path, "Data", key, pd.DataFrame({"A": [2]}))
+        
+        pd.testing.assert_frame_equal(cache.get(workbook_path, "Data", key), pd.DataFrame({"A": [1]}))
+        assert [path.suffix for path in cache.cache_dir.iterdir()] == [SheetCache.ENTRY_SUFFIX]
+    
+    def test_puts_do_not_rescan_the_cache_directory(self, workbook_path, cache, monkeypatch):
+        """Coverage test: Storing many ranges lists the cache directory once, keeping a running total for eviction."""
+        original_glob = Path.glob
+        globs = []
+        
+        def counting_glob(self, pattern):
+            globs.append(pattern)
+            return original_glob(self, pattern)
+        
+        monkeypatch.setattr(Path, "glob", counting_glob)
+        for end_row in range(2, 22):
+            cache.put(workbook_path, "Data", (1, end_row, "A", None), pd.DataFrame({"A": range(end_row)}))
+        cache.put(workbook_path, "Data", (1, 2, "A", None), pd.DataFrame({"A": range(100)}))
+        
+        assert len(globs) == 2
+        assert cache._total_bytes == cache.total_bytes()
+    
+    def test_invalidate_single_workbook(self, workbook_path, cache, tmp_path):
+        """Coverage test: Invalidation can target one workbook."""
+        other_path = tmp_path / "other.xlsx"
+        other_path.write_bytes(workbook_path.read_bytes() + b"x")
+        cache.put(workbook_path, "Data", (1,), pd.DataFrame({"A": [1]}))
+        cache.put(other_path, "Data", (1,), pd.DataFrame({"A": [2]}))
+        
+        assert cache.invalidate(workbook_path) == 1
+        assert cache.get(workbook_path, "Data", (1,)) is None
+        assert cache.get(other_path, "Data", (1,)) is not None
+        assert cache.invalidate() == 1
+        assert cache.total_bytes() == 0
+    
+    def test_lru_eviction_by_total_bytes(self, workbook_path, tmp_path):
+        """Coverage test: The least recently used entry is evicted when over the size cap."""
+        cache = SheetCache(tmp_path / ".cache", max_bytes=10**9)
+        frame = pd.DataFrame({"A": range(1000)})
+        cache.put(workbook_path, "Data", ("first",), frame)
+        time.sleep(0.01)
+        cache.put(workbook_path, "Data", ("second",), frame)
+        time.sleep(0.01)
+        assert cache.get(workbook_path, "Data", ("first",)) is not None
+        
+        cache.max_bytes = cache.total_bytes() - 1
+        time.sleep(0.01)
+        cache.put(workbook_path, "Data", ("third",), frame)
+        
+        assert cache.get(workbook_path, "Data", ("second",)) is None
+        assert cache.get(workbook_path, "Data", ("third",)) is not None
@@ -170,3 +170,398 @@ class TestSpreadsheetManager:
         assert empty_row == 13
 
 
+
+
+class TestSpreadsheetManagerReadMode:
+    """Test cases for the streaming read-only mode of SpreadsheetManager."""
+    
+    @pytest.fixture
+    def workbook_path(self, tmp_path):
+        """Create a small workbook with a ragged tail and a gap in column A."""
+        from openpyxl import Workbook
+        from datetime import datetime
+        
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = "Data"
+        sheet.append(["Client", "Date", "Total", "Notes"])
+        sheet.append(["Alpha", datetime(2025, 5, 1), 100, "first"])
+        sheet.append(["Beta", datetime(2025, 5, 20), 250.5, None])
+        sheet.append([None, None, None, "orphan note"])
+        sheet.append(["Gamma", datetime(2025, 6, 2), 75, "=C2*2"])
+        sheet.append([None, None, None, "trailing note"])
+        path = tmp_path / "read_mode.xlsx"
+        workbook.save(path)
+        return path
+    
+    @pytest.mark.primary
+    def test_read_mode_matches_edit_mode(self, workbook_path):
+        """Primary test: Streaming reads return the same DataFrame as the full load."""
+        with SpreadsheetManager(workbook_path) as edit_manager:
+            expected = edit_manager.readRangeAsDataFrame("Data")
+        with SpreadsheetManager(workbook_path, mode="read") as read_manager:
+            actual = read_manager.readRangeAsDataFrame("Data")
+        
+        pd.testing.assert_frame_equal(actual, expected)
+        assert len(actual) == 4
+        assert actual.iloc[3]["Client"] == "Gamma"
+        assert actual.iloc[3]["Notes"] == "=C2*2"
+    
+    def test_read_mode_explicit_range(self, workbook_path):
+        """Coverage test: Explicit bounds are honoured without auto-detection."""
+        with SpreadsheetManager(workbook_path, mode="read") as manager:
+            df = manager.readRangeAsDataFrame("Data", start_row=1, end_row=3, start_col="A", end_col="C")
+        
+        assert list(df.columns) == ["Client", "Date", "Total"]
+        assert len(df) == 2
+        assert df.iloc[1]["Total"] == 250.5
+    
+    @pytest.mark.parametrize("mode", ["edit", "read"])
+    def test_read_selected_columns(self, workbook_path, mode):
+        """Coverage test: Only the requested column positions are materialized, in the given order."""
+        with SpreadsheetManager(workbook_path, mode=mode) as manager:
+            df = manager.readRangeAsDataFrame("Data", start_col="A", end_col="D", columns=[2, 0])
+            
+            assert list(df.columns) == ["Total", "Client"]
+            assert len(df) == 4
+            assert df.iloc[1]["Total"] == 250.5
+            
+            with pytest.raises(ValueError, match="outside the range"):
+                manager.readRangeAsDataFrame("Data", start_col="A", end_col="D", columns=[4])
+    
+    @pytest.mark.parametrize("manager_options", [{}, {"mode": "read"}, {"mode": "read", "engine": "fast"}])
+    def test_read_categorical_columns(self, workbook_path, manager_options):
+        """Coverage test: Columns named by header label or position come back as categoricals."""
+        with SpreadsheetManager(workbook_path, **manager_options) as manager:
+            df = manager.readRangeAsDataFrame("Data", categorical_columns=["Client", 3],
+                                              dtype={"Total": "float64"})
+            
+            assert isinstance(df["Client"].dtype, pd.CategoricalDtype)
+            assert list(df["Client"].cat.categories) == ["Alpha", "Beta", "Gamma"]
+            assert df["Client"].isna().sum() == 1
+            assert isinstance(df["Notes"].dtype, pd.CategoricalDtype)
+            assert "Notes" not in df["Notes"].cat.categories
+            assert df["Total"].dtype == "float64"
+            
+            with pytest.raises(ValueError, match="header row"):
+                manager.readRangeAsDataFrame("Data", categorical_columns=["Missing"])
+    
+    @pytest.mark.parametrize("manager_options", [{}, {"mode": "read"}, {"mode": "read", "engine": "fast"}])
+    def test_iter_range_chunks_matches_full_read(self, workbook_path, manager_options):
+        """Coverage test: Chunks carry the headers and concatenate to the full range."""
+        with SpreadsheetManager(workbook_path, **manager_options) as manager:
+            expected = manager.readRangeAsDataFrame("Data", dtype={"Total": "float64"})
+            chunks = list(manager.iter_range_chunks("Data", chunk_rows=3, dtype={"Total": "float64"}))
+            
+            assert [len(chunk) for chunk in chunks] == [3, 1]
+            assert all(list(chunk.columns) == ["Client", "Date", "Total", "Notes"] for chunk in chunks)
+            assert all(chunk["Total"].dtype == "float64" for chunk in chunks)
+            pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected)
+            
+            explicit_range = {"start_row": 2, "end_row": 8, "end_col": "C"}
+            explicit = list(manager.iter_range_chunks("Data", chunk_rows=2, **explicit_range))
+            assert all(len(chunk) <= 2 for chunk in explicit)
+            assert all(chunk.dtypes.tolist() == explicit[0].dtypes.tolist() for chunk in explicit)
+            pd.testing.assert_frame_equal(pd.concat(explicit, ignore_index=True),
+                                          manager.readRangeAsDataFrame("Data", **explicit_range))
+            
+            with pytest.raises(ValueError, match="chunk_rows"):
+                next(manager.iter_range_chunks("Data", chunk_rows=0))
+    
+    @pytest.mark.parametrize("manager_options", [{}, {"mode": "read"}, {"mode": "read", "engine": "fast"}])
+    def test_row_filter_keeps_matching_rows(self, workbook_path, manager_options):
+        """Coverage test: Rows outside the filter column's range are dropped while reading, headers kept."""
+        from datetime import date
+        from src.tool_experiments.row_filter import ColumnRange
+        
+        may = ColumnRange(1, date(2025, 5, 1), date(2025, 5, 31))
+        with SpreadsheetManager(workbook_path, **manager_options) as manager:
+            df = manager.readRangeAsDataFrame("Data", row_filter=may)
+            assert list(df.columns) == ["Client", "Date", "Total", "Notes"]
+            assert list(df["Client"]) == ["Alpha", "Beta"]
+            
+            at_least_100 = manager.readRangeAsDataFrame("Data", columns=[0], row_filter=ColumnRange(2, lower=100))
+            assert list(at_least_100["Client"]) == ["Alpha", "Beta"]
+            
+            late = manager.readRangeAsDataFrame("Data", row_filter=ColumnRange(1, date(2025, 5, 15), date(2025, 6, 30)))
+            assert list(late["Client"]) == ["Beta", "Gamma"]
+            assert list(late.index) == [1, 3]
+
+            chunks = list(manager.iter_range_chunks("Data", chunk_rows=1, row_filter=may))
+            pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), df)
+            
+            with pytest.raises(ValueError, match="Row filter"):
+                manager.readRangeAsDataFrame("Data", end_col="C", row_filter=ColumnRange(3, lower="a"))
+    
+    def test_read_mode_cell_access(self, workbook_path):
+        """Coverage test: Cell reads and empty-cell search work on read-only sheets."""
+        with SpreadsheetManager(workbook_path, mode="read") as manager:
+            assert manager.read_cell("Data", "A3") == "Beta"
+            assert manager.read_cell_coords("Data", row=2, col=3) == 100
+            assert manager.find_next_empty_cell_in_column("Data", "A", start_row=2) == 4
+            assert manager.find_next_empty_cell_in_column("Data", "D", start_row=2) == 3
+    
+    def test_read_mode_rejects_writes(self, workbook_path):
+        """Coverage test: Writing is refused when opened in read mode."""
+        with SpreadsheetManager(workbook_path, mode="read") as manager:
+            with pytest.raises(RuntimeError, match="read mode"):
+                manager.write_dataframe(pd.DataFrame({"A": [1]}), "Data")
+    
+    def test_invalid_mode(self, workbook_path):
+        """Coverage test: Unknown open modes are rejected."""
+        with pytest.raises(ValueError, match="Invalid mode"):
+            SpreadsheetManager(workbook_path, mode="append")
+
+
+class TestSpreadsheetManagerExtents:
+    """Test cases for end-row/end-column detection from the populated-cell index."""
+    
+    @pytest.fixture
+    def workbook_path(self, tmp_path):
+        """Create a sheet with a small data block and formatting over a long empty range."""
+        from openpyxl import Workbook
+        from openpyxl.styles import Font
+        
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = "Formatted"
+        sheet.append(["Client", "Total", None, "Notes"])
+        sheet.append(["Alpha", 100, None, "  "])
+        sheet.append(["Beta", 200])
+        for row in range(1, 5001):
+            sheet.cell(row=row, column=6).font = Font(bold=True)
+        path = tmp_path / "formatted.xlsx"
+        workbook.save(path)
+        return path
+    
+    @pytest.mark.primary
+    def test_auto_detection_ignores_formatted_empty_cells(self, workbook_path):
+        """Primary test: Auto-detected ranges stop at the last populated cell without creating cells."""
+        with SpreadsheetManager(workbook_path) as manager:
+            sheet = manager.workbook["Formatted"]
+            stored_cells = len(sheet._cells)
+            
+            df = manager.readRangeAsDataFrame("Formatted")
+            
+            assert list(df.columns) == ["Client", "Total", None, "Notes"]
+            assert len(df) == 2
+            assert manager.find_next_empty_cell_in_column("Formatted", "A") == 4
+            assert manager.find_next_empty_cell_in_column("Formatted", "D", start_row=2) == 2
+            assert manager._find_last_non_empty_row(sheet, "F") == 1
+            assert len(sheet._cells) <= stored_cells + 3 * 4
+    
+    def test_next_empty_cell_finds_gaps_within_populated_rows(self, workbook_path):
+        """Coverage test: Gaps above a column's last value are found, and rows past it are empty."""
+        with SpreadsheetManager(workbook_path) as manager:
+            manager.write_dataframe(pd.DataFrame({"Client": ["Delta"]}), "Formatted", "A6", include_headers=False)
+            sheet = manager.workbook["Formatted"]
+            
+            assert manager.find_next_empty_cell_in_column("Formatted", "A", start_row=2) == 4
+            assert manager.find_next_empty_cell_in_column("Formatted", "A", start_row=6) == 7
+            assert manager.find_next_empty_cell_in_column("Formatted", "B", start_row=4000) == 4000
+            assert manager.find_next_empty_cell_in_column("Formatted", "C") == 1
+            assert manager.find_next_empty_cell_in_column("Formatted", "F", start_row=6000) == 5001
+            assert manager._get_sheet_extents(sheet).last_row_by_column == {1: 6, 2: 3, 4: 1}
+    
+    def test_extents_without_openpyxl_cell_dict(self, tmp_path):
+        """Coverage test: Sheets without openpyxl's cell dict are indexed through iter_rows with the same result."""
+        from types import SimpleNamespace
+        from openpyxl import Workbook
+        
+        path = tmp_path / "plain.xlsx"
+        workbook = Workbook()
+        workbook.active.append(["Client", None, "Notes"])
+        workbook.active.append(["Alpha", 100])
+        workbook.active.append([None, None, "late note"])
+        workbook.save(path)
+        with SpreadsheetManager(path) as manager:
+            sheet = manager.workbook.active
+            public_sheet = SimpleNamespace(title=sheet.title, max_row=sheet.max_row, iter_rows=sheet.iter_rows)
+            
+            assert manager._build_sheet_extents(public_sheet) == manager._build_sheet_extents(sheet)
+            assert manager._build_sheet_extents(public_sheet).last_column_by_row == {1: 3, 2: 2, 3: 3}
+    
+    def test_write_refreshes_extents(self, workbook_path):
+        """Coverage test: Writing a DataFrame refreshes the index used for detection."""
+        with SpreadsheetManager(workbook_path) as manager:
+            assert manager.find_next_empty_cell_in_column("Formatted", "A") == 4
+            manager.write_dataframe(pd.DataFrame({"Client": ["Gamma"]}), "Formatted", "A4", include_headers=False)
+            
+            assert manager.find_next_empty_cell_in_column("Formatted", "A") == 5
+            assert len(manager.readRangeAsDataFrame("Formatted")) == 3
+
+
+class TestSpreadsheetManagerBatchWrite:
+    """Test cases for batched, deferred-save DataFrame writes."""
+    
+    @pytest.fixture
+    def workbook_path(self, tmp_path):
+        """Create an empty workbook with two sheets."""
+        path = tmp_path / "batch.xlsx"
+        with SpreadsheetManager.CreateNew(path, "First") as manager:
+            manager.workbook.create_sheet("Second")
+            manager._save_workbook()
+        return path
+    
+    @pytest.mark.primary
+    def test_batch_saves_once(self, workbook_path, monkeypatch):
+        """Primary test: Several writes inside a batch are saved together when it exits."""
+        frames = [pd.DataFrame({"Name": [f"row {index}"], "Value": [index]}) for index in range(3)]
+        with SpreadsheetManager(workbook_path) as manager:
+            saves = []
+            original_save = manager.workbook.save
+            monkeypatch.setattr(manager.workbook, "save", lambda path: (saves.append(path), original_save(path)))
+            
+            with manager.batch():
+                manager.write_dataframe(frames[0], "First")
+                manager.write_dataframe(frames[1], "First", start_cell="A3", include_headers=False)
+                manager.write_dataframe(frames[2], "Second", start_cell="C5")
+                assert saves == []
+            
+            assert len(saves) == 1
+        
+        with SpreadsheetManager(workbook_path, mode="read") as manager:
+            first = manager.readRangeAsDataFrame("First")
+            assert list(first["Name"]) == ["row 0", "row 1"]
+            assert manager.read_cell("Second", "C5") == "Name"
+            assert manager.read_cell("Second", "D6") == 2
+    
+    def test_batch_discards_save_on_error(self, workbook_path):
+        """Coverage test: A batch that raises does not save its writes."""
+        with SpreadsheetManager(workbook_path) as manager:
+            with pytest.raises(RuntimeError):
+                with manager.batch():
+                    manager.write_dataframe(pd.DataFrame({"Name": ["lost"]}), "First")
+                    raise RuntimeError("abort")
+        
+        with SpreadsheetManager(workbook_path, mode="read") as manager:
+            assert manager.read_cell("First", "A1") is None
+    
+    def test_overwrite_inside_existing_data(self, workbook_path):
+        """Coverage test: Writes above the last row overwrite cells in place, including with None."""
+        with SpreadsheetManager(workbook_path) as manager:
+            manager.write_dataframe(pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]}), "First")
+            manager.write_dataframe(pd.DataFrame({"B": [None]}), "First", start_cell="B3", include_headers=False)
+            
+            assert manager.read_cell("First", "B3") is None
+            assert manager.read_cell("First", "B4") == 6
+            assert manager.find_next_empty_cell_in_column("First", "A") == 5
+    
+    def test_writes_below_a_gap_and_into_empty_sheets(self, workbook_path):
+        """Coverage test: Rows appended after the first land below it, past a gap or on an empty sheet."""
+        frame = pd.DataFrame({"Name": ["x", "y"], "Value": [1, 2]})
+        with SpreadsheetManager(workbook_path) as manager:
+            manager.write_dataframe(frame, "First")
+            manager.write_dataframe(frame, "First", start_cell="B6", include_headers=False)
+            manager.write_dataframe(frame, "Second", start_cell="C4")
+            
+            assert [manager.read_cell("First", cell) for cell in ("A3", "B6", "C6", "B7", "C7")] == ["y", "x", 1, "y", 2]
+            assert manager.read_cell("First", "B4") is None
+            assert [manager.read_cell("Second", cell) for cell in ("C4", "C5", "D6")] == ["Name", "x", 2]
+            assert manager.read_cell("Second", "C1") is None
+
+
+class TestSpreadsheetManagerStreamingExport:
+    """Test cases for the write-only chunked DataFrame exporter."""
+    
+    @pytest.mark.primary
+    def test_export_chunks_round_trip(self, tmp_path):
+        """Primary test: Chunks are written in order under one header row and read back intact."""
+        def chunks():
+            for start in range(0, 300, 100):
+                yield pd.DataFrame({
+                    "Id": range(start, start + 100),
+                    "Name": [f"Client {index}" for index in range(start, start + 100)],
+                })
+        path = tmp_path / "export.xlsx"
+        
+        rows_written = SpreadsheetManager.export_dataframe_chunks(path, chunks(), sheet_name="Export")
+        
+        assert rows_written == 300
+        with SpreadsheetManager(path, mode="read") as manager:
+            df = manager.readRangeAsDataFrame("Export")
+        assert list(df.columns) == ["Id", "Name"]
+        assert len(df) == 300
+        assert df.iloc[250]["Name"] == "Client 250"
+    
+    def test_export_missing_values_and_single_frame(self, tmp_path):
+        """Coverage test: NaN and NaT become empty cells, and a single DataFrame is accepted."""
+        import numpy as np
+        
+        path = tmp_path / "single.xlsx"
+        df = pd.DataFrame({"Total": [1.5, np.nan], "When": [pd.Timestamp("2025-05-01"), pd.NaT], "Key": ["a", "b"]})
+        
+        SpreadsheetManager.export_dataframe_chunks(path, df, include_headers=False)
+        
+        with SpreadsheetManager(path, mode="read") as manager:
+            assert manager.read_cell("Sheet1", "A1") == 1.5
+            assert manager.read_cell("Sheet1", "A2") is None
+            assert manager.read_cell("Sheet1", "B2") is None
+            assert manager.read_cell("Sheet1", "C2") == "b"
+    
+    def test_export_rejects_mismatched_chunks(self, tmp_path):
+        """Coverage test: Chunks with different columns are rejected."""
+        chunks = [pd.DataFrame({"A": [1]}), pd.DataFrame({"B": [2]})]
+        with pytest.raises(ValueError, match="do not match"):
+            SpreadsheetManager.export_dataframe_chunks(tmp_path / "bad.xlsx", chunks)
+
+
+class TestSpreadsheetManagerParallelRead:
+    """Test cases for parsing several sheets in worker processes."""
+    
+    @pytest.fixture
+    def workbook_path(self, tmp_path):
+        """Create a workbook with three data sheets."""
+        from openpyxl import Workbook
+        
+        workbook = Workbook()
+        workbook.remove(workbook.active)
+        for sheet_index in range(3):
+            sheet = workbook.create_sheet(f"Sheet{sheet_index + 1}")
+            sheet.append(["Key", "Value", "Label"])
+            for row in range(50):
+                sheet.append([f"k{row}", row * (sheet_index + 1), f"s{sheet_index}"])
+        path = tmp_path / "parallel.xlsx"
+        workbook.save(path)
+        return path
+    
+    @pytest.mark.primary
+    def test_parallel_read_matches_sequential(self, workbook_path):
+        """Primary test: Sheets parsed in worker processes equal in-process reads, in request order."""
+        sheet_names = ["Sheet3", "Sheet1", "Sheet2"]
+        with SpreadsheetManager(workbook_path, mode="read") as manager:
+            expected = {name: manager.readRangeAsDataFrame(name) for name in sheet_names}
+            actual = manager.read_sheets_parallel(sheet_names, max_workers=3)
+        
+        assert list(actual) == sheet_names
+        for name in sheet_names:
+            pd.testing.assert_frame_equal(actual[name], expected[name])
+    
+    def test_parallel_read_per_sheet_options(self, workbook_path):
+        """Coverage test: Shared and per-sheet range options are combined."""
+        with SpreadsheetManager(workbook_path) as manager:
+            frames = manager.read_sheets_parallel(
+                {"Sheet1": {"columns": [1]}, "Sheet2": None}, max_workers=2, end_col="C"
+            )
+        
+        assert list(frames["Sheet1"].columns) == ["Value"]
+        assert list(frames["Sheet2"].columns) == ["Key", "Value", "Label"]
+        assert frames["Sheet2"].iloc[-1]["Value"] == 98
+    
+    def test_parallel_read_uses_cache(self, workbook_path, tmp_path):
+        """Coverage test: Cached sheets are not sent to workers and misses are stored."""
+        from src.tool_experiments.sheet_cache import SheetCache
+        
+        cache = SheetCache(tmp_path / ".cache")
+        with SpreadsheetManager(workbook_path, mode="read", cache=cache) as manager:
+            manager.read_sheets_parallel(["Sheet1", "Sheet2"], max_workers=2)
+            range_key = manager._range_key()
+        
+        assert cache.get(workbook_path, "Sheet1", range_key) is not None
+        assert cache.get(workbook_path, "Sheet2", range_key) is not None
+    
+    def test_parallel_read_unknown_sheet(self, workbook_path):
+        """Coverage test: Unknown sheets are rejected before any worker starts."""
+        with SpreadsheetManager(workbook_path, mode="read") as manager:
+            with pytest.raises(KeyError, match="Missing"):
+                manager.read_sheets_parallel(["Sheet1", "Missing"], max_workers=2)
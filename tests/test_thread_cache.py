@@ -0,0 +1,177 @@
+# tests/test_thread_cache.py
+import pytest
+import time
+from pathlib import Path
+from src.tool_experiments.chat_thread import ChatThread, Message
+from src.tool_experiments.chat_thread_loader import EmailChatThreadLoader
+from src.tool_experiments.thread_cache import ThreadCache
+from tests.test_chat_thread_loader import _write_teams_eml, _thread_snapshot
+
+
+def _thread(subject: str) -> ChatThread:
+    """Build a small thread with one message and one attachment."""
+    thread = ChatThread(subject=subject, date="Wed, 9 Jul 2025", thread_topic=subject, message_id="<1@example.com>")
+    thread.add_message(Message(participant="Jane Citizen", timestamp="unknown", content="Signed", attachments=["a1"]))
+    thread.add_attachment("a1", {"filename": "a.png", "content_type": "image/png", "size": 10})
+    return thread
+
+
+class TestThreadCache:
+    """Test cases for ThreadCache class."""
+    
+    @pytest.fixture
+    def eml_path(self, tmp_path):
+        """Create a Teams thread email to cache."""
+        return _write_teams_eml(tmp_path / "thread.eml", "Win", [("Jane Citizen", 2, "Signed [cid:image001.png@01DB]")])
+    
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create a ThreadCache in a temporary directory."""
+        return ThreadCache(tmp_path / ".cache")
+    
+    # ============================================================================
+    # PRIMARY TESTS - Core Functional Behavior
+    # ============================================================================
+    
+    @pytest.mark.primary
+    def test_unchanged_file_is_served_without_parsing(self, eml_path, cache, monkeypatch):
+        """Primary test: A second loader returns the cached thread without invoking the email parser."""
+        expected = EmailChatThreadLoader(cache=cache).load_thread(eml_path)
+        
+        def fail_parse(*args, **kwargs):
+            raise AssertionError("email should not be parsed on a cache hit")
+        
+        loader = EmailChatThreadLoader(cache=cache)
+        monkeypatch.setattr(loader, "_parse_email_file", fail_parse)
+        monkeypatch.setattr(loader, "_extract_messages", fail_parse)
+        
+        assert _thread_snapshot(loader.load_thread(eml_path)) == _thread_snapshot(expected)
+        assert loader.load_thread(eml_path).to_markdown() == expected.to_markdown()
+    
+    @pytest.mark.primary
+    def test_changed_file_is_a_miss(self, eml_path, cache):
+        """Primary test: Entries are keyed by file contents, so edited files are parsed again."""
+        cache.put(eml_path, 1, _thread("Win"))
+        assert cache.get(eml_path, 1) is not None
+        
+        _write_teams_eml(eml_path, "Win again", [("Jane Citizen", 2, "Re-signed")])
+        
+        assert cache.get(eml_path, 1) is None
+        assert EmailChatThreadLoader(cache=cache).load_thread(eml_path).get_metadata()['subject'] == "Win again"
+    
+    # ============================================================================
+    # COVERAGE TESTS - Invalidation & Eviction
+    # ============================================================================
+    
+    def test_identical_contents_share_an_entry(self, eml_path, cache, tmp_path):
+        """Coverage test: A copy of a cached file elsewhere is a hit."""
+        cache.put(eml_path, 1, _thread("Win"))
+        copy_path = tmp_path / "copy.eml"
+        copy_path.write_bytes(eml_path.read_bytes())
+        
+        assert _thread_snapshot(cache.get(copy_path, 1)) == _thread_snapshot(_thread("Win"))
+    
+    def test_concurrent_writers_of_identical_contents(self, eml_path, cache, tmp_path, monkeypatch):
+        """Coverage test: Writers storing the same entry at once use their own temporary files, and a lost move is not an error."""
+        copy_path = tmp_path / "copy.eml"
+        copy_path.write_bytes(eml_path.read_bytes())
+        original_replace = Path.replace
+        
+        def replace_after_other_writer(self, target):
+            monkeypatch.setattr(Path, "replace", original_replace)
+            ThreadCache(cache.cache_dir).put(copy_path, 1, _thread("Win"))
+            return original_replace(self, target)
+        
+        monkeypatch.setattr(Path, "replace", replace_after_other_writer)
+        cache.put(eml_path, 1, _thread("Win"))
+        
+        def lose_replace(self, target):
+            raise PermissionError(f"{target} is in use")
+        
+        monkeypatch.setattr(Path, "replace", lose_replace)
+        cache.put(copy_path, 1, _thread("Win"))
+        
+        assert _thread_snapshot(cache.get(eml_path, 1)) == _thread_snapshot(_thread("Win"))
+        assert [path.suffix for path in cache.cache_dir.iterdir()] == [ThreadCache.ENTRY_SUFFIX]
+    
+    def test_parser_version_bump_evicts_old_entries(self, eml_path, cache, tmp_path):
+        """Coverage test: Storing an entry for a new parser version removes entries of other versions."""
+        other_path = tmp_path / "other.eml"
+        other_path.write_bytes(eml_path.read_bytes() + b"\n")
+        cache.put(eml_path, 1, _thread("Win"))
+        cache.put(other_path, 1, _thread("Other"))
+        assert cache.get(eml_path, 2) is None
+        
+        cache.put(eml_path, 2, _thread("Win"))
+        
+        assert cache.get(other_path, 1) is None
+        assert cache.get(eml_path, 2) is not None
+        assert cache.invalidate() == 1
+        assert cache.total_bytes() == 0
+    
+    def test_unreadable_entry_is_a_miss(self, eml_path, cache):
+        """Coverage test: A corrupt entry is discarded instead of raising."""
+        cache.put(eml_path, 1, _thread("Win"))
+        entry = cache._entries()[0]
+        entry.write_text("{not json", encoding='utf-8')
+        
+        assert cache.get(eml_path, 1) is None
+        assert not entry.exists()
+    
+    def test_puts_do_not_rescan_the_cache_directory(self, tmp_path, monkeypatch):
+        """Coverage test: Filling a cache lists its directory once, keeping a running total for eviction."""
+        cache = ThreadCache(tmp_path / ".cache")
+        paths = []
+        for index in range(20):
+            paths.append(tmp_path / f"{index}.eml")
+            paths[-1].write_text(f"Subject: {index}\n")
+        original_glob = Path.glob
+        globs = []
+        
+        def counting_glob(self, pattern):
+            globs.append(pattern)
+            return original_glob(self, pattern)
+        
+        monkeypatch.setattr(Path, "glob", counting_glob)
+        for path in paths:
+            cache.put(path, 1, _thread(path.stem))
+        cache.put(paths[0], 1, _thread("again"))
+        
+        assert len(globs) == 2
+        assert cache._total_bytes == cache.total_bytes()
+    
+    def test_rejected_file_is_not_parsed_again(self, tmp_path, cache, monkeypatch):
+        """Coverage test: A file the parser rejects raises its recorded error from the cache on the next load."""
+        plain_path = tmp_path / "plain.eml"
+        plain_path.write_text("Subject: Lunch\n\nNo chat here.\n")
+        with pytest.raises(ValueError, match="No Teams content"):
+            EmailChatThreadLoader(cache=cache).load_thread(plain_path)
+        
+        def fail_parse(*args, **kwargs):
+            raise AssertionError("rejected email should not be parsed again")
+        
+        loader = EmailChatThreadLoader(cache=cache)
+        monkeypatch.setattr(loader, "_parse_thread", fail_parse)
+        with pytest.raises(ValueError, match="No Teams content"):
+            loader.load_thread(plain_path)
+        assert cache.get(plain_path, EmailChatThreadLoader.PARSER_VERSION + 1) is None
+    
+    def test_lru_eviction_by_total_bytes(self, tmp_path):
+        """Coverage test: The least recently used entry is evicted when over the size cap."""
+        cache = ThreadCache(tmp_path / ".cache", max_bytes=10**9)
+        paths = []
+        for index in range(3):
+            paths.append(tmp_path / f"{index}.eml")
+            paths[-1].write_text(f"Subject: {index}\n")
+        cache.put(paths[0], 1, _thread("first"))
+        time.sleep(0.01)
+        cache.put(paths[1], 1, _thread("second"))
+        time.sleep(0.01)
+        assert cache.get(paths[0], 1) is not None
+        
+        cache.max_bytes = cache.total_bytes() - 1
+        time.sleep(0.01)
+        cache.put(paths[2], 1, _thread("third"))
+        
+        assert cache.get(paths[1], 1) is None
+        assert cache.get(paths[2], 1) is not None
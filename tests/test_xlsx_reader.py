@@ -0,0 +1,146 @@
+# tests/test_xlsx_reader.py
+import pytest
+import zipfile
+from pathlib import Path
+from datetime import datetime, date, time, timedelta
+from openpyxl import Workbook
+from openpyxl.cell.rich_text import CellRichText, TextBlock
+from openpyxl.cell.text import InlineFont
+from src.tool_experiments.spreadsheet_manager import SpreadsheetManager
+from src.tool_experiments.row_filter import ColumnRange
+from src.tool_experiments.xlsx_reader import XlsxSheetReader
+import pandas as pd
+
+
+def _read_with(path: Path, **kwargs) -> dict:
+    """Read the same range with the openpyxl edit path and the fast engine."""
+    with SpreadsheetManager(path) as manager:
+        expected = manager.readRangeAsDataFrame(**kwargs)
+    with SpreadsheetManager(path, mode="read", engine="fast") as manager:
+        actual = manager.readRangeAsDataFrame(**kwargs)
+    return {'expected': expected, 'actual': actual}
+
+
+class TestXlsxSheetReader:
+    """Test cases for the XML reader engine."""
+    
+    @pytest.fixture
+    def workbook_path(self, tmp_path):
+        """Create a workbook mixing every value type the reader converts."""
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = "Mixed"
+        sheet.append(["Name", "When", "Amount", "Flag", "Formula", "Sparse", "Clock"])
+        sheet.append(["a", datetime(2025, 1, 2, 3, 4, 5), 1, True, "=C2*2", None, time(10, 30)])
+        sheet.append([None, date(2024, 2, 29), 2.5, False, "=SUM(C2:C3)", None, None])
+        sheet.append(["  ", None, -3, None, None, None, None])
+        sheet.append(["c", datetime(1999, 12, 31), 1e20, None, None, None, timedelta(hours=30)])
+        sheet["F6"] = "only F"
+        sheet["A9"] = CellRichText("rich ", TextBlock(InlineFont(b=True), "text"))
+        other = workbook.create_sheet("Other")
+        other.append(["Key"])
+        other.append(["value"])
+        path = tmp_path / "mixed.xlsx"
+        workbook.save(path)
+        return path
+    
+    # ============================================================================
+    # PRIMARY TESTS - Core Functional Behavior
+    # ============================================================================
+    
+    @pytest.mark.primary
+    @pytest.mark.parametrize("range_options", [
+        {},
+        {"end_row": 5},
+        {"start_row": 2, "end_col": "D"},
+        {"end_col": "G", "columns": [2, 0]},
+        {"start_row": 10},
+        {"end_row": 12, "end_col": "C"},
+        {"row_filter": ColumnRange(1, date(2000, 1, 1), date(2025, 12, 31))},
+        {"end_row": 12, "end_col": "E", "row_filter": ColumnRange(2, lower=0)},
+    ])
+    def test_fast_engine_matches_openpyxl(self, workbook_path, range_options):
+        """Primary test: The fast engine returns the same DataFrame as the openpyxl path."""
+        frames = _read_with(workbook_path, sheet_name="Mixed", **range_options)
+        pd.testing.assert_frame_equal(frames['actual'], frames['expected'])
+    
+    @pytest.mark.primary
+    def test_shared_formulas_are_translated(self, workbook_path, tmp_path):
+        """Primary test: Dependent cells of a shared formula get the translated formula text."""
+        patched = tmp_path / "shared.xlsx"
+        with zipfile.ZipFile(workbook_path) as source, zipfile.ZipFile(patched, "w") as target:
+            for item in source.infolist():
+                data = source.read(item.filename)
+                if item.filename == "xl/worksheets/sheet1.xml":
+                    data = data.replace(b"<f>C2*2</f>", b'<f t="shared" ref="E2:E3" si="0">C2*2</f>')
+                    data = data.replace(b"<f>SUM(C2:C3)</f>", b'<f t="shared" si="0"/>')
+                target.writestr(item, data)
+        
+        frames = _read_with(patched, sheet_name="Mixed", end_col="E")
+        pd.testing.assert_frame_equal(frames['actual'], frames['expected'])
+        assert frames['actual'].iloc[1]["Formula"] == "=C3*2"
+
+    @pytest.mark.primary
+    @pytest.mark.parametrize("categorical_columns", [["Name"], ["Name", "Amount", "Formula"], [1, 5]])
+    def test_categorical_columns_match_openpyxl(self, workbook_path, categorical_columns):
+        """Primary test: Categoricals built from shared string codes equal pandas' own conversion."""
+        frames = _read_with(workbook_path, sheet_name="Mixed", end_col="G", categorical_columns=categorical_columns)
+        pd.testing.assert_frame_equal(frames['actual'], frames['expected'])
+    
+    @pytest.mark.primary
+    def test_inline_strings_match_openpyxl(self, tmp_path):
+        """Primary test: Inline strings from write-only workbooks read the same on both paths."""
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("Inline")
+        sheet.append(["Name", "Note"])
+        sheet.append(["  padded  ", "line\nbreak"])
+        sheet.append(["", "x"])
+        sheet.append(["last", None])
+        path = tmp_path / "inline.xlsx"
+        workbook.save(path)
+
+        frames = _read_with(path, sheet_name="Inline")
+        pd.testing.assert_frame_equal(frames['actual'], frames['expected'])
+        assert frames['actual'].iloc[0]["Name"] == "  padded  "
+
+    # ============================================================================
+    # COVERAGE TESTS - Workbook Metadata & Errors
+    # ============================================================================
+    
+    def test_sheet_names_and_rows(self, workbook_path):
+        """Coverage test: Sheet discovery and single-row reads."""
+        reader = XlsxSheetReader(workbook_path)
+        try:
+            assert reader.sheet_names == ["Mixed", "Other"]
+            assert reader.read_row("Other", 2) == ["value"]
+            assert reader.read_row("Mixed", 6) == [None, None, None, None, None, "only F"]
+            assert reader.read_row("Mixed", 20) == []
+            assert list(reader.iter_rows("Mixed", 5, 11, 5, 6)) == [(None, None), (None, "only F")] + [(None, None)] * 5
+        finally:
+            reader.close()
+    
+    def test_sheet_signatures_track_sheet_changes(self, workbook_path):
+        """Coverage test: Only the signature of an edited sheet changes when the workbook is saved again."""
+        with SpreadsheetManager(workbook_path, mode="read") as manager:
+            before = manager.get_sheet_signatures()
+        
+        with SpreadsheetManager(workbook_path) as manager:
+            manager.write_dataframe(pd.DataFrame({"Amount": [7]}), "Mixed", start_cell="C20")
+        after = SpreadsheetManager(workbook_path, mode="read").get_sheet_signatures()
+        
+        assert list(before) == ["Mixed", "Other"]
+        assert after["Other"] == before["Other"]
+        assert after["Mixed"] != before["Mixed"]
+    
+    def test_missing_sheet(self, workbook_path):
+        """Coverage test: Unknown sheets raise KeyError like openpyxl."""
+        with SpreadsheetManager(workbook_path, mode="read", engine="fast") as manager:
+            with pytest.raises(KeyError):
+                manager.readRangeAsDataFrame("Missing")
+    
+    def test_fast_engine_requires_read_mode(self, workbook_path):
+        """Coverage test: The fast engine cannot be combined with edit mode."""
+        with pytest.raises(ValueError, match="mode='read'"):
+            SpreadsheetManager(workbook_path, engine="fast")
+        with pytest.raises(ValueError, match="Invalid engine"):
+            SpreadsheetManager(workbook_path, mode="read", engine="lxml")